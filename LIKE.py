@@ -1,8 +1,18 @@
 # %%
 # Bibliotheken importieren: pandas für Datenverarbeitung, OS/Datum für Dateinamen
+import numpy as np
 import pandas as pd
 import os
-from datetime import datetime
+from dataclasses import dataclass
+from pathlib import Path
+
+from loader import parse_duration_seconds, parse_percent
+# Most Difficult Learning Objectives (Top-N gesamt und je Modul, blockweises Einlesen)
+from mdlo import DEFAULT_TOP_N, top_mdlo, top_mdlo_by_module
+# Erwartete Kategorien (auch für die Vorab-Prüfung in schema.py)
+from schema import ORDER_ACC, ORDER_SA
+# LIKE_STAGES / AnalysisCancelled liegen in stages.py (ohne pandas, für den GUI-Start)
+from stages import LIKE_STAGES, AnalysisCancelled  # noqa: F401
 
 # # %% [markdown]
 # # # Import
@@ -33,27 +43,267 @@ from datetime import datetime
 #     encoding="utf-8",
 # )
 
+# Prozentuale Verteilung einer Spalte je Modul in einem einzigen gruppierten Durchlauf.
+# Liefert dieselbe Tabelle wie die frühere Schleife über alle Module
+# (Filter + value_counts je Modul): Anteile in % (2 Nachkommastellen) bezogen auf alle
+# nicht-leeren Werte des Moduls, Spalten in der Reihenfolge von `order`.
+# Module ohne Einträge erhalten 0; Spalten, deren Wert in keinem Modul vorkommt,
+# bleiben wie bisher ganzzahlig 0.
+def distribution_by_module(df, column, modules, order):
+    counts = (
+        df.groupby(["Module", column], observed=True, sort=False)
+        .size()
+        .unstack(fill_value=0)
+    )
+    return distribution_from_counts(counts, modules, order)
+
+
+# Wie distribution_by_module, aber aus bereits gezählten Werten
+# (Index = Modul, Spalten = Werte, Zellen = Anzahl)
+def distribution_from_counts(counts, modules, order):
+    # Nenner: alle nicht-leeren Werte je Modul (auch Werte außerhalb von `order`)
+    totals = counts.sum(axis=1)
+    percentages = (counts.div(totals, axis=0) * 100).round(2)
+
+    counts = counts.reindex(index=modules, fill_value=0)
+    percentages = percentages.reindex(index=modules, fill_value=0.0)
+
+    result = pd.DataFrame({"Module": list(modules)})
+    for value in order:
+        if value in counts.columns and counts[value].sum() > 0:
+            result[value] = percentages[value].fillna(0.0).to_numpy()
+        else:
+            result[value] = 0
+    return result
+
+
+# Learner, die jedes in df vorkommende Modul (mindestens einmal) haben.
+# Vektorisiert über ganzzahlige Codes statt einem Python-set je Learner: ein Learner hat
+# alle Module genau dann, wenn seine Anzahl verschiedener Module der Gesamtzahl entspricht.
+# Reihenfolge wie groupby("Learner") (sortiert), Learner ohne Namen (NaN) zählen nicht.
+def completed_learners_of(df) -> pd.Index:
+    learner_codes, learners = pd.factorize(df["Learner"], sort=True)
+    module_codes, modules = pd.factorize(df["Module"], use_na_sentinel=False)
+    n_modules = len(modules)
+
+    valid = learner_codes >= 0
+    learner_codes = learner_codes[valid].astype(np.int64)
+    module_codes = module_codes[valid].astype(np.int64)
+
+    # eindeutige (Learner, Modul)-Paare -> Anzahl verschiedener Module je Learner
+    pairs = np.unique(learner_codes * max(n_modules, 1) + module_codes)
+    distinct_modules = np.bincount(pairs // max(n_modules, 1), minlength=len(learners))
+
+    return pd.Index(np.asarray(learners)[distinct_modules == n_modules], name="Learner")
+
+
+# Kohorte für Selbsteinschätzung (und MCP, sofern der Export eine Learner-Spalte hat):
+# "all" = ganzer Export (bisheriges Verhalten), "completed" = nur die Learner, die in der
+# Large Table alle Module abgeschlossen haben -> dieselbe Kohorte wie in allen anderen Abschnitten
+COHORTS = ("all", "completed")
+DEFAULT_COHORT = "all"
+
+
+# Hash-Index über Learner-Namen für den Semi-Join der übrigen Exporte auf die Kohorte.
+# Einmal je Auswertung aufgebaut und für alle Exporte wiederverwendet; bei kategorialen
+# Spalten (loader.py) wird je Kategorie statt je Zeile nachgeschlagen
+class LearnerSet:
+    def __init__(self, learners):
+        self.index = pd.Index(pd.unique(np.asarray(learners, dtype=object)), name="Learner")
+        # Hash-Tabelle sofort aufbauen (pandas legt sie sonst beim ersten Nachschlagen an)
+        self.index.get_indexer(self.index[:1])
+
+    def __len__(self):
+        return len(self.index)
+
+    # Bool-Maske: Learner der Zeile ist in der Kohorte (fehlende Namen nie)
+    def contains(self, values) -> np.ndarray:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            hit = np.append(self.index.get_indexer(values.cat.categories) >= 0, False)
+            return hit[values.cat.codes.to_numpy()]
+        return self.index.get_indexer(values) >= 0
+
+
+# Semi-Join: nur Zeilen von Learnern der Kohorte. Ohne Kohorte (cohort="all") oder ohne
+# Learner-Spalte (z.B. der aggregierte MCP-Export) bleibt der Export unverändert
+def restrict_to_cohort(df, learners: LearnerSet | None):
+    if learners is None or "Learner" not in df.columns:
+        return df
+    return df[learners.contains(df["Learner"])]
+
+
+def check_cohort(cohort: str):
+    if cohort not in COHORTS:
+        raise ValueError(f"Unbekannte Kohorte: {cohort} (erlaubt: {', '.join(COHORTS)})")
+
+
+COMPETENCE_COLUMNS = [
+    "Unconscious Incompetent",
+    "Conscious Incompetent",
+    "Unconscious Competent",
+    "Conscious Competent",
+]
+
+
+# Summary Order -> >69% / <=69% - >50% / <= 50%
+def add_accuracy_summary(df_acc_of_self_assessment):
+    df_acc_of_self_assessment[">69%"] = round(
+        df_acc_of_self_assessment["firm knowledge"]
+        + df_acc_of_self_assessment["competent; training voluntary - no immediate need"],
+        2,
+    )
+    df_acc_of_self_assessment["<=69% - >50%"] = round(
+        df_acc_of_self_assessment["profits from re-training / webinar"], 2
+    )
+    df_acc_of_self_assessment["<= 50%"] = round(
+        df_acc_of_self_assessment["hands-on classroom training needed"], 2
+    )
+    return df_acc_of_self_assessment
+
+
+# Zusammenfassung: Professional (Proficient+Expert), Competent, Beginner (Novice+Advanced beginner)
+def add_self_assessment_summary(df_self_assessment):
+    df_self_assessment["Professional"] = round(
+        df_self_assessment["Proficient"] + df_self_assessment["Expert"], 2
+    )
+    df_self_assessment["Competent 2"] = round(df_self_assessment["Competent"], 2)
+    df_self_assessment["Beginner"] = round(
+        df_self_assessment["Novice"] + df_self_assessment["Advanced beginner"], 2
+    )
+    return df_self_assessment
+
+
+# Zusammenfassung: Incompetent = UI + CI, Competent = UC + CC
+def add_competence_summary(df_competence_by_module):
+    df_competence_by_module["Incompetent"] = round(
+        df_competence_by_module["Unconscious Incompetent"]
+        + df_competence_by_module["Conscious Incompetent"],
+        2,
+    )
+    df_competence_by_module["Competent"] = round(
+        df_competence_by_module["Unconscious Competent"]
+        + df_competence_by_module["Conscious Competent"],
+        2,
+    )
+    return df_competence_by_module
+
+
+# Selbsteinschätzung je Modul (Prozentuale Verteilung je Stufe + Zusammenfassung)
+def self_assessment_by_module(df_self_assessment, modules) -> pd.DataFrame:
+    return add_self_assessment_summary(distribution_by_module(
+        df_self_assessment, "Self Assessment", modules, ORDER_SA
+    ))
+
+
+# Metacognition Progress: Werte der ersten Zeile des MCP-Exports in Prozent. Ohne Zeile
+# (z.B. kein Learner der Kohorte im Export) bleiben die Werte leer (NaN)
+def metacognition_progress(df_mcp) -> pd.DataFrame:
+    if df_mcp.empty:
+        df_mcp = df_mcp.reindex([0])
+
+    # teils auch negativ Werte dabei (= reduction)
+    def convert(value):
+        return int(abs(value) * 100) if pd.notna(value) else float("nan")
+
+
+    # Initial Consciousness
+    # = Consciousness
+    cc = convert(df_mcp["Initial Conscious Competence"].iloc[0])
+    uc = convert(df_mcp["Initial Unconscious Competence"].iloc[0])
+    ci = convert(df_mcp["Initial Conscious Incompetence"].iloc[0])
+    ui = convert(df_mcp["Initial Unconscious Incompetence"].iloc[0])
+
+    # Improvement Conscious Competence
+    # = Knowledge increase (Metacognition Progress)
+    icc = df_mcp["Improvement Conscious Competence"].iloc[0]
+    icc = convert(icc)
+
+    # Improvement Unconscious Incompetence
+    # = Reduction Unconscious Incompetence
+    iui = df_mcp["Improvement Unconscious Incompetence"].iloc[0]
+    iui = convert(iui)
+
+    metacognition_progress_labels = [
+        "Initial Unconscious Incompetence (UI)",
+        "Initial Conscious Incompetence (CI)",
+        "Initial Unconscious Competence (UC)",
+        "Initial Conscious Competence (CC)",
+        "Knowledge increase (Metacognition Progress)",
+        "Reduction Unconscious Incompetence",
+    ]
+    metacognition_progress_values = [ui, ci, uc, cc, icc, iui]
+
+    return pd.DataFrame(
+        {
+            "Description": metacognition_progress_labels,
+            "Value": metacognition_progress_values,
+        }
+    )
+
+
+# Ergebnis der Auswertung: numerische Tabellen je Abschnitt (Prozentwerte als Zahlen
+# 0-100, Zeiten in Sekunden). Formatierung und Export übernimmt exporters.py.
+@dataclass
+class LikeResult:
+    amount_of_learners: int
+    time_seconds: pd.DataFrame
+    avg_acc: pd.DataFrame
+    mcp: pd.DataFrame
+    acc_of_self_assessment: pd.DataFrame
+    self_assessment: pd.DataFrame
+    competence_by_module: pd.DataFrame
+    mdlo: pd.DataFrame
+    # Top-N je Modul (None bei älteren Ergebnissen, z.B. aus dem Ergebnisspeicher)
+    mdlo_by_module: pd.DataFrame | None = None
+    # N der Top-N (Blattname im Export; None bei älteren Ergebnissen)
+    mdlo_top: int | None = None
+
+
 # # %% [markdown]
 # # # Transform Large Table
 
 # # %%
 # # Wir wollen nur die Learner haben die alle Module abgeschlossen haben
-def like(df_large_table, df_mcp, df_self_assessment, df_mdlo):
+# Reine Berechnung ohne Dateizugriff oder Arbeitsverzeichnis -> auch parallel nutzbar.
+# progress: optionaler Callback, wird zu Beginn jedes Abschnitts (LIKE_STAGES) aufgerufen
+# und darf AnalysisCancelled werfen.
+# profile: optionales profiling.RunProfile, misst jeden Abschnitt (Zeit, Speicher, Zeilen).
+# engine="arrow" wertet die Large Table mit pyarrow aus (siehe arrow_engine.py)
+# mdlo_top: Anzahl der Most Difficult Learning Objectives (gesamt und je Modul)
+# cohort: "completed" wertet Selbsteinschätzung (und MCP mit Learner-Spalte) nur für die
+# abgeschlossenen Learner aus, "all" (Standard) wie bisher den ganzen Export (siehe COHORTS)
+def compute_like(df_large_table, df_mcp, df_self_assessment, df_mdlo, progress=None,
+                 profile=None, engine="pandas", mdlo_top=DEFAULT_TOP_N,
+                 cohort=DEFAULT_COHORT) -> LikeResult:
+    check_cohort(cohort)
+    if engine == "arrow":
+        from arrow_engine import compute_like_arrow
+
+        return compute_like_arrow(df_large_table, df_mcp, df_self_assessment, df_mdlo,
+                                  progress=progress, profile=profile, mdlo_top=mdlo_top,
+                                  cohort=cohort)
+    if engine != "pandas":
+        raise ValueError(f"Unbekannte Engine: {engine} (erlaubt: pandas, arrow)")
+
+    report = progress if progress is not None else (lambda stage: None)
+    rows = (lambda n: None) if profile is None else profile.set_rows
+    if profile is not None:
+        report = profile.track(report)
+
+    report("Abgeschlossene Learner")
+    rows(len(df_large_table))
     # "Completion Status" ist "Completed"
     df_large_table = df_large_table[
         df_large_table["Completion Status"] == "COMPLETED"
     ].copy()
-    # Namen der Module
-    modules_names = set(df_large_table["Module"].unique())
-    # Liste welcher Learner hat welche Module abgeschlossen
-    modules_per_learner = df_large_table.groupby("Learner")["Module"].apply(set)
     # Liste mit Namen der Learner die alle Module abgeschlossen haben
-    completed_learners = modules_per_learner[modules_per_learner ==
-                                            modules_names].index
+    completed_learners = completed_learners_of(df_large_table)
     df_large_table = df_large_table[df_large_table["Learner"].isin(
         completed_learners)]
+    cohort_learners = LearnerSet(completed_learners) if cohort == "completed" else None
 
     # Large Table enthält Spalten die als Strings interpretiert werden -> Typen Umwandlung
+    # (bereits über loader.py typisierte Spalten bleiben unverändert)
     columns_with_percent_values = [
         "Accuracy",
         "Unconscious Incompetent",
@@ -63,11 +313,7 @@ def like(df_large_table, df_mcp, df_self_assessment, df_mdlo):
     ]
 
     for col in columns_with_percent_values:
-        df_large_table[col] = (
-            df_large_table[col].astype(str).str.replace(
-                "%", "", regex=False).str.strip()
-        )
-        df_large_table[col] = pd.to_numeric(df_large_table[col], errors="coerce")
+        df_large_table[col] = parse_percent(df_large_table[col])
     df_large_table
 
     # %% [markdown]
@@ -79,64 +325,46 @@ def like(df_large_table, df_mcp, df_self_assessment, df_mdlo):
     # %%
     amount_of_learners = len(completed_learners)
 
-    df_amount_of_learners = pd.DataFrame(
-        {
-            "Description": ["Amount Of Participants Who Completed All Modules"],
-            "Value": [amount_of_learners],
-        }
-    )
-    df_amount_of_learners
-
     # %% [markdown]
     # # Time To Complete
 
     # %%
-    # Hilfsfunktion: timedelta in hh mm umwandeln
-    def td_to_hm(td):
-        total_minutes = int(td.total_seconds() // 60)
-        h = total_minutes // 60
-        m = total_minutes % 60
-        return f"{h}h {m}m"
-
-
-    df_large_table["Sum Time Spent"] = pd.to_timedelta(
+    report("Time To Complete")
+    rows(len(df_large_table))
+    # Zeiten in ganzen Sekunden (loader.py liefert sie bereits so);
+    # Umwandlung in "Xh Ym" erfolgt beim Export
+    df_large_table["Sum Time Spent"] = parse_duration_seconds(
         df_large_table["Sum Time Spent"])
 
+    # Summe je Learner, dann Mittel/Min/Max/Summe je Klasse in einem Durchlauf
+    time_per_learner = df_large_table.groupby(
+        ["Class Description", "Learner"], observed=True)["Sum Time Spent"].sum()
+
     df_time = (
-        df_large_table.groupby(["Class Description", "Learner"])["Sum Time Spent"]
-        .sum()
+        time_per_learner.groupby(level="Class Description", observed=True)
+        .agg(["mean", "min", "max", "sum"])
+        .rename(columns={
+            "mean": "Average Time Needed To Complete All Modules",
+            "min": "Min. Time Needed To Complete All Modules",
+            "max": "Max. Time Needed To Complete All Modules",
+            "sum": "Total Time Needed To Complete All Modules",
+        })
         .reset_index()
     )
-
-    results = []
-    for class_desc, group in df_time.groupby("Class Description"):
-        mean_time = td_to_hm(group["Sum Time Spent"].mean())
-        min_time = td_to_hm(group["Sum Time Spent"].min())
-        max_time = td_to_hm(group["Sum Time Spent"].max())
-        sum_time = td_to_hm(group["Sum Time Spent"].sum())
-        results.append(
-            {
-                "Class Description": class_desc,
-                "Average Time Needed To Complete All Modules": mean_time,
-                "Min. Time Needed To Complete All Modules": min_time,
-                "Max. Time Needed To Complete All Modules": max_time,
-                "Total Time Needed To Complete All Modules": sum_time,
-            }
-        )
-
-    df_time = pd.DataFrame(results)
     df_time
 
     # %% [markdown]
     # # Average Accuracy (All Modules)
 
     # %%
+    report("Average Accuracy")
+    rows(len(df_large_table))
     df_large_table["Accuracy"] = pd.to_numeric(
         df_large_table["Accuracy"], errors="coerce")
 
     # calculate mean per class
     accuracy_by_class = (
-        df_large_table.groupby("Class Description")["Accuracy"]
+        df_large_table.groupby("Class Description", observed=True)["Accuracy"]
         .mean()
         .round(2)
         .reset_index()
@@ -156,244 +384,92 @@ def like(df_large_table, df_mcp, df_self_assessment, df_mdlo):
     # # Metacognition Progress
 
     # %%
-    # teils auch negativ Werte dabei (= reduction)
-    def convert(value):
-        return int(abs(value) * 100)
-
-
-    # Initial Consciousness
-    # = Consciousness
-    cc = convert(df_mcp["Initial Conscious Competence"].iloc[0])
-    uc = convert(df_mcp["Initial Unconscious Competence"].iloc[0])
-    ci = convert(df_mcp["Initial Conscious Incompetence"].iloc[0])
-    ui = convert(df_mcp["Initial Unconscious Incompetence"].iloc[0])
-
-    # Improvement Conscious Competence
-    # = Knowledge increase (Metacognition Progress)
-    icc = df_mcp["Improvement Conscious Competence"].iloc[0]
-    icc = convert(icc)
-
-    # Improvement Unconscious Incompetence
-    # = Reduction Unconscious Incompetence
-    iui = df_mcp["Improvement Unconscious Incompetence"].iloc[0]
-    iui = convert(iui)
-
-    metacognition_progress_labels = [
-        "Initial Unconscious Incompetence (UI)",
-        "Initial Conscious Incompetence (CI)",
-        "Initial Unconscious Competence (UC)",
-        "Initial Conscious Competence (CC)",
-        "Knowledge increase (Metacognition Progress)",
-        "Reduction Unconscious Incompetence",
-    ]
-    metacognition_progress_values = [ui, ci, uc, cc, icc, iui]
-
-    df_mcp = pd.DataFrame(
-        {
-            "Description": metacognition_progress_labels,
-            "Value": metacognition_progress_values,
-        }
-    )
+    report("Metacognition Progress")
+    rows(len(df_mcp))
+    df_mcp = metacognition_progress(restrict_to_cohort(df_mcp, cohort_learners))
     df_mcp
 
     # %% [markdown]
     # # Accuracy Of Self-Assessment
 
     # %%
-    order_acc = [
-        "firm knowledge",
-        "competent; training voluntary - no immediate need",
-        "profits from re-training / webinar",
-        "hands-on classroom training needed",
-    ]
-
-    acc_of_self_assessment = []
-
+    report("Accuracy Of Self-Assessment")
+    rows(len(df_large_table))
     modules = sorted(df_large_table["Module"].unique())
 
-    for module in modules:
-        subset = df_large_table[df_large_table["Module"] == module]
-        percentages_acc = (
-            subset["Accuracy-Classes"].value_counts(normalize=True) * 100
-        ).round(2)
-        row = {"Module": module}
-        for value in order_acc:
-            row[value] = percentages_acc.get(value, 0)
-        acc_of_self_assessment.append(row)
-
-    df_acc_of_self_assessment = pd.DataFrame(acc_of_self_assessment)
-
-    # Summary Order ->
-    df_acc_of_self_assessment[">69%"] = round(
-        df_acc_of_self_assessment["firm knowledge"]
-        + df_acc_of_self_assessment["competent; training voluntary - no immediate need"],
-        2,
-    )
-    df_acc_of_self_assessment["<=69% - >50%"] = round(
-        df_acc_of_self_assessment["profits from re-training / webinar"], 2
-    )
-    df_acc_of_self_assessment["<= 50%"] = round(
-        df_acc_of_self_assessment["hands-on classroom training needed"], 2
-    )
+    df_acc_of_self_assessment = add_accuracy_summary(distribution_by_module(
+        df_large_table, "Accuracy-Classes", modules, ORDER_ACC
+    ))
     df_acc_of_self_assessment
 
     # %% [markdown]
     # # Self-evaluation
 
     # %%
+    report("Self-evaluation")
+    rows(len(df_self_assessment))
     # Selbsteinschätzung je Modul: Häufigkeiten (in %) berechnen und zusammenfassen
-    order_sa = ["Novice", "Advanced beginner", "Competent", "Proficient", "Expert"]
-
-    self_assessment = []
-
-    modules = sorted(df_large_table["Module"].unique())
-
-    for module in modules:
-        subset = df_self_assessment[df_self_assessment["Module"] == module]
-        # Prozentuale Verteilung je Selbsteinschätzungsstufe
-        percentages_sa = (
-            subset["Self Assessment"].value_counts(normalize=True) * 100
-        ).round(2)
-        row = {"Module": module}
-        for value in order_sa:
-            row[value] = percentages_sa.get(value, 0)
-        self_assessment.append(row)
-
-    df_self_assessment = pd.DataFrame(self_assessment)
-
-    # Zusammenfassung: Professional (Proficient+Expert), Competent, Beginner (Novice+Advanced beginner)
-    df_self_assessment["Professional"] = round(
-        df_self_assessment["Proficient"] + df_self_assessment["Expert"], 2
-    )
-    df_self_assessment["Competent 2"] = round(df_self_assessment["Competent"], 2)
-    df_self_assessment["Beginner"] = round(
-        df_self_assessment["Novice"] + df_self_assessment["Advanced beginner"], 2
-    )
+    # (bei cohort="completed" nur über die Zeilen der abgeschlossenen Learner)
+    df_self_assessment = self_assessment_by_module(
+        restrict_to_cohort(df_self_assessment, cohort_learners), modules)
     df_self_assessment
 
     # %% [markdown]
     # # Competence Level
 
     # %%
+    report("Competence Level")
+    rows(len(df_large_table))
     # Kompetenzniveau je Modul aggregieren und in Summen-Kategorien zusammenfassen
-    competence_columns = [
-        "Unconscious Incompetent",
-        "Conscious Incompetent",
-        "Unconscious Competent",
-        "Conscious Competent",
-    ]
-
     # Mittelwerte der Kompetenzstufen je Modul berechnen
-    df_competence_by_module = (
-        df_large_table.groupby("Module")[
-            competence_columns].mean().round(2).reset_index()
+    df_competence_by_module = add_competence_summary(
+        df_large_table.groupby("Module", observed=True)[
+            COMPETENCE_COLUMNS].mean().round(2).reset_index()
         )
-
-    # Zusammenfassung: Incompetent = UI + CI, Competent = UC + CC
-    df_competence_by_module["Incompetent"] = round(
-        df_competence_by_module["Unconscious Incompetent"]
-        + df_competence_by_module["Conscious Incompetent"],
-        2,
-    )
-    df_competence_by_module["Competent"] = round(
-        df_competence_by_module["Unconscious Competent"]
-        + df_competence_by_module["Conscious Competent"],
-        2,
-    )
     df_competence_by_module
 
     # %% [markdown]
-    # # Top 5 Most Difficult Learning Objectives
+    # # Top-N Most Difficult Learning Objectives (N = mdlo_top)
 
     # %%
-    df_mdlo = df_mdlo.head(5)
-    # wir wollen nach UI sortieren -> Grudlage zur Bewertung der Learning Objectives
-    df_mdlo = df_mdlo.sort_values(by="Unconsciously Incompetent", ascending=False)
-    df_mdlo = df_mdlo.drop(columns=["Open in Curator"])
+    report("Most Difficult Learning Objectives")
+    rows(len(df_mdlo))
+    df_mdlo_by_module = top_mdlo_by_module(df_mdlo, mdlo_top)
+    df_mdlo = top_mdlo(df_mdlo, mdlo_top)
     df_mdlo
 
-    # %% [markdown]
-    # # Format
-
-    # %%
-    # Für eine einzelne Spalte:
-    df_avg_acc["Average Accuracy (all modules)"] = (
-        df_avg_acc["Average Accuracy (all modules)"].astype(
-            str).str.replace(".", ",") + "%"
+    if profile is not None:
+        profile.stop()
+
+    return LikeResult(
+        amount_of_learners=amount_of_learners,
+        time_seconds=df_time,
+        avg_acc=df_avg_acc,
+        mcp=df_mcp,
+        acc_of_self_assessment=df_acc_of_self_assessment,
+        self_assessment=df_self_assessment,
+        competence_by_module=df_competence_by_module,
+        mdlo=df_mdlo,
+        mdlo_by_module=df_mdlo_by_module,
+        mdlo_top=mdlo_top,
     )
 
-    df_mcp["Value"] = df_mcp["Value"].astype(str).str.replace(".", ",") + "%"
 
-    # Für alle relevanten Spalten (außer "Module") im DataFrame:
-    for col in df_acc_of_self_assessment.columns:
-        if col == "Module":
-            continue
-        df_acc_of_self_assessment[col] = (
-            df_acc_of_self_assessment[col].astype(str).str.replace(".", ",") + "%"
-        )
-
-    for col in df_self_assessment.columns:
-        if col == "Module":
-            continue
-        df_self_assessment[col] = (
-            df_self_assessment[col].astype(str).str.replace(".", ",") + "%"
-        )
-
-    for col in df_competence_by_module.columns:
-        if col == "Module":
-            continue
-        df_competence_by_module[col] = (
-            df_competence_by_module[col].astype(str).str.replace(".", ",") + "%"
-        )
-
-    # %% [markdown]
-    # # Export In .xlsx
-
-    # %%
-    # Export der Ergebnisse in eine Excel-Datei mit heutigem Datum
-    from openpyxl import load_workbook
-    today_str = datetime.now().strftime("%Y%m%d")
-    filename = f"{today_str}_Like_Auswertung.xlsx"
-    # Schreibe mehrere DataFrames auf separate Tabellenblätter
-    with pd.ExcelWriter(filename) as writer:
-        # Teilnehmer (abgeschlossen)
-        df_amount_of_learners.to_excel(
-            writer, sheet_name="Participants Completed", index=False
-        )
-        # Benötigte Zeit je Einheit
-        df_time.to_excel(writer, sheet_name="Time Needed", index=False)
-        # Durchschnittliche Genauigkeit
-        df_avg_acc.to_excel(writer, sheet_name="Avg Accuracy", index=False)
-        # Metakognition-Fortschritt
-        df_mcp.to_excel(writer, sheet_name="Metacognition Progress", index=False)
-        # Genauigkeit pro Modul (Selbsteinschätzung)
-        df_acc_of_self_assessment.to_excel(
-            writer, sheet_name="Accuracy Per Module", index=False
-        )
-        # Selbsteinschätzung pro Modul
-        df_self_assessment.to_excel(
-            writer, sheet_name="Self Assessment Per Module", index=False
-        )
-        # Kompetenzniveau pro Modul
-        df_competence_by_module.to_excel(
-            writer, sheet_name="Competence Level Per Module", index=False
-        )
-        # Schwierigste Lernziele
-        df_mdlo.to_excel(
-            writer, sheet_name="5 Most Dfficult Objectives", index=False)
-
-    # Spaltenbreiten in allen Tabellenblättern automatisch anpassen
-    wb = load_workbook(filename)
-    for sheet in wb.sheetnames:
-        ws = wb[sheet]
-        for col in ws.columns:
-            max_length = 0
-            column = col[0].column_letter
-            for cell in col:
-                try:
-                    if cell.value is not None:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            ws.column_dimensions[column].width = max(max_length + 2, 10)
-    wb.save(filename)
\ No newline at end of file
+# Auswertung + Excel-Export wie bisher: schreibt {heute}_Like_Auswertung.xlsx nach
+# output_dir (Standard: aktuelles Arbeitsverzeichnis) und gibt den Pfad zurück.
+# numeric=True schreibt Zahlen mit Excel-Formaten statt Texten (siehe exporters.export_xlsx).
+# Mit profile werden alle Abschnitte gemessen und als Blatt "Run Stats" mitgeschrieben
+def like(df_large_table, df_mcp, df_self_assessment, df_mdlo, progress=None, output_dir=None,
+         numeric=False, profile=None, engine="pandas", mdlo_top=DEFAULT_TOP_N,
+         cohort=DEFAULT_COHORT):
+    from exporters import default_filename, export_xlsx, versioned_path
+
+    report = progress if progress is not None else (lambda stage: None)
+    result = compute_like(
+        df_large_table, df_mcp, df_self_assessment, df_mdlo, progress=report, profile=profile,
+        engine=engine, mdlo_top=mdlo_top, cohort=cohort)
+
+    path = versioned_path(Path(output_dir or os.getcwd()) / default_filename())
+    export_xlsx(result, path, progress=report, numeric=numeric, profile=profile,
+                stats_sheet=profile is not None)
+    return path
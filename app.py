@@ -1,26 +1,48 @@
-# Import der erforderlichen Module für CSV-Verarbeitung, Dateisystem, GUI und Datenanalyse
-import csv
+# Import der erforderlichen Module für Dateisystem und GUI. Der Analyse-Stack (pandas,
+# LIKE, openpyxl, pptx) wird erst nach dem Anzeigen des Fensters im Hintergrund bzw.
+# spätestens beim Start einer Analyse geladen -> Fenster erscheint sofort.
+import time
+
+_T_START = time.perf_counter()
+
+import importlib
+import json
 import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+from contextlib import nullcontext
 from pathlib import Path
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
 from tkinterdnd2 import DND_FILES, TkinterDnD
-import pandas as pd
 
-from LIKE import like
+from stages import LIKE_STAGES, AnalysisCancelled
+from profiling import RunProfile
+from schema import validate_inputs, format_issues
+from result_store import ResultStore
+from csv_types import classify_paths, expand_csv_paths
 
-# Normalisiert den Pfad aus Drag & Drop Daten
+# Schritte eines Laufs: Ergebnisspeicher + 4 Dateien laden + Abschnitte von like() + Learner-Index
+RUN_STEPS = 6 + len(LIKE_STAGES)
+POLL_INTERVAL_MS = 100
 
+# Module, die nach dem ersten Zeichnen des Fensters im Hintergrund vorgeladen werden
+# (fehlende optionale Pakete werden übersprungen)
+WARMUP_MODULES = ["pandas", "loader", "LIKE", "exporters", "cache", "openpyxl",
+                  "learner_index", "pptx_report", "pptx"]
+WARMUP_DELAY_MS = 200
 
-def _normalize_dnd_path(data: str) -> str:
-    data = data.strip()
-    if data.startswith("{") and "} {" in data:
-        first = data.split("} {", 1)[0].lstrip("{")
-        return first
-    if data.startswith("{") and data.endswith("}"):
-        return data[1:-1]
-    return data
+# Diese Module dürfen vor dem ersten Fenster nicht geladen sein (siehe --startup-probe)
+HEAVY_MODULES = ["pandas", "numpy", "openpyxl", "pptx", "pyarrow"]
+
+# Zerlegt die Drag & Drop Daten in einzelne Pfade
+# (mehrere Dateien/Ordner als Tcl-Liste, Pfade mit Leerzeichen in {…})
+def _split_dnd_paths(data: str) -> list[str]:
+    return [braced or plain for braced, plain in re.findall(r"\{([^}]*)\}|(\S+)", data)]
 
 
 # Überprüft, ob der Pfad eine CSV-Datei ist
@@ -36,67 +58,14 @@ def _default_output_dir() -> Path:
     return outdir
 
 
-# Liest den Header einer CSV-Datei und gibt ihn als Set zurück
-def read_csv_header(path: str) -> set[str]:
-    with open(path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.reader(f, delimiter=";")
-        header = next(reader)
-    return {h.strip().lower() for h in header if h and h.strip()}
-
-
-# Signaturen (aus .csv Headern)
-SIG_LARGE = {
-    "completion status", "sum time spent", "accuracy-classes",
-    "unconscious incompetent", "conscious incompetent",
-    "unconscious competent", "conscious competent",
-}
-
-SIG_MCP = {
-    "initial conscious competence", "initial unconscious competence",
-    "improvement conscious competence", "improvement unconscious incompetence",
-    "current conscious competence", "current unconscious competence",
-}
-
-SIG_SELF = {
-    "self assessment", "average progress", "time", "correct", "wrong", "accuracy",
-}
-
-SIG_MDLO = {
-    "learning objective", "unconsciously incompetent", "wrong answers", "open in curator",
-}
-
-
-# Erkennt den CSV-Typ basierend auf dem Header
-def detect_csv_type_by_header(path: str) -> tuple[str | None, str]:
-    cols = read_csv_header(path)
-
-    # Large Table
-    if {"learner", "module", "completion status"}.issubset(cols) and len(SIG_LARGE & cols) >= 4:
-        return "large", "Header-Signatur: Large Table"
-
-    # MCP
-    if {"class name", "progress"}.issubset(cols) and len(SIG_MCP & cols) >= 4:
-        return "mcp", "Header-Signatur: Metacognition Progress"
-
-    # Self Assessment
-    if {"learner", "module", "self assessment"}.issubset(cols) and len(SIG_SELF & cols) >= 4:
-        return "self", "Header-Signatur: Self-Assessment"
-
-    # MDLO
-    if {"module", "learning objective"}.issubset(cols) and len(SIG_MDLO & cols) >= 3:
-        return "mdlo", "Header-Signatur: MDLO"
-
-    return None, f"Unbekannter CSV-Header. Gefundene Spalten (Auszug): {', '.join(sorted(list(cols))[:8])}..."
-
-
 # Hauptklasse der Anwendung
 class LikeApp(TkinterDnD.Tk):
-    def __init__(self):
+    def __init__(self, warmup: bool = True):
         super().__init__()
 
         self.title("LIKE Datenanalyse Tool")
-        self.geometry("900x520")
-        self.minsize(900, 520)
+        self.geometry("900x620")
+        self.minsize(900, 620)
 
         # Datei-Pfade
         self.paths = {
@@ -110,9 +79,56 @@ class LikeApp(TkinterDnD.Tk):
         self.output_dir = _default_output_dir()
         self.last_output_file = None
 
+        # Cache für bereits eingelesene Exporte (wird beim ersten Zugriff angelegt)
+        self._cache = None
+        # Fertige Auswertungen je Eingabedateien -> Wiederholung ohne Neuberechnung
+        self.results = ResultStore()
+
+        # Hintergrund-Lauf: Worker-Thread meldet Fortschritt über eine Queue
+        self._worker = None
+        self._queue = queue.Queue()
+        self._cancel_event = threading.Event()
+
+        # Erkennung abgelegter Dateien läuft ebenfalls im Hintergrund
+        self._drop_queue = queue.Queue()
+        self._classifying = False
+
+        # PowerPoint-Vorlage, wird beim ersten PowerPoint-Export geladen
+        self._pptx_template = None
+
+        # Learner-Index für die Suche (einmal je Lauf aufgebaut, siehe learner_index.py);
+        # _index_key = Pfade + Änderungszeiten der Large Table und des Self-Assessments
+        self.learner_index = None
+        self._index_key = None
+        self._index_lock = threading.Lock()
+        self._search_window = None
+
         self._build_ui()
         self._refresh_state()
 
+        if warmup:
+            self.after(WARMUP_DELAY_MS, self._start_warmup)
+
+    # Lädt den Analyse-Stack im Hintergrund vor, während das Fenster schon bedienbar ist.
+    # Ein Analyse-Start vor dem Ende wartet einfach am Import-Lock des jeweiligen Moduls.
+    def _start_warmup(self):
+        def warmup():
+            for name in WARMUP_MODULES:
+                try:
+                    importlib.import_module(name)
+                except ImportError:
+                    pass
+
+        threading.Thread(target=warmup, daemon=True).start()
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from cache import ParquetCache
+
+            self._cache = ParquetCache()
+        return self._cache
+
     # Baut die Benutzeroberfläche auf
     def _build_ui(self):
         pad = {"padx": 12, "pady": 8}
@@ -199,6 +215,56 @@ class LikeApp(TkinterDnD.Tk):
         )
         self.btn_change_output.grid(row=0, column=1, sticky="e")
 
+        # Excel mit echten Zahlen (Prozent-/Zeitformate) statt Texten
+        self.numeric_export = tk.BooleanVar(value=False)
+        self.chk_numeric = ttk.Checkbutton(
+            outfrm,
+            text="Excel mit Zahlenformaten (statt Text, z.B. zum Weiterrechnen)",
+            variable=self.numeric_export,
+        )
+        self.chk_numeric.grid(row=1, column=0, sticky="w", pady=(6, 0))
+
+        # PowerPoint-Bericht aus Vorlage.pptx (Teilnehmerzahl optional)
+        pptfrm = ttk.Frame(outfrm)
+        pptfrm.grid(row=2, column=0, columnspan=2, sticky="w", pady=(6, 0))
+        self.pptx_export = tk.BooleanVar(value=False)
+        self.chk_pptx = ttk.Checkbutton(
+            pptfrm, text="PowerPoint-Bericht erstellen", variable=self.pptx_export)
+        self.chk_pptx.pack(side="left")
+        ttk.Label(pptfrm, text="Eingeschriebene Teilnehmer (optional):").pack(
+            side="left", padx=(16, 4))
+        self.enrolled = tk.StringVar(value="")
+        self.entry_enrolled = ttk.Entry(pptfrm, textvariable=self.enrolled, width=8)
+        self.entry_enrolled.pack(side="left")
+
+        # Laufzeitprofil: Blatt "Run Stats" in der Excel-Datei und JSON-Log daneben
+        self.profile_run = tk.BooleanVar(value=False)
+        self.chk_profile = ttk.Checkbutton(
+            outfrm,
+            text="Laufzeitprofil aufzeichnen (Zeit, Speicher, Zeilen je Abschnitt)",
+            variable=self.profile_run,
+        )
+        self.chk_profile.grid(row=3, column=0, sticky="w", pady=(6, 0))
+
+        # Selbsteinschätzung nur für die Learner, die alle Module abgeschlossen haben
+        # (dieselbe Kohorte wie die übrigen Abschnitte; sonst wie bisher der ganze Export)
+        self.completed_cohort = tk.BooleanVar(value=False)
+        self.chk_cohort = ttk.Checkbutton(
+            outfrm,
+            text="Selbsteinschätzung nur für Learner mit allen Modulen abgeschlossen",
+            variable=self.completed_cohort,
+        )
+        self.chk_cohort.grid(row=4, column=0, sticky="w", pady=(6, 0))
+
+        # Land für den Verlauf (history.py); leer = Kennzahlen nicht speichern
+        histfrm = ttk.Frame(outfrm)
+        histfrm.grid(row=5, column=0, columnspan=2, sticky="w", pady=(6, 0))
+        ttk.Label(histfrm, text="Land für den Verlauf (leer = nicht speichern):").pack(
+            side="left", padx=(0, 4))
+        self.country = tk.StringVar(value="")
+        self.entry_country = ttk.Entry(histfrm, textvariable=self.country, width=12)
+        self.entry_country.pack(side="left")
+
         # Actions
         actions = ttk.Frame(self)
         actions.pack(fill="x", padx=12, pady=10)
@@ -212,10 +278,29 @@ class LikeApp(TkinterDnD.Tk):
         )
         self.btn_open_folder.pack(side="left", padx=(10, 0))
 
+        self.btn_cancel = ttk.Button(
+            actions, text="Abbrechen", command=self._cancel, state="disabled"
+        )
+        self.btn_cancel.pack(side="left", padx=(10, 0))
+
+        self.btn_learners = ttk.Button(
+            actions, text="Learner suchen…", command=self._open_learner_search, state="disabled"
+        )
+        self.btn_learners.pack(side="left", padx=(10, 0))
+
         self.btn_reset = ttk.Button(
             actions, text="Neustart", command=self._reset)
         self.btn_reset.pack(side="right")
 
+        self.btn_clear_cache = ttk.Button(
+            actions, text="Cache leeren", command=self._clear_cache)
+        self.btn_clear_cache.pack(side="right", padx=(0, 10))
+
+        # Fortschritt
+        self.progress = ttk.Progressbar(
+            self, mode="determinate", maximum=RUN_STEPS)
+        self.progress.pack(fill="x", padx=12, pady=(0, 6))
+
         # Status
         self.status = tk.StringVar(value="Bereit.")
         self.status_label = ttk.Label(self, textvariable=self.status)
@@ -246,49 +331,97 @@ class LikeApp(TkinterDnD.Tk):
 
         return {"var": var, "lbl": lbl_path, "btn": btn, "btn_clear": btn_clear}
 
-    # Behandelt das Ablegen von Dateien per Drag & Drop
+    # Behandelt das Ablegen von Dateien per Drag & Drop (mehrere Dateien oder ganze Ordner).
+    # Die Header werden parallel im Hintergrund gelesen, damit die UI nicht hängt.
     def _on_drop(self, event):
-        path = _normalize_dnd_path(event.data)
-
-        if not path or not os.path.isfile(path):
-            messagebox.showerror(
-                "Ungültig", "Bitte eine gültige Datei ablegen.")
+        if self._worker is not None or self._classifying:
             return
-        if not _is_csv(path):
+        dropped = _split_dnd_paths(event.data)
+        if not dropped:
             messagebox.showerror(
-                "Falsches Format", "Bitte eine CSV-Datei ablegen.")
+                "Ungültig", "Bitte eine gültige Datei ablegen.")
             return
 
+        self._classifying = True
+        self.status.set("Dateien werden erkannt…")
+        threading.Thread(
+            target=self._classify_worker, args=(dropped,), daemon=True).start()
+        self.after(POLL_INTERVAL_MS, self._poll_drop_queue)
+
+    # Liest Ordner und Header im Hintergrund (keine Tk-Aufrufe!)
+    def _classify_worker(self, dropped: list[str]):
         try:
-            key, reason = detect_csv_type_by_header(path)
+            paths = expand_csv_paths(dropped)
+            invalid = [p for p in paths if not os.path.isfile(p) or not _is_csv(p)]
+            valid = [p for p in paths if p not in invalid]
+            self._drop_queue.put((classify_paths(valid), invalid))
         except Exception as e:
-            messagebox.showerror(
-                "Fehler", f"Konnte CSV-Header nicht lesen:\n{e}")
-            return
+            self._drop_queue.put((e, []))
 
-        if key is None:
+    # Wartet auf das Ergebnis der Erkennung (Tk-Hauptthread)
+    def _poll_drop_queue(self):
+        try:
+            results, invalid = self._drop_queue.get_nowait()
+        except queue.Empty:
+            self.after(POLL_INTERVAL_MS, self._poll_drop_queue)
+            return
+        self._classifying = False
+        if isinstance(results, Exception):
+            self.status.set("Fehler aufgetreten.")
             messagebox.showerror(
-                "Unbekannte CSV",
-                "Die Datei konnte keinem Typ zugeordnet werden.\n"
-                "Bitte prüfe, ob es eine der vier Exportdateien ist.\n\n"
-                f"Datei: {Path(path).name}\n{reason}"
-            )
+                "Fehler", f"Abgelegte Dateien konnten nicht gelesen werden:\n{results}")
             return
-
-        if self.paths[key] is not None:
+        self._assign_classified(results, invalid)
+
+    # Ordnet erkannte Dateien den Feldern zu und meldet Probleme gesammelt
+    def _assign_classified(self, results: dict, invalid: list[str]):
+        problems = [f"{Path(p).name}: keine CSV-Datei" for p in invalid]
+        found = {}
+        for path, outcome in results.items():
+            if isinstance(outcome, Exception):
+                problems.append(f"{Path(path).name}: Konnte CSV-Header nicht lesen ({outcome})")
+                continue
+            key, reason = outcome
+            if key is None:
+                problems.append(f"{Path(path).name}: {reason}")
+            elif key in found:
+                problems.append(
+                    f"{Path(path).name}: {key.upper()} bereits durch {Path(found[key][0]).name} belegt")
+            else:
+                found[key] = (path, reason)
+
+        # Bereits gesetzte Felder nur nach Rückfrage überschreiben (eine Frage für alle)
+        replaced = [k for k in found if self.paths[k] is not None and self.paths[k] != found[k][0]]
+        if replaced:
             overwrite = messagebox.askyesno(
                 "Datei bereits gesetzt",
-                f"{key.upper()} ist bereits gesetzt.\n\n"
-                f"Neue Datei: {Path(path).name}\n"
-                f"Erkennung: {reason}\n\n"
-                "Überschreiben?"
+                "Folgende Felder sind bereits gesetzt:\n\n"
+                + "\n".join(f"{k.upper()}: {Path(found[k][0]).name}" for k in replaced)
+                + "\n\nÜberschreiben?"
             )
             if not overwrite:
-                return
+                for k in replaced:
+                    del found[k]
 
-        self._set_file(key, path)
-        self.status.set(
-            f"Zugeordnet zu {key.upper()} – {Path(path).name} ({reason})")
+        for key, (path, _) in found.items():
+            self._set_file(key, path)
+
+        if problems:
+            messagebox.showerror(
+                "Unbekannte CSV",
+                "Nicht alle Dateien konnten zugeordnet werden.\n"
+                "Bitte prüfe, ob es die vier Exportdateien sind.\n\n"
+                + "\n".join(problems)
+            )
+        if len(found) == 1:
+            key, (path, reason) = next(iter(found.items()))
+            self.status.set(
+                f"Zugeordnet zu {key.upper()} – {Path(path).name} ({reason})")
+        elif found:
+            self.status.set(
+                "Zugeordnet: " + ", ".join(f"{k.upper()} – {Path(p).name}" for k, (p, _) in found.items()))
+        else:
+            self.status.set("Keine Datei zugeordnet.")
 
     # Öffnet einen Dateidialog zur Auswahl einer CSV-Datei
     def _choose_file(self, key: str):
@@ -323,6 +456,19 @@ class LikeApp(TkinterDnD.Tk):
             messagebox.showerror(
                 "Fehler", f"Ordner konnte nicht geöffnet werden:\n{e}")
 
+    # Löscht den Cache der eingelesenen Exporte
+    def _clear_cache(self):
+        size_mb = (self.cache.size() + self.results.size()) / 1024 / 1024
+        try:
+            # eingelesene Exporte und gespeicherte Auswertungen
+            removed = self.cache.clear() + self.results.clear()
+        except Exception as e:
+            messagebox.showerror(
+                "Fehler", f"Cache konnte nicht geleert werden:\n{e}")
+            return
+        self.status.set(
+            f"Cache geleert ({removed} Einträge, {size_mb:.1f} MB).")
+
     # ----- State -----
     # Setzt den Pfad für einen bestimmten Dateityp
     def _set_file(self, key: str, path: str):
@@ -356,6 +502,8 @@ class LikeApp(TkinterDnD.Tk):
     def _refresh_state(self):
         self.btn_run.config(
             state=("normal" if self._mandatory_ready() else "disabled"))
+        self.btn_learners.config(
+            state=("normal" if self.paths["large"] else "disabled"))
 
     # Setzt die Anwendung zurück
     def _reset(self):
@@ -371,53 +519,470 @@ class LikeApp(TkinterDnD.Tk):
         self._refresh_state()
 
     # ----- Run -----
-    # Führt die Datenanalyse aus
+    # Startet die Datenanalyse in einem Hintergrund-Thread, damit das Fenster bedienbar bleibt
     def _run(self):
+        if self._worker is not None:
+            return
+        paths = dict(self.paths)
+        output_dir = self.output_dir
+
+        enrolled = self.enrolled.get().strip()
+        if enrolled and not enrolled.isdigit():
+            messagebox.showerror(
+                "Ungültig", "Eingeschriebene Teilnehmer: bitte eine ganze Zahl eingeben.")
+            return
+        options = {
+            "numeric": self.numeric_export.get(),
+            "pptx": self.pptx_export.get(),
+            "enrolled": int(enrolled) if enrolled else None,
+            "profile": self.profile_run.get(),
+            "cohort": "completed" if self.completed_cohort.get() else "all",
+            "country": self.country.get().strip() or None,
+        }
+
+        # Schnelle Vorab-Prüfung (Pflichtspalten + Stichprobe), bevor das Einlesen beginnt
         try:
-            self.status.set("CSV-Dateien werden geladen…")
+            issues = validate_inputs(paths)
+        except OSError as e:
+            messagebox.showerror("Fehler", f"Datei konnte nicht gelesen werden:\n{e}")
+            return
+        if any(issue.level == "error" for issue in issues):
+            messagebox.showerror("Ungültige Exporte", format_issues(issues))
+            return
+        if issues and not messagebox.askyesno(
+                "Hinweise zu den Exporten", f"{format_issues(issues)}\n\nTrotzdem fortfahren?"):
+            return
 
-            df_large = pd.read_csv(
-                self.paths["large"], sep=";", encoding="utf-8")
-            df_mcp = pd.read_csv(self.paths["mcp"], sep=";", encoding="utf-8")
-            df_self = pd.read_csv(
-                self.paths["self"], sep=";", encoding="utf-8")
+        self._cancel_event.clear()
+        self._set_running(True)
+        self.progress.config(maximum=RUN_STEPS + (1 if options["pptx"] else 0))
+        self.status.set("CSV-Dateien werden geladen…")
+
+        self._worker = threading.Thread(
+            target=self._run_worker, args=(paths, output_dir, options), daemon=True)
+        self._worker.start()
+        self.after(POLL_INTERVAL_MS, self._poll_queue)
+
+    # Meldet den Fortschritt an die UI und bricht ab, falls gewünscht (läuft im Worker)
+    def _progress(self, text: str):
+        if self._cancel_event.is_set():
+            raise AnalysisCancelled()
+        self._queue.put(("progress", text))
+
+    # Laden, Analyse und Export (läuft im Worker-Thread, keine Tk-Aufrufe!)
+    def _run_worker(self, paths: dict, output_dir: Path, options: dict):
+        import pandas as pd
+
+        from LIKE import compute_like
+        from exporters import default_filename, export_xlsx, versioned_path
+        from history import result_rows
+        from loader import load_large_table, load_export
+        from mdlo import DEFAULT_TOP_N, load_mdlo
+
+        profile = RunProfile() if options["profile"] else None
+        try:
+            # Dieselben Eingabedateien mit denselben Optionen schon ausgewertet -> Ergebnis
+            # sofort aus dem Ergebnisspeicher (nicht bei Laufzeitprofil, das soll messen)
+            store_key = None
+            target = versioned_path(Path(output_dir) / default_filename())
+            if profile is None:
+                self._progress("Prüfe Ergebnisspeicher…")
+                store_key = self.results.key_for(
+                    paths, {k: options[k] for k in ("numeric", "pptx", "enrolled", "cohort")})
+                # Kennzahlen für den Verlauf liegen beim gespeicherten Lauf (Einträge ohne
+                # werden neu berechnet, wenn der Verlauf gebraucht wird)
+                stored = (self.results.info(store_key) or {}).get("history")
+                delivered = None
+                if stored is not None or not options["country"]:
+                    delivered = self.results.deliver(store_key, target)
+                if delivered is not None:
+                    self._progress("Baue Learner-Index…")
+                    self._learner_index(paths)
+                    if stored is not None:
+                        self._record_history(options, stored["rows"], stored["learners"], delivered)
+                    self._queue.put(("done", delivered))
+                    return
+
+            # Laden wird je Export als eigener Abschnitt gemessen (nur mit Profil)
+            def load(key, title, load_fn, kind=None):
+                self._progress(f"Lade {title}…")
+                with profile.stage(f"Laden {title}") if profile else nullcontext():
+                    df = self.cache.load(paths[key], kind or key, load_fn)
+                    if profile:
+                        profile.set_rows(len(df))
+                return df
+
+            # Large Table nur mit benötigten Spalten, typisiert und blockweise
+            # (wiederholte Läufe mit denselben Dateien lesen aus dem Cache)
+            df_large = load("large", "Large Table",
+                            lambda p: load_large_table(p, completed_only=True))
+            df_mcp = load("mcp", "Metacognition Progress", load_export)
+            df_self = load("self", "Self-Assessment", load_export)
 
             df_mdlo = None
-            if self.paths["mdlo"]:
-                df_mdlo = pd.read_csv(
-                    self.paths["mdlo"], sep=";", encoding="utf-8")
+            if paths["mdlo"]:
+                # blockweise, nur die Kandidaten für die Top-N (eigener Cache-Eintrag)
+                df_mdlo = load("mdlo", "Most Difficult Learning Objectives", load_mdlo,
+                               kind=f"mdlo_top{DEFAULT_TOP_N}")
+            else:
+                self._progress("Lade Most Difficult Learning Objectives…")
 
             if df_mdlo is None:
                 df_mdlo = pd.DataFrame()
 
-            self.status.set("Datenanalyse läuft…")
-            old_cwd = os.getcwd()
-            os.chdir(self.output_dir)
-
+            report = lambda stage: self._progress(f"Datenanalyse läuft… {stage}")
+            result = compute_like(df_large, df_mcp, df_self, df_mdlo, progress=report,
+                                  profile=profile, cohort=options["cohort"])
+            output_file = export_xlsx(
+                result, target, progress=report,
+                numeric=options["numeric"], profile=profile, stats_sheet=profile is not None)
+
+            if options["pptx"]:
+                report("PowerPoint-Export")
+                # Vorlage nur beim ersten Mal laden, danach wiederverwenden
+                with profile.stage("PowerPoint-Export") if profile else nullcontext():
+                    if self._pptx_template is None:
+                        from pptx_report import PptxTemplate
+
+                        self._pptx_template = PptxTemplate()
+                    self._pptx_template.render(
+                        result, output_file.with_suffix(".pptx"), enrolled=options["enrolled"])
+
+            if profile:
+                profile.close()
+                profile.save_json(output_file.with_suffix(".profile.json"))
+
+            history_rows = result_rows(result)
+            if store_key is not None:
+                files = [output_file] + ([output_file.with_suffix(".pptx")] if options["pptx"] else [])
+                try:
+                    self.results.store(store_key, files, delivered=output_file, info={
+                        "inputs": {k: Path(p).name for k, p in paths.items() if p},
+                        "history": {"learners": int(result.amount_of_learners),
+                                    "rows": history_rows}})
+                except OSError:
+                    # Speicher voll o.ä.: Auswertung ist trotzdem fertig
+                    pass
+
+            # Learner-Index für die Suche (aus der ungefilterten Large Table, siehe _learner_index)
+            self._progress("Baue Learner-Index…")
+            self._learner_index(paths)
+
+            self._record_history(options, history_rows, int(result.amount_of_learners), output_file)
+            self._queue.put(("done", output_file))
+        except AnalysisCancelled:
+            self._queue.put(("cancelled", None))
+        except Exception as e:
+            self._queue.put(("error", e))
+        finally:
+            if profile:
+                profile.close()
+
+    # Kennzahlen in den Verlauf (history.py), nur mit angegebenem Land
+    @staticmethod
+    def _record_history(options: dict, rows, learners: int, source):
+        from history import RunHistory
+        from mdlo import DEFAULT_TOP_N
+
+        if not options["country"]:
+            return
+        try:
+            with RunHistory() as run_history:
+                run_history.record_rows(options["country"], rows, learners=learners,
+                                        source=str(source), cohort=options["cohort"],
+                                        mdlo_top=DEFAULT_TOP_N)
+        except (OSError, sqlite3.Error):
+            pass
+
+    # ----- Learner-Suche -----
+    # Schlüssel des Index: Pfade und Änderungszeiten der zugrunde liegenden Dateien
+    @staticmethod
+    def _learner_index_key(paths: dict) -> tuple:
+        return tuple((p, os.stat(p).st_mtime_ns) if p else None
+                     for p in (paths["large"], paths["self"]))
+
+    def _build_learner_index(self, key: tuple, df_large, df_self):
+        from learner_index import LearnerIndex
+
+        index = LearnerIndex(df_large, df_self)
+        with self._index_lock:
+            self.learner_index, self._index_key = index, key
+
+    # Index zu den aktuellen Dateien: aus dem letzten Lauf oder einmalig aus dem Cache aufgebaut
+    # (läuft im Worker bzw. Hintergrund-Thread). Braucht die Large Table mit allen Status –
+    # die Analyse liest nur COMPLETED, daher ein eigener Cache-Eintrag
+    def _learner_index(self, paths: dict):
+        from loader import load_export, load_large_table
+
+        key = self._learner_index_key(paths)
+        with self._index_lock:
+            if self.learner_index is not None and self._index_key == key:
+                return self.learner_index
+        df_large = self.cache.load(paths["large"], "large_all", load_large_table)
+        df_self = self.cache.load(paths["self"], "self", load_export) if paths["self"] else None
+        self._build_learner_index(key, df_large, df_self)
+        return self.learner_index
+
+    def _open_learner_search(self):
+        if self._search_window is not None and self._search_window.winfo_exists():
+            self._search_window.destroy()
+        paths = dict(self.paths)
+        self._search_window = LearnerSearch(self, lambda: self._learner_index(paths))
+
+    # Verarbeitet Nachrichten des Workers (läuft im Tk-Hauptthread via after())
+    def _poll_queue(self):
+        finished = None
+        while True:
             try:
-                like(df_large, df_mcp, df_self, df_mdlo)
-            finally:
-                os.chdir(old_cwd)
+                kind, payload = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.progress["value"] += 1
+                self.status.set(payload)
+            else:
+                finished = (kind, payload)
+
+        if finished is None:
+            self.after(POLL_INTERVAL_MS, self._poll_queue)
+            return
 
+        self._worker = None
+        self._set_running(False)
+        kind, payload = finished
+        if kind == "done":
+            self.last_output_file = payload
+            self.progress["value"] = self.progress["maximum"]
             self.status.set(
-                f"Fertig. Ergebnis liegt in: {str(self.output_dir)}")
+                f"Fertig. Ergebnis liegt in: {str(payload.parent)}")
             self.btn_open_folder.config(state="normal")
             messagebox.showinfo(
                 "Erfolg",
-                f"Datenanalyse erfolgreich.\nDie Datei wurde in folgendem Ordner gespeichert:\n{self.output_dir}",
+                f"Datenanalyse erfolgreich.\nDie Datei wurde in folgendem Ordner gespeichert:\n{payload.parent}",
             )
-
-        except Exception as e:
+        elif kind == "cancelled":
+            self.progress["value"] = 0
+            self.status.set("Analyse abgebrochen.")
+        else:
             self.status.set("Fehler aufgetreten.")
-            messagebox.showerror("Fehler", f"Fehler in der Datenanalyse:\n{e}")
+            messagebox.showerror("Fehler", f"Fehler in der Datenanalyse:\n{payload}")
+
+    # Fordert den Abbruch an; der Worker bricht beim nächsten Abschnitt ab
+    def _cancel(self):
+        if self._worker is None:
+            return
+        self._cancel_event.set()
+        self.btn_cancel.config(state="disabled")
+        self.status.set("Abbruch angefordert…")
+
+    # Sperrt bzw. entsperrt die Bedienelemente während eines Laufs
+    def _set_running(self, running: bool):
+        state = "disabled" if running else "normal"
+        for row in (self._row_large, self._row_mcp, self._row_self, self._row_mdlo):
+            row["btn"].config(state=state)
+            row["btn_clear"].config(state=state)
+        for btn in (self.btn_change_output, self.btn_reset, self.btn_clear_cache, self.chk_numeric,
+                    self.chk_pptx, self.entry_enrolled, self.chk_profile, self.chk_cohort,
+                    self.entry_country, self.btn_learners):
+            btn.config(state=state)
+        self.btn_cancel.config(state="normal" if running else "disabled")
+        if running:
+            self.btn_run.config(state="disabled")
+            self.btn_open_folder.config(state="disabled")
+            self.progress["value"] = 0
+        else:
+            self._refresh_state()
+
+
+# Suchfenster für den Drill-down: Ergebnisse eines Learners je Modul bzw. aller Learner eines
+# Moduls. load_index liefert den LearnerIndex (läuft im Hintergrund, kann dauern, wenn der
+# Index erst aus dem Cache aufgebaut wird); jede Suche ist danach nur ein Nachschlagen.
+class LearnerSearch(tk.Toplevel):
+    # Mehr Zeilen machen die Tabelle träge (z.B. alle Learner eines Moduls)
+    MAX_ROWS = 500
+
+    COLUMNS = [
+        ("key", "Modul", 180),
+        ("completed", "Abgeschlossen", 95),
+        ("accuracy", "Accuracy", 80),
+        ("acc_class", "Genauigkeitsklasse", 190),
+        ("time", "Zeit", 80),
+        ("ui", "UI", 60),
+        ("ci", "CI", 60),
+        ("uc", "UC", 60),
+        ("cc", "CC", 60),
+        ("self", "Selbsteinschätzung", 130),
+    ]
+
+    def __init__(self, master, load_index):
+        super().__init__(master)
+        self.title("Learner-Suche")
+        self.geometry("1150x560")
+        self.index = None
+        self._queue = queue.Queue()
+
+        self.mode = tk.StringVar(value="learner")
+        self.query = tk.StringVar()
+        self.status = tk.StringVar(value="Learner-Index wird aufgebaut…")
+        self.summary = tk.StringVar(value="")
+        self._build_ui()
+
+        def load():
+            try:
+                self._queue.put(("ok", load_index()))
+            except Exception as e:
+                self._queue.put(("error", e))
+
+        threading.Thread(target=load, daemon=True).start()
+        self.after(POLL_INTERVAL_MS, self._poll)
+
+    def _build_ui(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=12, pady=(12, 6))
+        ttk.Radiobutton(top, text="Learner", value="learner", variable=self.mode,
+                        command=self._update_matches).pack(side="left")
+        ttk.Radiobutton(top, text="Modul", value="module", variable=self.mode,
+                        command=self._update_matches).pack(side="left", padx=(8, 16))
+        self.entry = ttk.Entry(top, textvariable=self.query, width=40, state="disabled")
+        self.entry.pack(side="left")
+        self.query.trace_add("write", lambda *_: self._update_matches())
+
+        body = ttk.Frame(self)
+        body.pack(fill="both", expand=True, padx=12, pady=6)
+        body.columnconfigure(1, weight=1)
+        body.rowconfigure(0, weight=1)
+
+        self.matches = tk.Listbox(body, width=32, exportselection=False)
+        self.matches.grid(row=0, column=0, sticky="ns")
+        self.matches.bind("<<ListboxSelect>>", lambda _: self._show_selected())
+
+        self.table = ttk.Treeview(body, columns=[c for c, _, _ in self.COLUMNS], show="headings")
+        for column, title, width in self.COLUMNS:
+            self.table.heading(column, text=title)
+            anchor = "w" if column in ("key", "acc_class", "self") else "e"
+            self.table.column(column, width=width, anchor=anchor)
+        self.table.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
+        scroll = ttk.Scrollbar(body, orient="vertical", command=self.table.yview)
+        scroll.grid(row=0, column=2, sticky="ns")
+        self.table.configure(yscrollcommand=scroll.set)
+
+        ttk.Label(self, textvariable=self.summary).pack(anchor="w", padx=12)
+        ttk.Label(self, textvariable=self.status).pack(anchor="w", padx=12, pady=(0, 10))
+
+    def _poll(self):
+        try:
+            kind, payload = self._queue.get_nowait()
+        except queue.Empty:
+            self.after(POLL_INTERVAL_MS, self._poll)
+            return
+        if kind == "error":
+            self.status.set(f"Learner-Index konnte nicht aufgebaut werden: {payload}")
+            return
+        self.index = payload
+        self.entry.config(state="normal")
+        self.entry.focus_set()
+        self.status.set(f"{len(self.index.learners)} Learner, {len(self.index.modules)} Module – "
+                        "Namen oder Teil davon eingeben.")
+        self._update_matches()
+
+    # Trefferliste zum Suchtext
+    def _update_matches(self):
+        if self.index is None:
+            return
+        text = self.query.get()
+        if self.mode.get() == "learner":
+            names = self.index.search(text)
+        else:
+            names = self.index.search_modules(text)
+        self.matches.delete(0, "end")
+        for name in names:
+            self.matches.insert("end", name)
+        self.table.heading("key", text="Modul" if self.mode.get() == "learner" else "Learner")
+        if names:
+            self.matches.selection_set(0)
+            self._show_selected()
+        else:
+            self.table.delete(*self.table.get_children())
+            self.summary.set("Keine Treffer.")
+
+    def _show_selected(self):
+        selection = self.matches.curselection()
+        if not selection or self.index is None:
+            return
+        from exporters import format_hm
+
+        name = self.matches.get(selection[0])
+        t0 = time.perf_counter()
+        by_learner = self.mode.get() == "learner"
+        rows = self.index.learner(name) if by_learner else self.index.module(name)
+
+        def pct(value):
+            return "" if value != value else f"{value:.1f}%".replace(".", ",")
+
+        self.table.delete(*self.table.get_children())
+        key_column = "Module" if by_learner else "Learner"
+        for row in rows.head(self.MAX_ROWS).itertuples(index=False, name=None):
+            values = dict(zip(rows.columns, row))
+            seconds = values["Sum Time Spent"]
+            self.table.insert("", "end", values=(
+                values[key_column],
+                "ja" if values["Completed"] else "nein",
+                pct(values["Accuracy"]),
+                values["Accuracy-Classes"] or "",
+                "" if seconds != seconds else format_hm(seconds),
+                pct(values["Unconscious Incompetent"]),
+                pct(values["Conscious Incompetent"]),
+                pct(values["Unconscious Competent"]),
+                pct(values["Conscious Competent"]),
+                values["Self Assessment"] if isinstance(values["Self Assessment"], str) else "",
+            ))
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+
+        if by_learner:
+            info = self.index.learner_summary(name)
+            text = (f"{name}: {info['completed_modules']} von {info['total_modules']} Modulen "
+                    f"abgeschlossen · Zeit {format_hm(info['time_seconds'])} · "
+                    f"Ø Accuracy {pct(info['accuracy']) or '–'}")
+            if info["all_completed"]:
+                text += " · in der Auswertung enthalten"
+        else:
+            done = rows[rows["Completed"]]
+            text = (f"{name}: {len(done)} Learner abgeschlossen · "
+                    f"Ø Accuracy {pct(float(done['Accuracy'].mean())) if len(done) else '–'}")
+        if len(rows) > self.MAX_ROWS:
+            text += f" · Anzeige: erste {self.MAX_ROWS} von {len(rows)} Zeilen"
+        self.summary.set(text)
+        self.status.set(f"{len(rows)} Zeilen in {elapsed_ms:.1f} ms")
+
+
+# Startzeit messen: schreibt nach dem ersten Zeichnen des Fensters die Zeit seit
+# Programmstart (ab Import von app.py) und bereits geladene schwere Module als JSON nach
+# path und beendet die Anwendung. Wird von benchmarks/bench_startup.py genutzt
+# (python app.py --startup-probe out.json bzw. LIKE_Tool.exe --startup-probe out.json).
+def _startup_probe(app: LikeApp, path: str):
+    app.update()
+    data = {
+        "window_s": round(time.perf_counter() - _T_START, 4),
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "heavy_modules_loaded": [m for m in HEAVY_MODULES if m in sys.modules],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    app.destroy()
 
 
 # Startet die Anwendung
 if __name__ == "__main__":
-    app = LikeApp()
+    probe_path = None
+    if "--startup-probe" in sys.argv:
+        probe_path = sys.argv[sys.argv.index("--startup-probe") + 1]
+
+    app = LikeApp(warmup=probe_path is None)
     try:
         style = ttk.Style()
         style.theme_use("clam")
     except Exception:
         pass
+    if probe_path:
+        app.after_idle(_startup_probe, app, probe_path)
     app.mainloop()
@@ -0,0 +1,224 @@
+# Alternative Auswertung der Large Table mit pyarrow (optional, pandas bleibt Standard):
+# mehrkerniger CSV-Leser über eine memory-mapped Datei, Filter / Gruppierungen / Zählungen
+# mit Arrow-Compute-Kerneln. Ergebnis ist dasselbe LikeResult wie bei compute_like().
+#
+#   table = load_large_table_arrow(path, completed_only=True)
+#   result = compute_like(table, df_mcp, df_self, df_mdlo, engine="arrow")
+#
+# Prozent- und Dauer-Texte werden wie in loader.py nur einmal je verschiedenem Wert mit den
+# pandas-Parsern umgewandelt (dictionary_encode + take) -> identische Zahlen in beiden Engines.
+# MCP, Self-Assessment und MDLO sind klein und laufen über die pandas-Funktionen aus LIKE.py.
+import csv
+
+import numpy as np
+import pandas as pd
+
+from LIKE import (
+    COMPETENCE_COLUMNS, DEFAULT_COHORT, ORDER_ACC, LearnerSet, LikeResult,
+    add_accuracy_summary, add_competence_summary, distribution_from_counts,
+    metacognition_progress, restrict_to_cohort, self_assessment_by_module, top_mdlo,
+    top_mdlo_by_module,
+)
+from mdlo import DEFAULT_TOP_N
+from loader import (
+    CATEGORY_COLUMNS, DURATION_COLUMNS, LARGE_TABLE_COLUMNS, PERCENT_COLUMNS,
+    parse_duration_seconds, parse_percent,
+)
+
+
+# Prüft, ob pyarrow installiert ist
+def arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Liest die Large Table mit dem Arrow-CSV-Leser (alle Kerne, memory-mapped) ein:
+# nur benötigte Spalten, alle als Text (Typisierung in compute_like_arrow), leere Felder -> null
+def load_large_table_arrow(path, completed_only: bool = False):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f, delimiter=";"), [])
+    wanted = [c for c in header if c.strip() in LARGE_TABLE_COLUMNS]
+
+    with pa.memory_map(str(path)) as source:
+        table = pv.read_csv(
+            source,
+            read_options=pv.ReadOptions(use_threads=True),
+            parse_options=pv.ParseOptions(delimiter=";"),
+            convert_options=pv.ConvertOptions(
+                include_columns=wanted,
+                column_types={c: pa.string() for c in wanted},
+                strings_can_be_null=True,
+            ),
+        )
+    table = table.rename_columns([c.strip() for c in table.column_names])
+    if completed_only:
+        table = table.filter(pc.equal(table["Completion Status"], "COMPLETED"))
+    return table
+
+
+# pandas-DataFrame (z.B. aus loader.py oder dem Cache) -> Arrow-Tabelle;
+# Categoricals werden zu normalen Textspalten, damit Gruppierungen überall gleich laufen
+def _to_table(df_large_table):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(df_large_table, pd.DataFrame):
+        table = pa.Table.from_pandas(df_large_table, preserve_index=False)
+    else:
+        table = df_large_table
+    for name in CATEGORY_COLUMNS:
+        if name in table.column_names and pa.types.is_dictionary(table[name].type):
+            table = table.set_column(table.column_names.index(name), name,
+                                     pc.cast(table[name], table[name].type.value_type))
+    return table
+
+
+# Wendet einen pandas-Parser nur auf die verschiedenen Werte einer Textspalte an
+def _parse_unique(column, parse):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not (pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+        return column
+    encoded = pc.dictionary_encode(column).combine_chunks()
+    values = parse(pd.Series(encoded.dictionary.to_pylist(), dtype=object)).to_numpy()
+    return pc.take(pa.array(values, from_pandas=True), encoded.indices)
+
+
+# Ersetzt eine Spalte der Tabelle
+def _replace(table, name, column):
+    return table.set_column(table.column_names.index(name), name, column)
+
+
+# Gruppierung ohne Zeilen mit fehlenden Schlüsseln (wie pandas groupby mit dropna=True)
+def _group(table, keys, aggregations):
+    import pyarrow.compute as pc
+
+    mask = None
+    for key in keys:
+        valid = pc.is_valid(table[key])
+        mask = valid if mask is None else pc.and_(mask, valid)
+    if mask is not None and table.num_rows:
+        table = table.filter(mask)
+    return table.group_by(keys).aggregate(aggregations)
+
+
+# Wie compute_like(), aber die Large Table wird mit Arrow ausgewertet.
+# df_large_table: Arrow-Tabelle (load_large_table_arrow) oder pandas-DataFrame
+def compute_like_arrow(df_large_table, df_mcp, df_self_assessment, df_mdlo, progress=None,
+                       profile=None, mdlo_top=DEFAULT_TOP_N, cohort=DEFAULT_COHORT) -> LikeResult:
+    import pyarrow.compute as pc
+
+    report = progress if progress is not None else (lambda stage: None)
+    rows = (lambda n: None) if profile is None else profile.set_rows
+    if profile is not None:
+        report = profile.track(report)
+
+    report("Abgeschlossene Learner")
+    table = _to_table(df_large_table)
+    rows(table.num_rows)
+    table = table.filter(pc.equal(table["Completion Status"], "COMPLETED"))
+
+    # Learner mit allen Modulen: Anzahl verschiedener Module je Learner == Anzahl aller Module
+    # (fehlendes Modul zählt wie in completed_learners_of als eigener Wert)
+    count_all = pc.CountOptions(mode="all")
+    n_modules = pc.count_distinct(table["Module"], mode="all").as_py() if table.num_rows else 0
+    per_learner = _group(table, ["Learner"], [("Module", "count_distinct", count_all)])
+    completed = per_learner.filter(
+        pc.equal(per_learner["Module_count_distinct"], n_modules))["Learner"]
+    table = table.filter(pc.is_in(table["Learner"], value_set=completed.combine_chunks()))
+    amount_of_learners = len(completed)
+    cohort_learners = LearnerSet(completed.to_pylist()) if cohort == "completed" else None
+
+    for col in PERCENT_COLUMNS:
+        table = _replace(table, col, _parse_unique(table[col], parse_percent))
+
+    report("Time To Complete")
+    rows(table.num_rows)
+    for col in DURATION_COLUMNS:
+        table = _replace(table, col, pc.fill_null(
+            _parse_unique(table[col], parse_duration_seconds), 0))
+
+    time_per_learner = _group(table, ["Class Description", "Learner"],
+                              [("Sum Time Spent", "sum")])
+    time_by_class = _group(time_per_learner, ["Class Description"], [
+        ("Sum Time Spent_sum", "mean"),
+        ("Sum Time Spent_sum", "min"),
+        ("Sum Time Spent_sum", "max"),
+        ("Sum Time Spent_sum", "sum"),
+    ]).to_pandas()
+    df_time = pd.DataFrame({
+        "Class Description": time_by_class["Class Description"],
+        "Average Time Needed To Complete All Modules": time_by_class["Sum Time Spent_sum_mean"],
+        "Min. Time Needed To Complete All Modules": time_by_class["Sum Time Spent_sum_min"],
+        "Max. Time Needed To Complete All Modules": time_by_class["Sum Time Spent_sum_max"],
+        "Total Time Needed To Complete All Modules": time_by_class["Sum Time Spent_sum_sum"],
+    }).sort_values("Class Description", ignore_index=True)
+
+    report("Average Accuracy")
+    rows(table.num_rows)
+    accuracy_by_class = _group(table, ["Class Description"], [("Accuracy", "mean")]) \
+        .to_pandas().sort_values("Class Description", ignore_index=True)
+    df_avg_acc = pd.DataFrame({
+        "Class Description": accuracy_by_class["Class Description"].astype(str),
+        "Average Accuracy (all modules)": accuracy_by_class["Accuracy_mean"].astype("float64").round(2),
+    })
+
+    report("Metacognition Progress")
+    rows(len(df_mcp))
+    df_mcp = metacognition_progress(restrict_to_cohort(df_mcp, cohort_learners))
+
+    report("Accuracy Of Self-Assessment")
+    rows(table.num_rows)
+    modules = sorted(pc.unique(table["Module"]).drop_null().to_pylist())
+    acc_counts = _group(table, ["Module", "Accuracy-Classes"], [("Accuracy-Classes", "count")]) \
+        .to_pandas()
+    counts = (
+        acc_counts.pivot(index="Module", columns="Accuracy-Classes", values="Accuracy-Classes_count")
+        .fillna(0)
+        .astype(np.int64)
+    )
+    df_acc_of_self_assessment = add_accuracy_summary(
+        distribution_from_counts(counts, modules, ORDER_ACC))
+
+    report("Self-evaluation")
+    rows(len(df_self_assessment))
+    df_self_assessment = self_assessment_by_module(
+        restrict_to_cohort(df_self_assessment, cohort_learners), modules)
+
+    report("Competence Level")
+    rows(table.num_rows)
+    competence = _group(table, ["Module"], [(c, "mean") for c in COMPETENCE_COLUMNS]) \
+        .to_pandas().sort_values("Module", ignore_index=True)
+    df_competence_by_module = add_competence_summary(pd.DataFrame({
+        "Module": competence["Module"],
+        **{c: competence[f"{c}_mean"].astype("float64").round(2) for c in COMPETENCE_COLUMNS},
+    }))
+
+    report("Most Difficult Learning Objectives")
+    rows(len(df_mdlo))
+    df_mdlo_by_module = top_mdlo_by_module(df_mdlo, mdlo_top)
+    df_mdlo = top_mdlo(df_mdlo, mdlo_top)
+
+    if profile is not None:
+        profile.stop()
+
+    return LikeResult(
+        amount_of_learners=amount_of_learners,
+        time_seconds=df_time,
+        avg_acc=df_avg_acc,
+        mcp=df_mcp,
+        acc_of_self_assessment=df_acc_of_self_assessment,
+        self_assessment=df_self_assessment,
+        competence_by_module=df_competence_by_module,
+        mdlo=df_mdlo,
+        mdlo_by_module=df_mdlo_by_module,
+        mdlo_top=mdlo_top,
+    )
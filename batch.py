@@ -0,0 +1,243 @@
+# Stapelverarbeitung ohne GUI: ein Ordner je Land (Countries/<Land>/) mit den vier Exporten,
+# Auswertung parallel in einem Prozess-Pool, eine Excel-Datei je Land
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from csv_types import detect_csv_type_by_header
+from history import default_history_path
+from schema import DEFAULT_TOP_N, positive_int, validate_inputs
+
+MANDATORY_KEYS = ["large", "mcp", "self"]
+
+# Optional je Land: Anzahl eingeschriebener Teilnehmer für den PowerPoint-Bericht
+ENROLLED_FILE = "enrolled.txt"
+
+# PowerPoint-Vorlage je Worker-Prozess (einmal geladen, für alle Länder des Prozesses genutzt)
+_pptx_template = None
+
+
+# Ordnet die CSV-Dateien eines Länderordners den Exporttypen zu
+def classify_folder(folder: Path) -> tuple[dict, list[str]]:
+    paths = {"large": None, "mcp": None, "self": None, "mdlo": None}
+    problems = []
+    for file in sorted(folder.glob("*.csv")):
+        try:
+            key, reason = detect_csv_type_by_header(str(file))
+        except Exception as e:
+            problems.append(f"{file.name}: Header nicht lesbar ({e})")
+            continue
+        if key is None:
+            problems.append(f"{file.name}: {reason}")
+        elif paths[key] is not None:
+            problems.append(f"{file.name}: {key.upper()} bereits durch {Path(paths[key]).name} belegt")
+        else:
+            paths[key] = str(file)
+    for key in MANDATORY_KEYS:
+        if paths[key] is None:
+            problems.append(f"Pflichtdatei fehlt: {key.upper()}")
+    return paths, problems
+
+
+# Liest die Teilnehmerzahl aus enrolled.txt im Länderordner (falls vorhanden)
+def read_enrolled(folder: Path) -> int | None:
+    path = folder / ENROLLED_FILE
+    if not path.exists():
+        return None
+    text = path.read_text(encoding="utf-8-sig").strip()
+    return int(text) if text.isdigit() else None
+
+
+# Findet alle Länderordner (Unterordner mit mindestens einer CSV-Datei)
+def find_country_folders(root: Path) -> dict[str, Path]:
+    return {
+        d.name: d
+        for d in sorted(root.iterdir())
+        if d.is_dir() and any(d.glob("*.csv"))
+    }
+
+
+# Wertet ein Land aus (läuft im Worker-Prozess).
+# history: Pfad der Verlaufsdatenbank (history.py), in die die Kennzahlen geschrieben werden
+def run_country(country: str, paths: dict, output_dir: str, numeric: bool = False,
+                pptx: bool = False, enrolled: int | None = None, engine: str = "pandas",
+                history: str | None = None, mdlo_top: int = DEFAULT_TOP_N, cohort: str = "all") -> dict:
+    global _pptx_template
+
+    # Schwere Importe erst im Worker
+    import pandas as pd
+    from LIKE import compute_like
+    from exporters import default_filename, export_xlsx, versioned_path
+    from loader import load_large_table, load_export
+    from mdlo import load_mdlo
+
+    timings = {}
+    outdir = Path(output_dir) / country
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    t0 = time.perf_counter()
+    if engine == "arrow":
+        from arrow_engine import load_large_table_arrow
+
+        df_large = load_large_table_arrow(paths["large"], completed_only=True)
+    else:
+        df_large = load_large_table(paths["large"], completed_only=True)
+    df_mcp = load_export(paths["mcp"])
+    df_self = load_export(paths["self"])
+    # MDLO blockweise: nur die Kandidaten für die Top-N bleiben im Speicher
+    df_mdlo = load_mdlo(paths["mdlo"], mdlo_top) if paths["mdlo"] else pd.DataFrame()
+    timings["load_s"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine, mdlo_top=mdlo_top,
+                          cohort=cohort)
+    timings["analysis_s"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    output_file = export_xlsx(result, versioned_path(outdir / default_filename()),
+                              numeric=numeric)
+    if pptx:
+        from pptx_report import PptxTemplate
+
+        if _pptx_template is None:
+            _pptx_template = PptxTemplate()
+        _pptx_template.render(result, output_file.with_suffix(".pptx"), enrolled=enrolled)
+    timings["export_s"] = time.perf_counter() - t0
+
+    # Verlauf ist Zusatz: gesperrte/volle Datenbank kostet nicht das Ergebnis des Landes
+    warnings = []
+    if history:
+        import sqlite3
+
+        from history import RunHistory
+
+        try:
+            with RunHistory(history) as run_history:
+                run_history.record(result, country, source=str(output_file), cohort=cohort,
+                                   mdlo_top=mdlo_top)
+        except (sqlite3.Error, OSError) as e:
+            warnings.append(f"Verlauf nicht gespeichert: {type(e).__name__}: {e}")
+
+    timings["total_s"] = timings["load_s"] + timings["analysis_s"] + timings["export_s"]
+    return {"rows_large": len(df_large), "output_file": str(output_file), **timings,
+            "warnings": warnings}
+
+
+# Führt die Auswertung für alle Länder aus und gibt je Land ein Ergebnis zurück
+def run_batch(root, output_dir, workers: int | None = None, countries: list[str] | None = None,
+              numeric: bool = False, pptx: bool = False, engine: str = "pandas",
+              history: str | None = None, mdlo_top: int = DEFAULT_TOP_N,
+              cohort: str = "all") -> list[dict]:
+    root = Path(root)
+    folders = find_country_folders(root)
+    if countries:
+        folders = {c: f for c, f in folders.items() if c in countries}
+
+    results = []
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for country, folder in folders.items():
+            paths, problems = classify_folder(folder)
+            if any(paths[k] is None for k in MANDATORY_KEYS):
+                results.append({"country": country, "status": "fehlgeschlagen",
+                                "error": "; ".join(problems)})
+                continue
+            # Vorab-Prüfung: fehlerhafte Exporte scheitern sofort statt nach dem Einlesen
+            issues = validate_inputs(paths)
+            errors = [str(i) for i in issues if i.level == "error"]
+            if errors:
+                results.append({"country": country, "status": "fehlgeschlagen",
+                                "error": "; ".join(errors)})
+                continue
+            problems += [str(i) for i in issues]
+            future = pool.submit(run_country, country, paths, str(output_dir), numeric,
+                                 pptx, read_enrolled(folder), engine, history, mdlo_top, cohort)
+            jobs[future] = (country, problems)
+
+        for future in as_completed(jobs):
+            country, problems = jobs[future]
+            row = {"country": country}
+            try:
+                row.update(future.result())
+                row["status"] = "ok"
+                warnings = problems + row.pop("warnings")
+                if warnings:
+                    row["warnings"] = "; ".join(warnings)
+            except Exception as e:
+                row["status"] = "fehlgeschlagen"
+                row["error"] = f"{type(e).__name__}: {e}"
+            results.append(row)
+
+    return sorted(results, key=lambda r: r["country"])
+
+
+# Schreibt die Zusammenfassung als CSV (Semikolon wie die Exporte)
+def write_summary(results: list[dict], path: Path):
+    fields = ["country", "status", "rows_large", "load_s", "analysis_s", "export_s", "total_s",
+              "output_file", "warnings", "error"]
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, delimiter=";", extrasaction="ignore")
+        writer.writeheader()
+        for row in results:
+            writer.writerow({k: (f"{v:.2f}" if isinstance(v, float) else v) for k, v in row.items()})
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LIKE Stapelauswertung für alle Länderordner")
+    parser.add_argument("root", nargs="?", default="Countries",
+                        help="Ordner mit einem Unterordner je Land (Standard: Countries)")
+    parser.add_argument("-o", "--output", default="LIKE_Output",
+                        help="Ausgabeordner (je Land ein Unterordner)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Anzahl paralleler Prozesse (Standard: alle Kerne)")
+    parser.add_argument("-c", "--country", action="append", dest="countries",
+                        help="Nur dieses Land auswerten (mehrfach möglich)")
+    parser.add_argument("--numeric", action="store_true",
+                        help="Excel mit Zahlenformaten statt Texten schreiben")
+    parser.add_argument("--pptx", action="store_true",
+                        help=f"Zusätzlich PowerPoint-Bericht aus Vorlage.pptx (Teilnehmer aus {ENROLLED_FILE})")
+    parser.add_argument("--engine", choices=["pandas", "arrow"], default="pandas",
+                        help="Auswertung der Large Table mit pandas (Standard) oder pyarrow")
+    parser.add_argument("--mdlo-top", type=positive_int, default=DEFAULT_TOP_N,
+                        help="Anzahl der Most Difficult Learning Objectives (gesamt und je Modul)")
+    parser.add_argument("--cohort", choices=["all", "completed"], default="all",
+                        help="Selbsteinschätzung für alle Learner des Exports (Standard) oder nur "
+                             "für die Learner, die alle Module abgeschlossen haben")
+    parser.add_argument("--history", default=None,
+                        help="Verlaufsdatenbank (Standard: neben dem Cache, siehe history.py)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="Kennzahlen nicht im Verlauf speichern")
+    args = parser.parse_args(argv)
+
+    output_dir = Path(args.output).resolve()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    started = time.perf_counter()
+    results = run_batch(args.root, output_dir, workers=args.workers, countries=args.countries,
+                        numeric=args.numeric, pptx=args.pptx, engine=args.engine,
+                        history=None if args.no_history else str(args.history or default_history_path()),
+                        mdlo_top=args.mdlo_top, cohort=args.cohort)
+    elapsed = time.perf_counter() - started
+
+    summary_path = output_dir / "batch_summary.csv"
+    write_summary(results, summary_path)
+
+    failed = [r for r in results if r["status"] != "ok"]
+    for r in results:
+        if r["status"] == "ok":
+            print(f"{r['country']:<12} ok    {r['total_s']:7.2f}s  ({r['rows_large']} Zeilen)")
+            if r.get("warnings"):
+                print(f"{'':<12} Warnung  {r['warnings']}")
+        else:
+            print(f"{r['country']:<12} FEHLER  {r.get('error', '')}")
+    print(f"\n{len(results) - len(failed)}/{len(results)} Länder erfolgreich in {elapsed:.1f}s. "
+          f"Zusammenfassung: {summary_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
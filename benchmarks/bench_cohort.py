@@ -0,0 +1,119 @@
+# Benchmark Kohorte der Selbsteinschätzung (LIKE.COHORTS): cohort="all" (bisher, ganzer
+# Self-Assessment-Export) und cohort="completed" (Semi-Join auf die Learner mit allen
+# Modulen über LIKE.LearnerSet, danach ein gruppierter Durchlauf). Gemessen werden
+# Semi-Join (Hash-Index gegen isin je Zeile), Verteilung (gruppiert gegen Schleife je Modul)
+# und compute_like in beiden Modi. Die Parität beider Modi prüft tests/test_cohort.py.
+#
+#   python benchmarks/bench_cohort.py --rows 100000 1000000
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from LIKE import (  # noqa: E402
+    ORDER_SA, LearnerSet, add_self_assessment_summary, completed_learners_of, compute_like,
+    restrict_to_cohort, self_assessment_by_module,
+)
+from arrow_engine import arrow_available  # noqa: E402
+from loader import load_export, load_large_table  # noqa: E402
+from synthetic import SyntheticConfig, learners_for_rows, write_dataset  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# Vergleichsbasis wie früher: je Modul filtern und value_counts (Prozent, 2 Nachkommastellen)
+def reference_self_assessment(df_self, modules) -> pd.DataFrame:
+    result = pd.DataFrame({"Module": list(modules)})
+    for value in ORDER_SA:
+        result[value] = 0.0
+    for i, module in enumerate(modules):
+        counts = df_self.loc[df_self["Module"] == module, "Self Assessment"].value_counts()
+        total = counts.sum()
+        for value in ORDER_SA:
+            if total and value in counts.index:
+                result.loc[i, value] = round(counts[value] / total * 100, 2)
+    return add_self_assessment_summary(result)
+
+
+# Median der Dauer in ms
+def time_ms(fn, repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Kohorte der Selbsteinschätzung")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    engines = ["pandas"] + (["arrow"] if arrow_available() else [])
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "results": []}
+    print(f"{'Zeilen':>9} | {'SA-Zeilen':>9} | {'Kohorte':>9} | {'Hash [ms]':>9} | {'isin [ms]':>9} | "
+          f"{'gruppiert [ms]':>14} | {'je Modul [ms]':>13} | {'all [s]':>7} | {'completed [s]':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            cfg = SyntheticConfig()
+            cfg.learners = learners_for_rows(rows, cfg)
+            paths = write_dataset(Path(tmp) / str(rows), cfg)
+            df_large = load_large_table(paths["large"], completed_only=True)
+            df_mcp = load_export(paths["mcp"])
+            df_self = load_export(paths["self"])
+            df_mdlo = load_export(paths["mdlo"])
+
+            completed = completed_learners_of(df_large[df_large["Completion Status"] == "COMPLETED"])
+            modules = sorted(df_large["Module"].unique())
+            subset = restrict_to_cohort(df_self, LearnerSet(completed))
+
+            # Semi-Join: Hash-Index (inkl. Aufbau) gegen isin je Zeile
+            hash_ms = time_ms(lambda: restrict_to_cohort(df_self, LearnerSet(completed)), args.repeat)
+            isin_ms = time_ms(lambda: df_self[df_self["Learner"].isin(completed)], args.repeat)
+            # Verteilung über die Kohorte: ein gruppierter Durchlauf gegen Schleife je Modul
+            grouped_ms = time_ms(lambda: self_assessment_by_module(subset, modules), args.repeat)
+            loop_ms = time_ms(lambda: reference_self_assessment(subset, modules), 1)
+
+            timings = {}
+            for engine in engines:
+                for cohort in ("all", "completed"):
+                    t0 = time.perf_counter()
+                    compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine, cohort=cohort)
+                    timings[f"{engine}/{cohort}_s"] = time.perf_counter() - t0
+
+            print(f"{rows:>9} | {len(df_self):>9} | {len(subset):>9} | {hash_ms:>9.2f} | {isin_ms:>9.2f} | "
+                  f"{grouped_ms:>14.2f} | {loop_ms:>13.2f} | {timings['pandas/all_s']:>7.2f} | "
+                  f"{timings['pandas/completed_s']:>13.2f}")
+            report["results"].append({
+                "rows": rows,
+                "self_rows": len(df_self),
+                "cohort_rows": len(subset),
+                "completed_learners": len(completed),
+                "semi_join_hash_ms": hash_ms,
+                "semi_join_isin_ms": isin_ms,
+                "distribution_grouped_ms": grouped_ms,
+                "distribution_per_module_ms": loop_ms,
+                **timings,
+            })
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"cohort_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+
+
+if __name__ == "__main__":
+    main()
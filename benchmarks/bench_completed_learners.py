@@ -0,0 +1,66 @@
+# Benchmark Filter "Learner mit allen Modulen": vektorisiert (LIKE.completed_learners_of)
+# gegen den früheren Weg mit einem Python-set je Learner. Prüft dabei die Gleichheit.
+#
+#   python benchmarks/bench_completed_learners.py --learners 10000 100000 1000000
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from LIKE import completed_learners_of  # noqa: E402
+
+
+# Früherer Weg: set der Module je Learner mit der Menge aller Module vergleichen
+def completed_learners_sets(df) -> pd.Index:
+    modules_names = set(df["Module"].unique())
+    modules_per_learner = df.groupby("Learner", observed=True)["Module"].apply(set)
+    return modules_per_learner[modules_per_learner == modules_names].index
+
+
+# Abgeschlossene Zeilen: jeder Learner hat jedes Modul mit Wahrscheinlichkeit completion_rate
+def synthetic_completed_rows(n_learners: int, n_modules: int = 8, completion_rate: float = 0.9,
+                             categorical: bool = True, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    learner = np.repeat(np.arange(n_learners), n_modules)
+    module = np.tile(np.arange(n_modules), n_learners)
+    keep = rng.random(len(learner)) < completion_rate
+    order = rng.permutation(int(keep.sum()))
+    df = pd.DataFrame({
+        "Learner": pd.Series([f"learner{i:07d}@example.com" for i in learner[keep]]).iloc[order],
+        "Module": pd.Series([f"Module {m}" for m in module[keep]]).iloc[order],
+    }).reset_index(drop=True)
+    if categorical:
+        df = df.astype("category")
+    return df
+
+
+def timed(fn, df):
+    t0 = time.perf_counter()
+    out = fn(df)
+    return out, time.perf_counter() - t0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark completed-learner-Filter")
+    parser.add_argument("--learners", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--object", action="store_true", help="Strings statt Categoricals")
+    args = parser.parse_args(argv)
+
+    print(f"{'Learner':>9} | {'Zeilen':>9} | {'sets [s]':>9} | {'vektor. [s]':>11} | {'Faktor':>6} | gleich")
+    for n in args.learners:
+        df = synthetic_completed_rows(n, args.modules, categorical=not args.object)
+        old, t_old = timed(completed_learners_sets, df)
+        new, t_new = timed(completed_learners_of, df)
+        same = list(map(str, old)) == list(map(str, new))
+        print(f"{n:>9} | {len(df):>9} | {t_old:>9.3f} | {t_new:>11.3f} | "
+              f"{t_old / t_new:>6.1f} | {'ja' if same else 'NEIN'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Paritätsprüfung und Benchmark der beiden Engines von compute_like (pandas / arrow) auf
+# synthetischen Exporten (synthetic.py). Je Engine und Größe läuft ein eigener Prozess
+# (Laden der Large Table + Auswertung), damit Spitzen-Speicher nicht verfälscht wird:
+# gemessen werden tracemalloc (pandas/numpy) und der Arrow-Speicherpool.
+# Die Ergebnisse beider Engines müssen identisch sein (incremental.compare_results),
+# sonst Exit-Code 1.
+#
+#   python benchmarks/bench_engines.py --rows 10000 100000 1000000 10000000
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from incremental import compare_results  # noqa: E402
+from synthetic import SyntheticConfig, learners_for_rows, write_dataset  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# Läuft im eigenen Prozess: Laden + Auswertung mit einer Engine
+def run_engine(engine: str, paths: dict) -> dict:
+    sys.path.insert(0, str(ROOT))
+    import pyarrow as pa
+
+    from LIKE import compute_like
+    from arrow_engine import load_large_table_arrow
+    from loader import load_export, load_large_table
+
+    df_mcp = load_export(paths["mcp"])
+    df_self = load_export(paths["self"])
+    df_mdlo = load_export(paths["mdlo"])
+
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    if engine == "arrow":
+        df_large = load_large_table_arrow(paths["large"], completed_only=True)
+    else:
+        df_large = load_large_table(paths["large"], completed_only=True)
+    load_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    result = compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine)
+    analysis_s = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "result": result,
+        "load_s": load_s,
+        "analysis_s": analysis_s,
+        "total_s": load_s + analysis_s,
+        "peak_python_mb": peak / 1024 / 1024,
+        "peak_arrow_mb": pa.default_memory_pool().max_memory() / 1024 / 1024,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parität und Benchmark pandas- gegen Arrow-Engine")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "results": []}
+    failed = False
+    print(f"{'Zeilen':>9} | {'Engine':<6} | {'Laden [s]':>9} | {'Analyse [s]':>11} | "
+          f"{'Py-Peak [MB]':>12} | {'Arrow [MB]':>10} | gleich")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            cfg = SyntheticConfig(modules=args.modules, classes=args.classes)
+            cfg.learners = learners_for_rows(rows, cfg)
+            paths = write_dataset(Path(tmp) / str(rows), cfg)
+
+            runs = {}
+            for engine in ("pandas", "arrow"):
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    runs[engine] = pool.submit(run_engine, engine, paths).result()
+
+            diffs = compare_results(runs["pandas"].pop("result"), runs["arrow"].pop("result"))
+            failed = failed or bool(diffs)
+            for engine, run in runs.items():
+                print(f"{rows:>9} | {engine:<6} | {run['load_s']:>9.2f} | {run['analysis_s']:>11.2f} | "
+                      f"{run['peak_python_mb']:>12.1f} | {run['peak_arrow_mb']:>10.1f} | "
+                      f"{'ja' if not diffs else 'NEIN'}")
+            for diff in diffs:
+                print(f"    {diff}")
+            report["results"].append({
+                "target_rows": rows,
+                "learners": cfg.learners,
+                "identical": not diffs,
+                "differences": diffs,
+                "speedup_total": runs["pandas"]["total_s"] / runs["arrow"]["total_s"],
+                **{engine: run for engine, run in runs.items()},
+            })
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"engines_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# Benchmark Excel-Export: Write-Only-Export (exporters.export_xlsx) gegen den früheren
+# Weg (pd.ExcelWriter + load_workbook + Spaltenbreiten + erneutes Speichern)
+#
+#   python benchmarks/bench_export.py --rows 1000 10000 100000
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from LIKE import LikeResult  # noqa: E402
+from exporters import export_xlsx, format_sheets  # noqa: E402
+
+
+# Früherer Export: zweimal serialisieren, einmal komplett parsen
+def export_xlsx_reload(result: LikeResult, path: Path):
+    from openpyxl import load_workbook
+
+    with pd.ExcelWriter(path) as writer:
+        for sheet_name, df in format_sheets(result).items():
+            df.to_excel(writer, sheet_name=sheet_name, index=False)
+    wb = load_workbook(path)
+    for sheet in wb.sheetnames:
+        ws = wb[sheet]
+        for col in ws.columns:
+            max_length = 0
+            column = col[0].column_letter
+            for cell in col:
+                if cell.value is not None:
+                    max_length = max(max_length, len(str(cell.value)))
+            ws.column_dimensions[column].width = max(max_length + 2, 10)
+    wb.save(path)
+
+
+# Ergebnis mit n Modulen / Klassen (große Tabellen je Modul)
+def synthetic_result(n: int, seed: int = 0) -> LikeResult:
+    rng = np.random.default_rng(seed)
+    modules = [f"Module {i:06d}" for i in range(n)]
+    classes = [f"Class {i:06d}" for i in range(n)]
+
+    def pct(cols):
+        return pd.DataFrame(
+            {"Module": modules, **{c: rng.uniform(0, 100, n).round(2) for c in cols}})
+
+    seconds = rng.integers(600, 36000, n)
+    return LikeResult(
+        amount_of_learners=n,
+        time_seconds=pd.DataFrame({
+            "Class Description": classes,
+            "Average Time Needed To Complete All Modules": seconds.astype(float),
+            "Min. Time Needed To Complete All Modules": seconds // 2,
+            "Max. Time Needed To Complete All Modules": seconds * 2,
+            "Total Time Needed To Complete All Modules": seconds * 10,
+        }),
+        avg_acc=pd.DataFrame({
+            "Class Description": classes,
+            "Average Accuracy (all modules)": rng.uniform(0, 100, n).round(2),
+        }),
+        mcp=pd.DataFrame({"Description": ["UI", "CI", "UC", "CC", "KI", "RUI"],
+                          "Value": rng.integers(0, 100, 6)}),
+        acc_of_self_assessment=pct(["firm knowledge", "competent", "re-training", "hands-on",
+                                    ">69%", "<=69% - >50%", "<= 50%"]),
+        self_assessment=pct(["Novice", "Advanced beginner", "Competent", "Proficient", "Expert",
+                             "Professional", "Competent 2", "Beginner"]),
+        competence_by_module=pct(["Unconscious Incompetent", "Conscious Incompetent",
+                                  "Unconscious Competent", "Conscious Competent",
+                                  "Incompetent", "Competent"]),
+        mdlo=pd.DataFrame({"Module": modules[:5], "Learning Objective": modules[:5],
+                           "Unconsciously Incompetent": rng.uniform(0, 100, min(n, 5))}),
+    )
+
+
+# Misst Laufzeit und Spitzen-Speicher (tracemalloc) einer Exportfunktion
+def measure(fn, result, path):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn(result, path)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Excel-Export")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Zeilen je Modul-/Klassentabelle")
+    args = parser.parse_args(argv)
+
+    print(f"{'Zeilen':>8} | {'Verfahren':<14} | {'Zeit [s]':>9} | {'Peak [MB]':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.rows:
+            result = synthetic_result(n)
+            for name, fn in (("reload+resize", export_xlsx_reload), ("write-only", export_xlsx)):
+                elapsed, peak = measure(fn, result, Path(tmp) / f"{name}_{n}.xlsx")
+                print(f"{n:>8} | {name:<14} | {elapsed:>9.2f} | {peak:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
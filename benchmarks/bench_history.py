@@ -0,0 +1,129 @@
+# Benchmark des Auswertungsverlaufs (history.py): füllt eine temporäre SQLite-Datenbank mit
+# --runs synthetischen Läufen (Länder x Stichtage, Kennzahlen je Klasse/Modul wie ein echter
+# Lauf) und misst Schreiben sowie typische Verlaufsabfragen. Prüft außerdem, dass die
+# Abfragen nur den abdeckenden Index lesen (EXPLAIN QUERY PLAN), sonst Exit-Code 1.
+# Nur Standardbibliothek, kein pandas nötig.
+#
+#   python benchmarks/bench_history.py --runs 100 1000 5000
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from history import SECTIONS, RunHistory  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+CLASSES = ["Klasse A", "Klasse B", "Klasse C"]
+MODULES = [f"Modul {i}" for i in range(1, 9)]
+COLUMNS = {
+    "time": ["Average Time Needed To Complete All Modules", "Min. Time Needed To Complete All Modules",
+             "Max. Time Needed To Complete All Modules", "Total Time Needed To Complete All Modules"],
+    "avg_acc": ["Average Accuracy (all modules)"],
+    "competence": ["Unconscious Incompetent", "Conscious Incompetent", "Unconscious Competent",
+                   "Conscious Competent", "Incompetent", "Competent"],
+    "acc_self": ["firm knowledge", "competent; training voluntary - no immediate need",
+                 "profits from re-training / webinar", "hands-on classroom training needed",
+                 ">69%", "<=69% - >50%", "<= 50%"],
+    "self_assessment": ["Novice", "Advanced beginner", "Competent", "Proficient", "Expert",
+                        "Professional", "Competent 2", "Beginner"],
+}
+
+
+# Zeilen eines synthetischen Laufs im Format von history.result_rows
+def synthetic_rows(rng: random.Random) -> list[tuple]:
+    rows = [("learners", "", "", float(rng.randint(50, 500)))]
+    for prefix, _, key_kind in SECTIONS.values():
+        for key in (CLASSES if key_kind == "class" else MODULES):
+            for column in COLUMNS[prefix]:
+                rows.append((f"{prefix}/{column}", key if key_kind == "class" else "",
+                             key if key_kind == "module" else "", rng.uniform(0, 100)))
+    for i in range(6):
+        rows.append((f"mcp/Wert {i}", "", "", float(rng.randint(0, 100))))
+    return rows
+
+
+# Median der Dauer einer Abfrage in ms (mehrere Wiederholungen)
+def time_query(fn, repeat: int = 20) -> float:
+    durations = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(durations)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Auswertungsverlauf (SQLite)")
+    parser.add_argument("--runs", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--countries", type=int, default=20)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    countries = [f"L{i:02d}" for i in range(args.countries)]
+    metric = "avg_acc/Average Accuracy (all modules)"
+    module_metric = "competence/Conscious Competent"
+
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "results": []}
+    failed = False
+    print(f"{'Läufe':>6} | {'Werte':>9} | {'Schreiben/Lauf [ms]':>19} | {'Land [ms]':>9} | "
+          f"{'Land+Modul [ms]':>15} | {'alle Länder [ms]':>16} | {'Kennzahlen [ms]':>15} | Index")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_runs in args.runs:
+            with RunHistory(Path(tmp) / f"history_{n_runs}.sqlite") as history:
+                start = date(2000, 1, 1)
+                t0 = time.perf_counter()
+                for i in range(n_runs):
+                    country = countries[i % len(countries)]
+                    run_date = start + timedelta(days=i // len(countries))
+                    history.record_rows(country, synthetic_rows(rng), run_date.isoformat())
+                write_ms = (time.perf_counter() - t0) * 1000 / n_runs
+                values = history._conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+
+                country_ms = time_query(lambda: history.trend(metric, country="L01"))
+                module_ms = time_query(lambda: history.trend(module_metric, country="L01",
+                                                             module="Modul 3"))
+                all_ms = time_query(lambda: history.trend(metric))
+                metrics_ms = time_query(history.metrics)
+
+                plan = " ".join(r[-1] for r in history._conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT run_date, country, class, module, value FROM metrics"
+                    " WHERE metric = ? AND cohort = ? AND country = ? ORDER BY run_date",
+                    (metric, "all", "L01")))
+                covering = "COVERING INDEX ix_metrics_trend" in plan
+                failed = failed or not covering
+
+            print(f"{n_runs:>6} | {values:>9} | {write_ms:>19.2f} | {country_ms:>9.2f} | "
+                  f"{module_ms:>15.2f} | {all_ms:>16.2f} | {metrics_ms:>15.2f} | "
+                  f"{'ja' if covering else 'NEIN'}")
+            report["results"].append({
+                "runs": n_runs,
+                "values": values,
+                "write_per_run_ms": write_ms,
+                "trend_country_ms": country_ms,
+                "trend_country_module_ms": module_ms,
+                "trend_all_countries_ms": all_ms,
+                "list_metrics_ms": metrics_ms,
+                "query_plan": plan,
+                "covering_index": covering,
+            })
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"history_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Benchmark des Learner-Index (learner_index.py) für die Suche in der GUI: baut den Index
+# einmal aus synthetischen Exporten (synthetic.py) und misst danach Abfragen wie im
+# Suchfenster – Learner je Modul, alle Learner eines Moduls, Namenssuche. Zum Vergleich
+# wird dieselbe Learner-Abfrage durch Filtern der Large Table gemessen (früher: in Excel).
+# Exit-Code 1, wenn das p95 einer Abfrage über --max-ms liegt.
+#
+#   python benchmarks/bench_learner_index.py --rows 100000 1000000 --max-ms 100
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from learner_index import LearnerIndex  # noqa: E402
+from loader import load_export, load_large_table  # noqa: E402
+from synthetic import SyntheticConfig, learners_for_rows, write_dataset  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# Dauer je Aufruf in ms für alle Argumente
+def timings(fn, args) -> list[float]:
+    durations = []
+    for arg in args:
+        t0 = time.perf_counter()
+        fn(arg)
+        durations.append((time.perf_counter() - t0) * 1000)
+    return durations
+
+
+def p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Learner-Index (Drill-down)")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--max-ms", type=float, default=100.0, help="Grenze für p95 je Abfrage")
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "results": []}
+    failed = False
+    print(f"{'Zeilen':>9} | {'Aufbau [s]':>10} | {'Abfrage':<20} | {'p50 [ms]':>8} | "
+          f"{'p95 [ms]':>8} | {'max [ms]':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            cfg = SyntheticConfig()
+            cfg.learners = learners_for_rows(rows, cfg)
+            paths = write_dataset(Path(tmp) / str(rows), cfg)
+            df_large = load_large_table(paths["large"])
+            df_self = load_export(paths["self"])
+
+            t0 = time.perf_counter()
+            index = LearnerIndex(df_large, df_self)
+            build_s = time.perf_counter() - t0
+
+            learners = [rng.choice(index.learners) for _ in range(args.queries)]
+            needles = [name[rng.randrange(len(name) // 2):][:4] for name in learners]
+            queries = {
+                "Learner": timings(index.learner, learners),
+                "Learner + Zusammenf.": timings(index.learner_summary, learners),
+                "Modul": timings(index.module, [rng.choice(index.modules) for _ in range(args.queries)]),
+                "Namenssuche": timings(index.search, needles),
+                # Vergleich: Filtern der ganzen Large Table je Anfrage
+                "Filter (ohne Index)": timings(
+                    lambda name: df_large[df_large["Learner"] == name], learners[:20]),
+            }
+
+            entry = {"rows": rows, "learners": len(index.learners), "index_rows": len(index),
+                     "build_s": build_s, "max_ms": args.max_ms, "queries": {}}
+            for name, values in queries.items():
+                stats = {"p50_ms": statistics.median(values), "p95_ms": p95(values), "max_ms": max(values)}
+                entry["queries"][name] = stats
+                if name != "Filter (ohne Index)" and stats["p95_ms"] > args.max_ms:
+                    failed = True
+                print(f"{rows:>9} | {build_s:>10.2f} | {name:<20} | {stats['p50_ms']:>8.2f} | "
+                      f"{stats['p95_ms']:>8.2f} | {stats['max_ms']:>8.2f}")
+            report["results"].append(entry)
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"learner_index_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+    if failed:
+        print(f"FEHLER: p95 einer Abfrage über {args.max_ms:.0f} ms")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
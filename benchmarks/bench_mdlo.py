@@ -0,0 +1,94 @@
+# Benchmark Most Difficult Learning Objectives: ganze Datei laden (load_export) gegen
+# blockweises Einlesen mit begrenzten Heaps (mdlo.load_mdlo). Gemessen werden Laufzeit und
+# Spitzen-Speicher (tracemalloc). Dass beide Varianten dieselben Top-N gesamt und je Modul
+# liefern (auch bei Gleichständen und fehlenden Werten), prüft tests/test_mdlo.py.
+#
+#   python benchmarks/bench_mdlo.py --rows 10000 100000 1000000 --top 5 10
+import argparse
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from loader import load_export  # noqa: E402
+from mdlo import load_mdlo, top_mdlo, top_mdlo_by_module  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# Synthetischer MDLO-Export (Semikolon, UTF-8 mit BOM wie aus dem LMS)
+def write_mdlo(path: Path, rows: int, modules: int, seed: int = 0):
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(["Module", "Learning Objective", "Unconsciously Incompetent", "Open in Curator"])
+        for i in range(rows):
+            value = "" if rng.random() < 0.01 else rng.randint(0, 200)
+            writer.writerow([f"Modul {rng.randint(1, modules)}", f"Lernziel {i}", value,
+                             f"https://curator.example/lo/{i}"])
+
+
+# Führt fn aus und misst Laufzeit und Spitzen-Speicher
+def measure(fn):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+
+def full(path, n):
+    df = load_export(path)
+    return top_mdlo(df, n), top_mdlo_by_module(df, n)
+
+
+def streaming(path, n):
+    df = load_mdlo(path, n)
+    return top_mdlo(df, n), top_mdlo_by_module(df, n)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark MDLO: ganze Datei gegen blockweise Top-N")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--top", type=int, nargs="+", default=[5])
+    parser.add_argument("--modules", type=int, default=12)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    report = {"timestamp": datetime.now().isoformat(timespec="seconds"), "results": []}
+    print(f"{'Zeilen':>9} | {'N':>3} | {'Datei [s]':>9} | {'Datei [MB]':>10} | "
+          f"{'Blockweise [s]':>14} | {'Blockweise [MB]':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"mdlo_{rows}.csv"
+            write_mdlo(path, rows, args.modules)
+            for n in args.top:
+                _, full_s, full_mb = measure(lambda: full(path, n))
+                _, stream_s, stream_mb = measure(lambda: streaming(path, n))
+                print(f"{rows:>9} | {n:>3} | {full_s:>9.2f} | {full_mb:>10.1f} | "
+                      f"{stream_s:>14.2f} | {stream_mb:>15.1f}")
+                report["results"].append({
+                    "rows": rows, "top": n, "modules": args.modules,
+                    "full_s": full_s, "full_peak_mb": full_mb,
+                    "streaming_s": stream_s, "streaming_peak_mb": stream_mb,
+                })
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"mdlo_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# Benchmark der gesamten Auswertung auf synthetischen Exporten (synthetic.py):
+# CSV-Laden (Large Table + übrige Exporte), jeder Abschnitt von compute_like (LIKE_STAGES)
+# und der Excel-Export. Ergebnisse landen als JSON in benchmarks/results/, damit Läufe
+# über die Zeit verglichen werden können.
+#
+#   python benchmarks/bench_pipeline.py --rows 1000 10000 100000 1000000 10000000
+#   python benchmarks/bench_pipeline.py --rows 100000 --repeat 3 -o results/mein_lauf.json
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from LIKE import compute_like  # noqa: E402
+from exporters import export_xlsx  # noqa: E402
+from loader import load_export, load_large_table  # noqa: E402
+from synthetic import SyntheticConfig, learners_for_rows, write_dataset  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# Laufzeit je Abschnitt über den Fortschritts-Callback von compute_like
+class StageTimer:
+    def __init__(self):
+        self.times = {}
+        self._stage = None
+        self._t0 = None
+
+    def __call__(self, stage: str):
+        self._stop()
+        self._stage, self._t0 = stage, time.perf_counter()
+
+    def _stop(self):
+        if self._stage is not None:
+            self.times[self._stage] = self.times.get(self._stage, 0.0) + time.perf_counter() - self._t0
+            self._stage = None
+
+    def finish(self) -> dict:
+        self._stop()
+        return self.times
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# Ein Durchlauf: Laden, Auswerten (je Abschnitt), Exportieren
+def run_once(paths: dict, out_path: Path) -> dict:
+    t0 = time.perf_counter()
+    df_large = load_large_table(paths["large"])
+    load_large_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    df_mcp = load_export(paths["mcp"])
+    df_self = load_export(paths["self"])
+    df_mdlo = load_export(paths["mdlo"])
+    load_exports_s = time.perf_counter() - t0
+
+    timer = StageTimer()
+    t0 = time.perf_counter()
+    result = compute_like(df_large, df_mcp, df_self, df_mdlo, progress=timer)
+    analysis_s = time.perf_counter() - t0
+    stages = timer.finish()
+
+    t0 = time.perf_counter()
+    export_xlsx(result, out_path)
+    export_s = time.perf_counter() - t0
+
+    return {
+        "rows_large": len(df_large),
+        "rows_self": len(df_self),
+        "completed_learners": result.amount_of_learners,
+        "load_large_s": load_large_s,
+        "load_exports_s": load_exports_s,
+        "analysis_s": analysis_s,
+        "stages_s": stages,
+        "export_s": export_s,
+        "total_s": load_large_s + load_exports_s + analysis_s + export_s,
+    }
+
+
+# Bester Lauf je Kennzahl (Minimum über die Wiederholungen)
+def best_of(runs: list[dict]) -> dict:
+    best = dict(runs[0])
+    for key, value in runs[0].items():
+        if key.endswith("_s"):
+            best[key] = min(r[key] for r in runs)
+    best["stages_s"] = {
+        stage: min(r["stages_s"].get(stage, 0.0) for r in runs) for stage in runs[0]["stages_s"]
+    }
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Laden / Auswertung / Export")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Zielzeilen der Large Table (bis 10_000_000)")
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--completion-rate", type=float, default=0.9)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git": _git_revision(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "results": [],
+    }
+
+    print(f"{'Zeilen':>9} | {'Laden [s]':>9} | {'Analyse [s]':>11} | {'Export [s]':>10} | {'Gesamt [s]':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            cfg = SyntheticConfig(modules=args.modules, classes=args.classes,
+                                  completion_rate=args.completion_rate)
+            cfg.learners = learners_for_rows(rows, cfg)
+            data_dir = Path(tmp) / str(rows)
+            paths = write_dataset(data_dir, cfg)
+
+            runs = [run_once(paths, data_dir / "LIKE.xlsx") for _ in range(args.repeat)]
+            best = best_of(runs)
+            report["results"].append({
+                "target_rows": rows,
+                "learners": cfg.learners,
+                "modules": cfg.modules,
+                "classes": cfg.classes,
+                "completion_rate": cfg.completion_rate,
+                "csv_bytes_large": paths["large"].stat().st_size,
+                "repeat": args.repeat,
+                **best,
+            })
+            print(f"{best['rows_large']:>9} | {best['load_large_s'] + best['load_exports_s']:>9.2f} | "
+                  f"{best['analysis_s']:>11.2f} | {best['export_s']:>10.2f} | {best['total_s']:>10.2f}")
+            for stage, seconds in best["stages_s"].items():
+                print(f"{'':>9}   {stage:<36} {seconds:>8.3f}")
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"pipeline_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Benchmark Startzeit der GUI: startet app.py (oder die PyInstaller-.exe) mehrfach mit
+# --startup-probe und misst die Zeit bis zum ersten gezeichneten Fenster – von außen
+# (Prozessstart bis Ende, bei --onefile inkl. Entpacken) und von innen (ab Import von app.py).
+# Schlägt fehl, wenn pandas & Co. schon vor dem Fenster geladen sind oder die Grenze
+# --max-seconds überschritten wird.
+#
+#   python benchmarks/bench_startup.py --runs 5
+#   python benchmarks/bench_startup.py --exe dist/LIKE_Tool.exe --runs 5 --max-seconds 4
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+# Ein Start: gibt (Zeit von außen, Probe-Daten) zurück
+def run_once(command: list[str], probe: Path, timeout: float) -> tuple[float, dict]:
+    probe.unlink(missing_ok=True)
+    t0 = time.perf_counter()
+    subprocess.run(command + ["--startup-probe", str(probe)], cwd=ROOT, timeout=timeout, check=True)
+    outside = time.perf_counter() - t0
+    return outside, json.loads(probe.read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Startzeit der GUI")
+    parser.add_argument("--exe", help="Pfad zur gebauten LIKE_Tool.exe (Standard: python app.py)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--max-seconds", type=float,
+                        help="Grenze für den Median (von außen); darüber Exit-Code 1")
+    parser.add_argument("-o", "--output", help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    command = [args.exe] if args.exe else [sys.executable, str(ROOT / "app.py")]
+
+    outside, inside, heavy = [], [], set()
+    with tempfile.TemporaryDirectory() as tmp:
+        probe = Path(tmp) / "probe.json"
+        for i in range(args.runs):
+            t_out, data = run_once(command, probe, args.timeout)
+            outside.append(t_out)
+            inside.append(data["window_s"])
+            heavy.update(data["heavy_modules_loaded"])
+            print(f"Lauf {i + 1}: außen {t_out:6.2f} s | Fenster nach {data['window_s']:6.2f} s")
+
+    summary = {
+        "command": command,
+        "runs": args.runs,
+        "outside_median_s": round(statistics.median(outside), 4),
+        "outside_min_s": round(min(outside), 4),
+        "window_median_s": round(statistics.median(inside), 4),
+        "heavy_modules_loaded": sorted(heavy),
+    }
+    print(f"\nMedian außen: {summary['outside_median_s']:.2f} s | "
+          f"Median Fenster: {summary['window_median_s']:.2f} s")
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    failed = False
+    if heavy:
+        print(f"FEHLER: vor dem ersten Fenster geladen: {', '.join(sorted(heavy))}")
+        failed = True
+    if args.max_seconds is not None and summary["outside_median_s"] > args.max_seconds:
+        print(f"FEHLER: Median {summary['outside_median_s']:.2f} s > {args.max_seconds:.2f} s")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
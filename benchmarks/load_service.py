@@ -0,0 +1,198 @@
+# Lasttest des lokalen Dienstes (service.py): schickt --requests Aufträge mit --concurrency
+# parallelen Clients (hochladen, Status abfragen, Excel abholen) und misst die Latenz je
+# Auftrag von außen. Ausgegeben werden Durchsatz (Aufträge/s), p50/p95/max und die Anzahl
+# abgewiesener (503) bzw. fehlgeschlagener Aufträge.
+# Ohne --url wird eine eigene Instanz auf einem freien Port gestartet.
+#
+#   python benchmarks/load_service.py --requests 40 --concurrency 8 --learners 2000
+#   python benchmarks/load_service.py --url http://127.0.0.1:8765 --requests 100
+import argparse
+import json
+import math
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from synthetic import SyntheticConfig, write_dataset  # noqa: E402
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# multipart/form-data-Body aus Dateien (Feldname -> Pfad) und Feldern
+def encode_multipart(files: dict, fields: dict | None = None) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in (fields or {}).items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                     f"{value}\r\n".encode("utf-8"))
+    for name, path in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                     f'filename="{Path(path).name}"\r\nContent-Type: text/csv\r\n\r\n'.encode("utf-8"))
+        parts.append(Path(path).read_bytes() + b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def _request(url: str, data=None, headers=None, method=None, timeout=600):
+    req = urllib.request.Request(url, data=data, headers=headers or {}, method=method)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.status, resp.read()
+
+
+# Ein Auftrag von außen: hochladen, bis fertig abfragen, Excel abholen, löschen.
+# Gibt (Status, Latenz in s) zurück; Status "ok", "abgewiesen" oder "fehler: …"
+def run_job(base: str, body: bytes, content_type: str, poll_s: float) -> tuple[str, float]:
+    t0 = time.perf_counter()
+    try:
+        _, data = _request(f"{base}/jobs", body, {"Content-Type": content_type}, "POST")
+    except urllib.error.HTTPError as e:
+        if e.code == 503:
+            return "abgewiesen", time.perf_counter() - t0
+        return f"fehler: {e.code} {e.read().decode('utf-8', 'replace')}", time.perf_counter() - t0
+    job_id = json.loads(data)["id"]
+    while True:
+        _, data = _request(f"{base}/jobs/{job_id}")
+        status = json.loads(data)
+        if status["status"] in ("done", "failed"):
+            break
+        time.sleep(poll_s)
+    if status["status"] == "failed":
+        return f"fehler: {status.get('error')}", time.perf_counter() - t0
+    _request(f"{base}/jobs/{job_id}/result")
+    latency = time.perf_counter() - t0
+    _request(f"{base}/jobs/{job_id}", method="DELETE")
+    return "ok", latency
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# Startet service.py und wartet, bis /health antwortet
+def start_service(workers: int, max_queued: int) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    proc = subprocess.Popen([sys.executable, str(ROOT / "service.py"), "--port", str(port),
+                             "-w", str(workers), "--max-queued", str(max_queued)], cwd=ROOT)
+    base = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while True:
+        try:
+            _request(f"{base}/health", timeout=2)
+            return proc, base
+        except OSError:
+            if proc.poll() is not None or time.time() > deadline:
+                proc.kill()
+                raise SystemExit("Dienst startet nicht")
+            time.sleep(0.2)
+
+
+# Perzentil nach dem Nearest-Rank-Verfahren
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+    return ordered[k]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lasttest des LIKE-Dienstes")
+    parser.add_argument("--url", help="Laufende Instanz (Standard: eigene starten)")
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--learners", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=2, help="Prozesse der eigenen Instanz")
+    parser.add_argument("--max-queued", type=int, default=8, help="Warteschlange der eigenen Instanz")
+    parser.add_argument("--poll", type=float, default=0.1, help="Abfrageintervall des Status")
+    parser.add_argument("-o", "--output", help="JSON-Datei (Standard: benchmarks/results/<Zeit>.json)")
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.url:
+        base = args.url.rstrip("/")
+    else:
+        proc, base = start_service(args.workers, args.max_queued)
+
+    results = []
+    lock = threading.Lock()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_dataset(Path(tmp), SyntheticConfig(learners=args.learners))
+            body, content_type = encode_multipart(paths)
+
+            remaining = iter(range(args.requests))
+
+            def client():
+                while True:
+                    with lock:
+                        if next(remaining, None) is None:
+                            return
+                    outcome = run_job(base, body, content_type, args.poll)
+                    with lock:
+                        results.append(outcome)
+
+            t0 = time.perf_counter()
+            threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            wall = time.perf_counter() - t0
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=60)
+
+    latencies = [lat for status, lat in results if status == "ok"]
+    errors = [status for status, _ in results if status.startswith("fehler")]
+    summary = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "url": base if args.url else "eigene Instanz",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "learners": args.learners,
+        "upload_mb": round(len(body) / 1024 / 1024, 2),
+        "ok": len(latencies),
+        "rejected": sum(1 for status, _ in results if status == "abgewiesen"),
+        "failed": len(errors),
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(latencies) / wall, 3) if wall else 0.0,
+    }
+    if latencies:
+        summary.update({
+            "p50_s": round(statistics.median(latencies), 3),
+            "p95_s": round(percentile(latencies, 95), 3),
+            "max_s": round(max(latencies), 3),
+        })
+
+    print(f"{summary['ok']}/{args.requests} ok, {summary['rejected']} abgewiesen, "
+          f"{summary['failed']} fehlgeschlagen in {wall:.1f} s")
+    print(f"Durchsatz: {summary['throughput_per_s']:.2f} Aufträge/s")
+    if latencies:
+        print(f"Latenz p50 {summary['p50_s']:.2f} s | p95 {summary['p95_s']:.2f} s | "
+              f"max {summary['max_s']:.2f} s")
+    for error in errors[:5]:
+        print(f"    {error}")
+
+    out = Path(args.output) if args.output else \
+        RESULTS_DIR / f"service_{datetime.now():%Y%m%d_%H%M%S}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nErgebnisse: {out}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
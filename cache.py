@@ -0,0 +1,141 @@
+# Lokaler Cache für eingelesene CSV-Exporte (Parquet), Schlüssel = Dateiinhalt + Loader-Version
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from loader import LOADER_VERSION
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GB
+
+
+# Standard-Cacheverzeichnis (Windows: %LOCALAPPDATA%, sonst ~/.cache)
+def _default_cache_dir() -> Path:
+    base = os.environ.get("LOCALAPPDATA")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "LIKE_Tool" / "cache"
+
+
+# Prüft, ob pyarrow für Parquet verfügbar ist
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Bereits berechnete Hashes je (Pfad, mtime, Größe) – Cache und Ergebnisspeicher hashen
+# dieselben Dateien, große Exporte werden so nur einmal gelesen
+_hash_memo: dict[tuple[str, int, int], str] = {}
+_hash_lock = threading.Lock()
+
+
+# Hash über den Dateiinhalt (blockweise, damit große Dateien nicht im Speicher landen)
+def file_hash(path, block_size: int = 1024 * 1024) -> str:
+    st = os.stat(path)
+    memo_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _hash_lock:
+        hit = _hash_memo.get(memo_key)
+    if hit is not None:
+        return hit
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            h.update(block)
+    with _hash_lock:
+        _hash_memo[memo_key] = h.hexdigest()
+    return h.hexdigest()
+
+
+class ParquetCache:
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.max_bytes = max_bytes
+        self.enabled = _parquet_available()
+
+    # Dateiname im Cache für eine Eingabedatei und Einleseart (z.B. "large")
+    def _entry_path(self, path, kind: str) -> Path:
+        key = f"{file_hash(path)}-{kind}-v{LOADER_VERSION}"
+        return self.cache_dir / f"{key}.parquet"
+
+    # Liest einen Cache-Eintrag oder gibt None zurück
+    def _read(self, entry: Path) -> pd.DataFrame | None:
+        if not entry.exists():
+            return None
+        try:
+            df = pd.read_parquet(entry)
+        except Exception:
+            entry.unlink(missing_ok=True)
+            return None
+        # Zugriffszeit für LRU aktualisieren
+        os.utime(entry)
+        return df
+
+    # Schreibt einen Cache-Eintrag (Fehler beim Schreiben werden ignoriert). Eigene temporäre
+    # Datei je Schreibvorgang: schreiben mehrere Prozesse (Stapel-Worker, GUI und Dienst)
+    # denselben Eintrag, ersetzt jeder ihn mit einer vollständigen Datei
+    def _write(self, entry: Path, df: pd.DataFrame):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, prefix=f"{entry.stem}-", suffix=".tmp")
+        os.close(fd)
+        tmp = Path(tmp)
+        try:
+            df.to_parquet(tmp, index=False)
+            os.replace(tmp, entry)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    # Gibt den gecachten DataFrame zurück oder None
+    def get(self, path, kind: str) -> pd.DataFrame | None:
+        if not self.enabled:
+            return None
+        return self._read(self._entry_path(path, kind))
+
+    # Legt einen DataFrame im Cache ab
+    def put(self, path, kind: str, df: pd.DataFrame):
+        if self.enabled:
+            self._write(self._entry_path(path, kind), df)
+
+    # Lädt aus dem Cache oder über load_fn und legt das Ergebnis ab
+    # (der Dateihash wird dabei nur einmal berechnet)
+    def load(self, path, kind: str, load_fn) -> pd.DataFrame:
+        if not self.enabled:
+            return load_fn(path)
+        entry = self._entry_path(path, kind)
+        df = self._read(entry)
+        if df is None:
+            df = load_fn(path)
+            self._write(entry, df)
+        return df
+
+    # Entfernt die am längsten nicht genutzten Einträge, bis max_bytes eingehalten wird
+    def _evict(self):
+        entries = [(e, e.stat()) for e in self.cache_dir.glob("*.parquet")]
+        total = sum(st.st_size for _, st in entries)
+        for entry, st in sorted(entries, key=lambda x: x[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= st.st_size
+
+    # Gesamtgröße des Caches in Bytes
+    def size(self) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        return sum(e.stat().st_size for e in self.cache_dir.glob("*.parquet"))
+
+    # Löscht alle Einträge; gibt die Anzahl gelöschter Dateien zurück
+    def clear(self) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for entry in self.cache_dir.glob("*.parquet"):
+            entry.unlink(missing_ok=True)
+            removed += 1
+        return removed
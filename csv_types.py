@@ -0,0 +1,105 @@
+# Erkennung der vier Exporttypen anhand des CSV-Headers (ohne GUI-Abhängigkeiten)
+import csv
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Liest den Header einer CSV-Datei und gibt ihn als Set zurück
+def read_csv_header(path: str) -> set[str]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter=";")
+        header = next(reader)
+    return {h.strip().lower() for h in header if h and h.strip()}
+
+
+# Signaturen (aus .csv Headern)
+SIG_LARGE = {
+    "completion status", "sum time spent", "accuracy-classes",
+    "unconscious incompetent", "conscious incompetent",
+    "unconscious competent", "conscious competent",
+}
+
+SIG_MCP = {
+    "initial conscious competence", "initial unconscious competence",
+    "improvement conscious competence", "improvement unconscious incompetence",
+    "current conscious competence", "current unconscious competence",
+}
+
+SIG_SELF = {
+    "self assessment", "average progress", "time", "correct", "wrong", "accuracy",
+}
+
+SIG_MDLO = {
+    "learning objective", "unconsciously incompetent", "wrong answers", "open in curator",
+}
+
+
+# Erkennt den CSV-Typ basierend auf dem Header
+def detect_csv_type_by_header(path: str) -> tuple[str | None, str]:
+    cols = read_csv_header(path)
+
+    # Large Table
+    if {"learner", "module", "completion status"}.issubset(cols) and len(SIG_LARGE & cols) >= 4:
+        return "large", "Header-Signatur: Large Table"
+
+    # MCP
+    if {"class name", "progress"}.issubset(cols) and len(SIG_MCP & cols) >= 4:
+        return "mcp", "Header-Signatur: Metacognition Progress"
+
+    # Self Assessment
+    if {"learner", "module", "self assessment"}.issubset(cols) and len(SIG_SELF & cols) >= 4:
+        return "self", "Header-Signatur: Self-Assessment"
+
+    # MDLO
+    if {"module", "learning objective"}.issubset(cols) and len(SIG_MDLO & cols) >= 3:
+        return "mdlo", "Header-Signatur: MDLO"
+
+    return None, f"Unbekannter CSV-Header. Gefundene Spalten (Auszug): {', '.join(sorted(list(cols))[:8])}..."
+
+
+# Ergebnisse der Header-Erkennung je (Pfad, mtime, Größe) – eine geänderte Datei wird neu gelesen
+_classification_cache: dict[tuple[str, int, int], tuple[str | None, str]] = {}
+_classification_lock = threading.Lock()
+
+
+# Wie detect_csv_type_by_header, aber mit Cache
+def detect_csv_type_cached(path: str) -> tuple[str | None, str]:
+    st = os.stat(path)
+    cache_key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    with _classification_lock:
+        hit = _classification_cache.get(cache_key)
+    if hit is not None:
+        return hit
+    result = detect_csv_type_by_header(path)
+    with _classification_lock:
+        _classification_cache[cache_key] = result
+    return result
+
+
+# Erweitert Ordner zu allen enthaltenen CSV-Dateien (rekursiv), Dateien bleiben unverändert
+def expand_csv_paths(paths: list[str]) -> list[str]:
+    result = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                result.extend(
+                    os.path.join(root, f) for f in sorted(files) if f.lower().endswith(".csv"))
+        else:
+            result.append(path)
+    return result
+
+
+# Erkennt den Typ mehrerer Dateien parallel (Header-Lesen ist I/O-gebunden, z.B. Netzlaufwerke).
+# Ergebnis je Pfad: (key, reason) oder die beim Lesen aufgetretene Exception
+def classify_paths(paths: list[str], max_workers: int = 8) -> dict[str, tuple[str | None, str] | Exception]:
+    def classify(path):
+        try:
+            return detect_csv_type_cached(path)
+        except Exception as e:
+            return e
+
+    if not paths:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return dict(zip(paths, pool.map(classify, paths)))
@@ -0,0 +1,281 @@
+# Export eines LikeResult (aus LIKE.compute_like) in Dateien mit explizitem Zielpfad
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from LIKE import LikeResult
+from schema import DEFAULT_TOP_N
+
+# Tabellenblätter in Reihenfolge der Excel-Datei
+SHEET_NAMES = [
+    "Participants Completed",
+    "Time Needed",
+    "Avg Accuracy",
+    "Metacognition Progress",
+    "Accuracy Per Module",
+    "Self Assessment Per Module",
+    "Competence Level Per Module",
+]
+
+
+# Blatt der Top-N gesamt (nach den Blättern oben). Schreibweise wie bisher ("Dfficult"):
+# Makros und Vorlagen suchen das Blatt beim Standard-N unter diesem Namen; ohne bekanntes N
+# (ältere Ergebnisse) gilt das Standard-N
+def mdlo_sheet_name(n: int | None) -> str:
+    return f"{n or DEFAULT_TOP_N} Most Dfficult Objectives"
+
+
+# Top-N je Modul (nach den Blättern oben, nur wenn berechnet)
+MDLO_MODULE_SHEET_NAME = "Difficult Objectives By Module"
+
+# Optionales Blatt mit dem Laufzeitprofil (siehe profiling.py)
+STATS_SHEET_NAME = "Run Stats"
+
+
+# Excel-Zahlenformate für den numerischen Export. Dezimal- und Tausendertrennzeichen
+# setzt Excel gemäß Gebietsschema des Nutzers (deutsch: "12,50 %").
+PERCENT_FORMAT = "0.00%"
+PERCENT_INT_FORMAT = "0%"
+DURATION_FORMAT = '[h]"h" m"m"'
+
+
+# Standard-Dateiname mit heutigem Datum
+def default_filename() -> str:
+    today_str = datetime.now().strftime("%Y%m%d")
+    return f"{today_str}_Like_Auswertung.xlsx"
+
+
+# Freier Pfad für eine neue Auswertung: vorhandene Dateien werden nicht überschrieben,
+# stattdessen entstehen "..._Like_Auswertung_2.xlsx", "_3" usw. (auch für die .pptx daneben)
+def versioned_path(path) -> Path:
+    path = Path(path)
+    candidate, n = path, 1
+    while any(candidate.with_suffix(s).exists() for s in (".xlsx", ".pptx")):
+        n += 1
+        candidate = path.with_name(f"{path.stem}_{n}{path.suffix}")
+    return candidate
+
+
+# Sekunden in "Xh Ym" umwandeln (angebrochene Minuten werden abgeschnitten)
+def format_hm(seconds) -> str:
+    total_minutes = int(seconds // 60)
+    h = total_minutes // 60
+    m = total_minutes % 60
+    return f"{h}h {m}m"
+
+
+# Vektorisierte Variante von format_hm für eine ganze Spalte
+def format_hm_series(seconds: pd.Series) -> pd.Series:
+    total_minutes = (seconds // 60).astype("int64")
+    return (total_minutes // 60).astype(str) + "h " + (total_minutes % 60).astype(str) + "m"
+
+
+# Zahl als deutscher Prozent-String ("12,5%")
+def format_percent(series: pd.Series) -> pd.Series:
+    return series.astype(str).str.replace(".", ",") + "%"
+
+
+# Formatiert alle Abschnitte als Tabellenblätter (Texte wie in der bisherigen Excel-Datei)
+def format_sheets(result: LikeResult) -> dict[str, pd.DataFrame]:
+    df_amount_of_learners = pd.DataFrame(
+        {
+            "Description": ["Amount Of Participants Who Completed All Modules"],
+            "Value": [result.amount_of_learners],
+        }
+    )
+
+    df_time = result.time_seconds.copy()
+    for col in df_time.columns:
+        if col == "Class Description":
+            continue
+        df_time[col] = format_hm_series(df_time[col])
+
+    df_avg_acc = result.avg_acc.copy()
+    df_avg_acc["Average Accuracy (all modules)"] = format_percent(
+        df_avg_acc["Average Accuracy (all modules)"])
+
+    df_mcp = result.mcp.copy()
+    df_mcp["Value"] = format_percent(df_mcp["Value"])
+
+    # Für alle relevanten Spalten (außer "Module") im DataFrame:
+    per_module = []
+    for df in (result.acc_of_self_assessment, result.self_assessment, result.competence_by_module):
+        df = df.copy()
+        for col in df.columns:
+            if col == "Module":
+                continue
+            df[col] = format_percent(df[col])
+        per_module.append(df)
+
+    sheets = dict(zip(SHEET_NAMES, [
+        df_amount_of_learners,
+        df_time,
+        df_avg_acc,
+        df_mcp,
+        *per_module,
+    ]))
+    sheets[mdlo_sheet_name(result.mdlo_top)] = result.mdlo
+    if result.mdlo_by_module is not None:
+        sheets[MDLO_MODULE_SHEET_NAME] = result.mdlo_by_module
+    return sheets
+
+
+# Tabellenblätter mit echten Zahlen statt Texten, dazu die Excel-Zahlenformate je Spalte.
+# Prozentwerte werden als Anteil (12,5 % -> 0.125) abgelegt, Zeiten als Bruchteil eines Tages,
+# damit Excel damit rechnen kann.
+def numeric_sheets(result: LikeResult) -> tuple[dict[str, pd.DataFrame], dict[str, dict[str, str]]]:
+    df_amount_of_learners = pd.DataFrame(
+        {
+            "Description": ["Amount Of Participants Who Completed All Modules"],
+            "Value": [result.amount_of_learners],
+        }
+    )
+
+    df_time = result.time_seconds.copy()
+    time_cols = [c for c in df_time.columns if c != "Class Description"]
+    df_time[time_cols] = df_time[time_cols] / 86400
+
+    df_avg_acc = result.avg_acc.copy()
+    df_avg_acc["Average Accuracy (all modules)"] = df_avg_acc["Average Accuracy (all modules)"] / 100
+
+    df_mcp = result.mcp.copy()
+    df_mcp["Value"] = df_mcp["Value"] / 100
+
+    per_module = []
+    per_module_formats = []
+    for df in (result.acc_of_self_assessment, result.self_assessment, result.competence_by_module):
+        pct_cols = [c for c in df.columns if c != "Module"]
+        df = df.copy()
+        df[pct_cols] = df[pct_cols] / 100
+        per_module.append(df)
+        per_module_formats.append({c: PERCENT_FORMAT for c in pct_cols})
+
+    sheets = dict(zip(SHEET_NAMES, [
+        df_amount_of_learners,
+        df_time,
+        df_avg_acc,
+        df_mcp,
+        *per_module,
+    ]))
+    sheets[mdlo_sheet_name(result.mdlo_top)] = result.mdlo
+    formats = dict(zip(SHEET_NAMES, [
+        {},
+        {c: DURATION_FORMAT for c in time_cols},
+        {"Average Accuracy (all modules)": PERCENT_FORMAT},
+        {"Value": PERCENT_INT_FORMAT},
+        *per_module_formats,
+    ]))
+    if result.mdlo_by_module is not None:
+        sheets[MDLO_MODULE_SHEET_NAME] = result.mdlo_by_module
+    return sheets, formats
+
+
+# Spaltenbreiten direkt aus dem DataFrame: längster Text je Spalte (inkl. Überschrift) + 2,
+# mindestens 10 – wie die frühere Anpassung nach dem Neuladen der Datei.
+# Spalten mit Zahlenformat (formatted) werden nur nach der Überschrift bemessen,
+# die formatierte Anzeige passt in die Mindestbreite.
+def column_widths(df: pd.DataFrame, formatted=()) -> list[int]:
+    widths = []
+    for i, col in enumerate(df.columns):
+        values = df.iloc[:, i].dropna()
+        max_length = len(str(col))
+        if len(values) and col not in formatted:
+            max_length = max(max_length, int(values.astype(str).str.len().max()))
+        widths.append(max(max_length + 2, 10))
+    return widths
+
+
+# Schreibt einen DataFrame in ein Write-Only-Tabellenblatt (Kopfzeile wie bei pandas).
+# number_formats: optionale Excel-Zahlenformate je Spaltenname
+def _write_sheet(wb, sheet_name: str, df: pd.DataFrame, number_formats=None):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+    from openpyxl.utils import get_column_letter
+
+    number_formats = number_formats or {}
+    ws = wb.create_sheet(title=sheet_name)
+    # Spaltenbreiten müssen vor der ersten Zeile gesetzt werden
+    for idx, width in enumerate(column_widths(df, number_formats), start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+
+    thin = Side(style="thin")
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=str(col))
+        cell.font = Font(bold=True)
+        cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cell.alignment = Alignment(horizontal="center", vertical="top")
+        header.append(cell)
+    ws.append(header)
+
+    # Spaltenweise in Python-Objekte umwandeln, fehlende Werte -> leere Zelle
+    columns = [
+        df.iloc[:, i].astype(object).where(df.iloc[:, i].notna(), None).tolist()
+        for i in range(df.shape[1])
+    ]
+    if not number_formats:
+        for row in zip(*columns):
+            ws.append(row)
+        return
+
+    # Formatierte Spalten brauchen eigene Zellen mit Zahlenformat
+    fmt_by_idx = [number_formats.get(col) for col in df.columns]
+
+    def styled(value, fmt):
+        if fmt is None or value is None:
+            return value
+        cell = WriteOnlyCell(ws, value=value)
+        cell.number_format = fmt
+        return cell
+
+    for row in zip(*columns):
+        ws.append([styled(v, fmt) for v, fmt in zip(row, fmt_by_idx)])
+
+
+# Schreibt die Excel-Auswertung in einem Durchgang nach path (Write-Only, ohne Neuladen).
+# numeric=True: Zahlen mit Excel-Prozent-/Zeitformaten statt deutscher Texte ("12,5%")
+def export_xlsx(result: LikeResult, path, progress=None, numeric: bool = False,
+                profile=None, stats_sheet: bool = False) -> Path:
+    from openpyxl import Workbook
+
+    report = progress if progress is not None else (lambda stage: None)
+    if profile is not None:
+        report = profile.track(report)
+    path = Path(path)
+
+    report("Formatierung")
+    if numeric:
+        sheets, formats = numeric_sheets(result)
+    else:
+        sheets, formats = format_sheets(result), {}
+
+    report("Excel-Export")
+    wb = Workbook(write_only=True)
+    # Schreibe mehrere DataFrames auf separate Tabellenblätter
+    for sheet_name, df in sheets.items():
+        _write_sheet(wb, sheet_name, df, formats.get(sheet_name))
+    if profile is not None and stats_sheet:
+        # enthält alle bis hierhin beendeten Abschnitte (Laden, Analyse, Formatierung);
+        # der laufende Excel-Export selbst steht nur im Profil-Objekt bzw. JSON-Log
+        _write_sheet(wb, STATS_SHEET_NAME, profile.to_frame())
+    wb.save(path)
+    if profile is not None:
+        profile.stop()
+    return path
+
+
+# Schreibt die numerischen Ergebnisse als JSON (ein Objekt je Abschnitt, Zeilen als Records)
+def export_json(result: LikeResult, path) -> Path:
+    path = Path(path)
+    data = {"amount_of_learners": result.amount_of_learners}
+    for field in ("time_seconds", "avg_acc", "mcp", "acc_of_self_assessment",
+                  "self_assessment", "competence_by_module", "mdlo", "mdlo_by_module"):
+        df = getattr(result, field)
+        if df is None:
+            continue
+        data[field] = json.loads(df.to_json(orient="records", force_ascii=False))
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
@@ -0,0 +1,300 @@
+# Verlauf aller Auswertungen in einer lokalen SQLite-Datenbank: je Lauf (Land + Datum) die
+# Zahlen der Abschnitte (Teilnehmer, Zeiten, Genauigkeit, Metacognition Progress, Kompetenz-
+# und Selbsteinschätzungs-Verteilungen je Modul). So lassen sich Kennzahlen über Quartale
+# vergleichen, ohne viele Excel-Dateien zu öffnen.
+#
+#   python history.py metrics [Suchtext]
+#   python history.py trend avg_acc --country CZ
+#   python history.py trend "competence/Conscious Competent" --module "Modul 3" --since 2024-01-01
+#   python history.py runs --country CZ
+#
+# Ein Lauf je Land, Datum und Kohorte der Selbsteinschätzung: wird am selben Tag mit derselben
+# Kohorte erneut ausgewertet, ersetzt er den alten Lauf; ein Lauf mit cohort="completed"
+# überschreibt also nicht den mit cohort="all". Trendabfragen zeigen standardmäßig nur
+# cohort="all" (--cohort completed für die andere Reihe).
+# Kennzahlen liegen im Langformat (Kennzahl, Kohorte, Land, Klasse, Modul, Datum, Wert) unter
+# einem abdeckenden Index -> Verlaufsabfragen lesen nur den Index, auch bei tausenden Läufen.
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+from result_store import ANALYSIS_VERSION
+from schema import DEFAULT_TOP_N
+
+SCHEMA_VERSION = 1
+
+# Standard-Kohorte wie LIKE.DEFAULT_COHORT (ohne pandas zu importieren)
+DEFAULT_COHORT = "all"
+
+# mdlo_top ist nur Angabe zum Lauf: die gespeicherten Kennzahlen enthalten keine MDLO
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    country TEXT NOT NULL,
+    run_date TEXT NOT NULL,
+    recorded TEXT NOT NULL,
+    learners INTEGER,
+    analysis_version INTEGER,
+    source TEXT,
+    cohort TEXT NOT NULL DEFAULT '{DEFAULT_COHORT}',
+    mdlo_top INTEGER NOT NULL DEFAULT {DEFAULT_TOP_N},
+    UNIQUE (country, run_date, cohort)
+);
+-- Land, Datum und Kohorte stehen zusätzlich hier, damit der Index die Abfrage allein beantwortet
+CREATE TABLE IF NOT EXISTS metrics (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    metric TEXT NOT NULL,
+    country TEXT NOT NULL,
+    class TEXT NOT NULL DEFAULT '',
+    module TEXT NOT NULL DEFAULT '',
+    run_date TEXT NOT NULL,
+    value REAL,
+    cohort TEXT NOT NULL DEFAULT '{DEFAULT_COHORT}'
+);
+CREATE INDEX IF NOT EXISTS ix_metrics_trend
+    ON metrics (metric, cohort, country, class, module, run_date, value);
+CREATE INDEX IF NOT EXISTS ix_metrics_run ON metrics (run_id);
+"""
+
+# Abschnitte des LikeResult: Attribut -> (Präfix der Kennzahl, Schlüsselspalte, Art des Schlüssels)
+SECTIONS = {
+    "time_seconds": ("time", "Class Description", "class"),
+    "avg_acc": ("avg_acc", "Class Description", "class"),
+    "competence_by_module": ("competence", "Module", "module"),
+    "acc_of_self_assessment": ("acc_self", "Module", "module"),
+    "self_assessment": ("self_assessment", "Module", "module"),
+}
+
+
+# Standard-Speicherort neben Cache und Ergebnisspeicher
+def default_history_path() -> Path:
+    base = os.environ.get("LOCALAPPDATA")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "LIKE_Tool" / "history.sqlite"
+
+
+# Kennzahlen eines LikeResult als Zeilen (Kennzahl, Klasse, Modul, Wert)
+def result_rows(result) -> list[tuple[str, str, str, float]]:
+    rows = [("learners", "", "", float(result.amount_of_learners))]
+    for attr, (prefix, key_column, key_kind) in SECTIONS.items():
+        df = getattr(result, attr)
+        if key_column not in df.columns:
+            continue
+        value_columns = [c for c in df.columns if c != key_column]
+        for record in df.to_dict("records"):
+            key = str(record[key_column])
+            for column in value_columns:
+                value = record[column]
+                if value is None or value != value:  # NaN
+                    continue
+                rows.append((f"{prefix}/{column}",
+                             key if key_kind == "class" else "",
+                             key if key_kind == "module" else "",
+                             float(value)))
+    for description, value in zip(result.mcp["Description"], result.mcp["Value"]):
+        if value == value:  # NaN: MCP-Export ohne Zeile der Kohorte
+            rows.append((f"mcp/{description}", "", "", float(value)))
+    return rows
+
+
+class RunHistory:
+    def __init__(self, db_path=None):
+        self.db_path = Path(db_path) if db_path else default_history_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # mehrere Prozesse (Stapelauswertung) schreiben gleichzeitig -> WAL + Wartezeit
+        self._conn = sqlite3.connect(self.db_path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            # executescript bestätigt offene Transaktionen selbst -> BEGIN/COMMIT im Skript
+            self._conn.executescript(
+                f"BEGIN;{SCHEMA}PRAGMA user_version={SCHEMA_VERSION}; COMMIT;")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Speichert einen Lauf aus fertigen Zeilen (siehe result_rows); ersetzt einen
+    # vorhandenen Lauf desselben Landes am selben Datum mit derselben Kohorte (cohort wie bei
+    # compute_like, mdlo_top wird nur beim Lauf vermerkt). Gibt die Lauf-ID zurück
+    def record_rows(self, country: str, rows, run_date=None, learners: int | None = None,
+                    source: str | None = None, cohort: str = DEFAULT_COHORT,
+                    mdlo_top: int = DEFAULT_TOP_N) -> int:
+        run_date = str(run_date or date.today().isoformat())
+        key = (country, run_date, cohort)
+        with self._conn:
+            old = self._conn.execute(
+                "SELECT id FROM runs WHERE country = ? AND run_date = ? AND cohort = ?", key
+            ).fetchone()
+            if old:
+                self._conn.execute("DELETE FROM metrics WHERE run_id = ?", old)
+                self._conn.execute("DELETE FROM runs WHERE id = ?", old)
+            run_id = self._conn.execute(
+                "INSERT INTO runs (country, run_date, cohort, mdlo_top, recorded, learners,"
+                " analysis_version, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                key + (mdlo_top, time.strftime("%Y-%m-%dT%H:%M:%S"), learners, ANALYSIS_VERSION,
+                       source),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO metrics (run_id, metric, country, class, module, run_date, value,"
+                " cohort) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((run_id, metric, country, cls, module, run_date, value, cohort)
+                 for metric, cls, module, value in rows),
+            )
+        return run_id
+
+    # Speichert ein LikeResult (aus LIKE.compute_like mit denselben cohort/mdlo_top)
+    def record(self, result, country: str, run_date=None, source: str | None = None,
+               cohort: str = DEFAULT_COHORT, mdlo_top: int = DEFAULT_TOP_N) -> int:
+        return self.record_rows(country, result_rows(result), run_date,
+                                learners=int(result.amount_of_learners), source=source,
+                                cohort=cohort, mdlo_top=mdlo_top)
+
+    # Alle gespeicherten Kennzahlen (optional nur solche, die den Suchtext enthalten)
+    def metrics(self, search: str | None = None) -> list[str]:
+        # Sprung von Kennzahl zu Kennzahl über den Index statt alle Zeilen zu lesen
+        names = [r[0] for r in self._conn.execute(
+            "WITH RECURSIVE m(name) AS ("
+            " SELECT MIN(metric) FROM metrics"
+            " UNION ALL SELECT (SELECT MIN(metric) FROM metrics WHERE metric > m.name)"
+            " FROM m WHERE m.name IS NOT NULL)"
+            " SELECT name FROM m WHERE name IS NOT NULL")]
+        if search:
+            names = [n for n in names if search.lower() in n.lower()]
+        return names
+
+    # Kennzahl aus Suchtext: exakter Name oder eindeutiger Teil davon
+    def resolve_metric(self, search: str) -> str:
+        names = self.metrics()
+        if search in names:
+            return search
+        matches = [n for n in names if search.lower() in n.lower()]
+        if not matches:
+            raise ValueError(f"Kennzahl '{search}' nicht gefunden (siehe 'metrics')")
+        if len(matches) > 1:
+            raise ValueError(f"Kennzahl '{search}' nicht eindeutig (Treffer: {', '.join(matches[:10])})")
+        return matches[0]
+
+    # Verlauf einer Kennzahl: Zeilen (Datum, Land, Klasse, Modul, Wert), nach Datum sortiert.
+    # Nur Läufe einer Kohorte (höchstens ein Wert je Land, Klasse, Modul und Datum)
+    def trend(self, metric: str, country: str | None = None, class_name: str | None = None,
+              module: str | None = None, since=None, until=None,
+              cohort: str = DEFAULT_COHORT) -> list[tuple]:
+        where, params = ["metric = ?", "cohort = ?"], [metric, cohort]
+        for column, value in (("country", country), ("class", class_name), ("module", module)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            where.append("run_date >= ?")
+            params.append(str(since))
+        if until is not None:
+            where.append("run_date <= ?")
+            params.append(str(until))
+        return self._conn.execute(
+            "SELECT run_date, country, class, module, value FROM metrics"
+            f" WHERE {' AND '.join(where)} ORDER BY run_date, country, class, module",
+            params,
+        ).fetchall()
+
+    # Verlauf als Tabelle: Zeilen = Datum, Spalten = Land (und Klasse/Modul)
+    def trend_frame(self, metric: str, **filters):
+        import pandas as pd
+
+        df = pd.DataFrame(self.trend(metric, **filters),
+                          columns=["run_date", "country", "class", "module", "value"])
+        df["series"] = df[["country", "class", "module"]].apply(
+            lambda r: " / ".join(v for v in r if v), axis=1)
+        return df.pivot_table(index="run_date", columns="series", values="value", aggfunc="last")
+
+    # Gespeicherte Läufe (neueste zuerst)
+    def runs(self, country: str | None = None) -> list[tuple]:
+        sql = "SELECT id, country, run_date, cohort, mdlo_top, recorded, learners, source FROM runs"
+        params = []
+        if country is not None:
+            sql += " WHERE country = ?"
+            params.append(country)
+        return self._conn.execute(sql + " ORDER BY run_date DESC, country, cohort",
+                                  params).fetchall()
+
+
+# Verlauf als Text-Tabelle (Datum x Reihe) ohne pandas
+def pivot_rows(rows) -> tuple[list[str], list[list]]:
+    series = sorted({" / ".join(v for v in r[1:4] if v) for r in rows})
+    table: dict[str, dict[str, float]] = {}
+    for run_date, country, cls, module, value in rows:
+        table.setdefault(run_date, {})[" / ".join(v for v in (country, cls, module) if v)] = value
+    header = ["Datum"] + series
+    return header, [[d] + [table[d].get(s) for s in series] for d in sorted(table)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Verlauf der LIKE-Auswertungen")
+    parser.add_argument("--db", help="Datenbank (Standard: neben dem Cache)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_metrics = sub.add_parser("metrics", help="Gespeicherte Kennzahlen auflisten")
+    p_metrics.add_argument("search", nargs="?")
+
+    p_trend = sub.add_parser("trend", help="Verlauf einer Kennzahl")
+    p_trend.add_argument("metric", help="Name oder eindeutiger Teil (siehe 'metrics')")
+    p_trend.add_argument("--country")
+    p_trend.add_argument("--class", dest="class_name")
+    p_trend.add_argument("--module")
+    p_trend.add_argument("--since", help="Ab Datum (JJJJ-MM-TT)")
+    p_trend.add_argument("--until", help="Bis Datum (JJJJ-MM-TT)")
+    p_trend.add_argument("--cohort", choices=["all", "completed"], default=DEFAULT_COHORT,
+                         help="Kohorte der Selbsteinschätzung (Standard: all)")
+    p_trend.add_argument("--csv", help="Zusätzlich als CSV (Semikolon) speichern")
+
+    p_runs = sub.add_parser("runs", help="Gespeicherte Läufe auflisten")
+    p_runs.add_argument("--country")
+    args = parser.parse_args(argv)
+
+    with RunHistory(args.db) as history:
+        if args.command == "metrics":
+            for name in history.metrics(args.search):
+                print(name)
+        elif args.command == "runs":
+            for run_id, country, run_date, cohort, mdlo_top, recorded, learners, source \
+                    in history.runs(args.country):
+                print(f"{run_id:>6}  {country:<12} {run_date}  {cohort:<9} MDLO {mdlo_top:>2}  "
+                      f"{learners or 0:>6} Teilnehmer  {source or ''}")
+        else:
+            try:
+                metric = history.resolve_metric(args.metric)
+            except ValueError as e:
+                print(e)
+                return 1
+            t0 = time.perf_counter()
+            rows = history.trend(metric, country=args.country, class_name=args.class_name,
+                                 module=args.module, since=args.since, until=args.until,
+                                 cohort=args.cohort)
+            elapsed_ms = (time.perf_counter() - t0) * 1000
+            header, table = pivot_rows(rows)
+            print(metric)
+            print("  ".join(f"{h:>14}" for h in header))
+            for row in table:
+                print("  ".join([f"{row[0]:>14}"] +
+                                [f"{v:>14.2f}" if v is not None else f"{'':>14}" for v in row[1:]]))
+            print(f"({len(rows)} Werte, {elapsed_ms:.1f} ms)")
+            if args.csv:
+                with open(args.csv, "w", encoding="utf-8-sig", newline="") as f:
+                    writer = csv.writer(f, delimiter=";")
+                    writer.writerow(header)
+                    writer.writerows(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+# Inkrementelle Auswertung: zusammenführbare Aggregate je (Klasse, Modul, Learner) auf der Festplatte.
+# Ein neuer Large-Table-Export wird eingefaltet, ohne frühere Exporte erneut zu lesen;
+# der Bericht entsteht direkt aus den Aggregaten und entspricht einer vollständigen Neuberechnung.
+#
+# Semantik beim Einfalten: Gruppen (Klasse, Modul, Learner), die im neuen Export vorkommen,
+# ersetzen die gespeicherten Werte (ein Export wiederholt die früheren Zeilen mit aktuellem
+# Stand); alle übrigen Gruppen bleiben erhalten. Reine Delta-Exporte funktionieren genauso.
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from LIKE import (
+    COMPETENCE_COLUMNS,
+    DEFAULT_COHORT,
+    ORDER_ACC,
+    LearnerSet,
+    LikeResult,
+    add_accuracy_summary,
+    add_competence_summary,
+    check_cohort,
+    completed_learners_of,
+    distribution_from_counts,
+    metacognition_progress,
+    restrict_to_cohort,
+    self_assessment_by_module,
+    top_mdlo,
+    top_mdlo_by_module,
+)
+from loader import DEFAULT_CHUNKSIZE, iter_large_table, parse_duration_seconds, parse_percent
+from mdlo import DEFAULT_TOP_N
+from schema import positive_int
+
+STATE_VERSION = 1
+
+GROUP_KEYS = ["Class Description", "Module", "Learner"]
+
+# Präfix für die Zähler je "Accuracy-Classes"-Wert
+ACC_CLASS_PREFIX = "acc_class:"
+
+
+# Aggregiert die abgeschlossenen Zeilen eines (Teil-)Exports je Gruppe.
+# Gibt (betroffene Gruppenschlüssel, Aggregate) zurück; Aggregate sind additiv.
+def aggregate_rows(df: pd.DataFrame) -> tuple[pd.MultiIndex, pd.DataFrame]:
+    keys = df[GROUP_KEYS].astype(object)
+    touched = pd.MultiIndex.from_frame(keys.drop_duplicates())
+
+    completed = df[df["Completion Status"] == "COMPLETED"]
+    data = completed[GROUP_KEYS].astype(object)
+    data["rows"] = 1
+    data["seconds"] = parse_duration_seconds(completed["Sum Time Spent"]).to_numpy()
+    for col in ["Accuracy", *COMPETENCE_COLUMNS]:
+        values = parse_percent(completed[col])
+        data[f"{col}:sum"] = values.fillna(0.0).to_numpy()
+        data[f"{col}:count"] = values.notna().astype("int64").to_numpy()
+
+    grouped = data.groupby(GROUP_KEYS, dropna=False, sort=False).sum()
+
+    # Zähler je "Accuracy-Classes"-Wert (leere Werte zählen wie bei value_counts nicht)
+    acc_rows = data[GROUP_KEYS].assign(
+        acc_class=completed["Accuracy-Classes"].astype(object).to_numpy())
+    acc_rows = acc_rows[acc_rows["acc_class"].notna()]
+    acc_classes = (
+        acc_rows.groupby([*GROUP_KEYS, "acc_class"], dropna=False, sort=False)
+        .size()
+        .unstack("acc_class", fill_value=0)
+    )
+    acc_classes.columns = [f"{ACC_CLASS_PREFIX}{c}" for c in acc_classes.columns]
+
+    aggregates = grouped.join(acc_classes, how="left").fillna(0)
+    return touched, aggregates
+
+
+# Summiert Aggregate mehrerer Blöcke desselben Exports
+def _combine(aggregates: list[pd.DataFrame]) -> pd.DataFrame:
+    combined = pd.concat(aggregates)
+    return combined.fillna(0).groupby(level=GROUP_KEYS, dropna=False, sort=False).sum()
+
+
+class AggregateState:
+    def __init__(self, groups: pd.DataFrame | None = None, sources: list[dict] | None = None):
+        if groups is None:
+            groups = pd.DataFrame(
+                index=pd.MultiIndex.from_arrays([[], [], []], names=GROUP_KEYS))
+        self.groups = groups
+        self.sources = sources or []
+
+    # Faltet einen Export (DataFrame der Large Table) ein
+    def fold(self, df_large: pd.DataFrame, source: str | None = None):
+        touched, aggregates = aggregate_rows(df_large)
+        self._upsert(touched, aggregates, source, len(df_large))
+
+    # Faltet eine Large-Table-CSV blockweise ein (begrenzter Speicher)
+    def fold_csv(self, path, chunksize: int = DEFAULT_CHUNKSIZE):
+        touched_parts, aggregates, rows = [], [], 0
+        for chunk in iter_large_table(path, chunksize=chunksize):
+            touched, agg = aggregate_rows(chunk)
+            touched_parts.append(touched)
+            aggregates.append(agg)
+            rows += len(chunk)
+        if not aggregates:
+            return
+        touched = touched_parts[0].append(touched_parts[1:]).unique()
+        self._upsert(touched, _combine(aggregates), str(path), rows)
+
+    # Ersetzt die betroffenen Gruppen durch die neuen Aggregate
+    def _upsert(self, touched: pd.MultiIndex, aggregates: pd.DataFrame, source, rows: int):
+        kept = self.groups[~self.groups.index.isin(touched)]
+        self.groups = pd.concat([kept, aggregates]).fillna(0)
+        self.sources.append({
+            "source": source,
+            "rows": rows,
+            "groups": len(touched),
+            "folded_at": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def save(self, path):
+        pd.to_pickle(
+            {"version": STATE_VERSION, "groups": self.groups, "sources": self.sources}, path)
+
+    @classmethod
+    def load(cls, path) -> "AggregateState":
+        data = pd.read_pickle(path)
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(
+                f"Zustandsdatei {path} hat Version {data.get('version')}, erwartet {STATE_VERSION}. "
+                "Bitte den Zustand aus den Exporten neu aufbauen.")
+        return cls(data["groups"], data["sources"])
+
+    # Erstellt den Bericht aus den Aggregaten (MCP, Self-Assessment und MDLO sind klein
+    # und werden wie bei compute_like() direkt übergeben, ebenso mdlo_top und cohort)
+    def to_result(self, df_mcp, df_self_assessment, df_mdlo, mdlo_top=DEFAULT_TOP_N,
+                  cohort=DEFAULT_COHORT) -> LikeResult:
+        check_cohort(cohort)
+        g = self.groups.reset_index()
+
+        # Learner mit allen Modulen (Module = alle Module mit abgeschlossenen Zeilen)
+        completed_learners = completed_learners_of(g)
+        g = g[g["Learner"].isin(completed_learners)]
+        cohort_learners = LearnerSet(completed_learners) if cohort == "completed" else None
+
+        # Time To Complete: Summe je Learner, dann Mittel/Min/Max/Summe je Klasse
+        time_per_learner = g.groupby(["Class Description", "Learner"])["seconds"].sum()
+        df_time = (
+            time_per_learner.groupby(level="Class Description")
+            .agg(["mean", "min", "max", "sum"])
+            .rename(columns={
+                "mean": "Average Time Needed To Complete All Modules",
+                "min": "Min. Time Needed To Complete All Modules",
+                "max": "Max. Time Needed To Complete All Modules",
+                "sum": "Total Time Needed To Complete All Modules",
+            })
+            .reset_index()
+        )
+
+        # Average Accuracy je Klasse = Summe / Anzahl über alle Zeilen
+        acc = g.groupby("Class Description")[["Accuracy:sum", "Accuracy:count"]].sum()
+        df_avg_acc = pd.DataFrame({
+            "Class Description": [str(c) for c in acc.index],
+            "Average Accuracy (all modules)":
+                (acc["Accuracy:sum"] / acc["Accuracy:count"].replace(0, float("nan"))).round(2).to_numpy(),
+        })
+
+        modules = sorted(g["Module"].unique())
+
+        # Accuracy Of Self-Assessment aus den Zählern je Wert
+        acc_class_cols = [c for c in g.columns if c.startswith(ACC_CLASS_PREFIX)]
+        counts = g.groupby("Module")[acc_class_cols].sum()
+        counts.columns = [c[len(ACC_CLASS_PREFIX):] for c in acc_class_cols]
+        df_acc_of_self_assessment = add_accuracy_summary(
+            distribution_from_counts(counts, modules, ORDER_ACC))
+
+        # Competence Level: Mittelwert = Summe / Anzahl je Modul
+        sums = g.groupby("Module")[[f"{c}:sum" for c in COMPETENCE_COLUMNS]].sum()
+        cnts = g.groupby("Module")[[f"{c}:count" for c in COMPETENCE_COLUMNS]].sum()
+        means = pd.DataFrame({
+            c: sums[f"{c}:sum"] / cnts[f"{c}:count"].replace(0, float("nan"))
+            for c in COMPETENCE_COLUMNS
+        })
+        df_competence_by_module = add_competence_summary(
+            means.round(2).rename_axis("Module").reset_index())
+
+        return LikeResult(
+            amount_of_learners=len(completed_learners),
+            time_seconds=df_time,
+            avg_acc=df_avg_acc,
+            mcp=metacognition_progress(restrict_to_cohort(df_mcp, cohort_learners)),
+            acc_of_self_assessment=df_acc_of_self_assessment,
+            self_assessment=self_assessment_by_module(
+                restrict_to_cohort(df_self_assessment, cohort_learners), modules),
+            competence_by_module=df_competence_by_module,
+            mdlo=top_mdlo(df_mdlo, mdlo_top),
+            mdlo_by_module=top_mdlo_by_module(df_mdlo, mdlo_top),
+            mdlo_top=mdlo_top,
+        )
+
+
+# Toleranz für Vergleiche: die Abschnitte sind auf 2 Nachkommastellen gerundet, ein Wert an
+# einer Rundungsgrenze (z.B. 0.125 gegen 0.12499999) darf je nach Summationsreihenfolge um eine
+# Einheit der letzten Stelle abweichen (plus Gleitkomma-Rest der gerundeten Zahlen)
+ROUNDED_ATOL = 0.01 + 1e-9
+
+
+# Vergleicht zwei Ergebnisse; gibt die Unterschiede als Text zurück (leer = identisch).
+# Zahlen werden mit Toleranz atol verglichen (siehe ROUNDED_ATOL).
+def compare_results(a: LikeResult, b: LikeResult, atol: float = ROUNDED_ATOL) -> list[str]:
+    diffs = []
+    if a.amount_of_learners != b.amount_of_learners:
+        diffs.append(f"amount_of_learners: {a.amount_of_learners} != {b.amount_of_learners}")
+    for field in ("time_seconds", "avg_acc", "mcp", "acc_of_self_assessment",
+                  "self_assessment", "competence_by_module", "mdlo", "mdlo_by_module"):
+        left, right = getattr(a, field), getattr(b, field)
+        if left is None or right is None:
+            if (left is None) != (right is None):
+                diffs.append(f"{field}: nur in einem Ergebnis vorhanden")
+            continue
+        left = left.reset_index(drop=True)
+        right = right.reset_index(drop=True)
+        try:
+            pd.testing.assert_frame_equal(
+                left, right, check_dtype=False, check_categorical=False,
+                check_exact=False, atol=atol, rtol=0)
+        except AssertionError as e:
+            diffs.append(f"{field}: {e}")
+    return diffs
+
+
+# Baut den Zustand aus den Exporten (in Reihenfolge) auf und vergleicht den Bericht mit einer
+# vollständigen Neuberechnung über den zusammengeführten Stand (spätere Exporte ersetzen Gruppen)
+def verify_against_full(large_paths, df_mcp, df_self_assessment, df_mdlo,
+                        mdlo_top=DEFAULT_TOP_N, cohort=DEFAULT_COHORT) -> list[str]:
+    from LIKE import compute_like
+    from loader import load_large_table
+
+    state = AggregateState()
+    merged = None
+    for path in large_paths:
+        state.fold_csv(path)
+        df = load_large_table(path)
+        for col in GROUP_KEYS:
+            df[col] = df[col].astype(object)
+        if merged is None:
+            merged = df
+        else:
+            touched = pd.MultiIndex.from_frame(df[GROUP_KEYS])
+            old = merged[~pd.MultiIndex.from_frame(merged[GROUP_KEYS]).isin(touched)]
+            merged = pd.concat([old, df], ignore_index=True)
+
+    full = compute_like(merged, df_mcp, df_self_assessment, df_mdlo, mdlo_top=mdlo_top,
+                        cohort=cohort)
+    incremental = state.to_result(df_mcp, df_self_assessment, df_mdlo, mdlo_top=mdlo_top,
+                                  cohort=cohort)
+    return compare_results(full, incremental)
+
+
+def main(argv=None) -> int:
+    from loader import load_export
+    from mdlo import load_mdlo
+
+    parser = argparse.ArgumentParser(description="LIKE inkrementelle Auswertung")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_fold = sub.add_parser("fold", help="Large-Table-Export(e) in den Zustand einfalten")
+    p_fold.add_argument("state", help="Zustandsdatei (wird angelegt, falls nicht vorhanden)")
+    p_fold.add_argument("large", nargs="+", help="Large-Table-CSV(s), in Reihenfolge")
+
+    def add_small_exports(p):
+        p.add_argument("--mcp", required=True, help="Metacognition Progress CSV")
+        p.add_argument("--self", dest="self_assessment", required=True, help="Self-Assessment CSV")
+        p.add_argument("--mdlo", help="Most Difficult Learning Objectives CSV")
+        p.add_argument("--mdlo-top", type=positive_int, default=DEFAULT_TOP_N,
+                       help="Anzahl der Most Difficult Learning Objectives (gesamt und je Modul)")
+        p.add_argument("--cohort", choices=["all", "completed"], default=DEFAULT_COHORT,
+                       help="Selbsteinschätzung für alle Learner (Standard) oder nur für "
+                            "Learner mit allen Modulen abgeschlossen")
+
+    p_report = sub.add_parser("report", help="Excel-Bericht aus dem Zustand erstellen")
+    p_report.add_argument("state")
+    add_small_exports(p_report)
+    p_report.add_argument("-o", "--output", default=".", help="Ausgabeordner")
+    p_report.add_argument("--numeric", action="store_true",
+                          help="Excel mit Zahlenformaten statt Texten schreiben")
+
+    p_verify = sub.add_parser("verify", help="Inkrementell gegen vollständige Neuberechnung prüfen")
+    p_verify.add_argument("large", nargs="+", help="Large-Table-CSV(s), in Reihenfolge")
+    add_small_exports(p_verify)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "fold":
+        state = AggregateState.load(args.state) if Path(args.state).exists() else AggregateState()
+        for path in args.large:
+            state.fold_csv(path)
+            print(f"Eingefaltet: {path} ({state.sources[-1]['rows']} Zeilen, "
+                  f"{state.sources[-1]['groups']} Gruppen)")
+        state.save(args.state)
+        print(f"Zustand: {len(state.groups)} Gruppen -> {args.state}")
+        return 0
+
+    df_mcp = load_export(args.mcp)
+    df_self = load_export(args.self_assessment)
+    df_mdlo = load_mdlo(args.mdlo, args.mdlo_top) if args.mdlo else pd.DataFrame()
+
+    if args.command == "report":
+        from exporters import default_filename, export_xlsx, versioned_path
+
+        result = AggregateState.load(args.state).to_result(
+            df_mcp, df_self, df_mdlo, mdlo_top=args.mdlo_top, cohort=args.cohort)
+        path = export_xlsx(result, versioned_path(Path(args.output) / default_filename()),
+                           numeric=args.numeric)
+        print(f"Bericht geschrieben: {path}")
+        return 0
+
+    diffs = verify_against_full(args.large, df_mcp, df_self, df_mdlo,
+                                mdlo_top=args.mdlo_top, cohort=args.cohort)
+    if diffs:
+        print("Unterschiede zur vollständigen Neuberechnung:")
+        for d in diffs:
+            print(f"- {d}")
+        return 1
+    print("Inkrementelles Ergebnis entspricht der vollständigen Neuberechnung.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# Drill-down je Learner und je Modul ("Wie hat Learner X je Modul abgeschnitten?").
+# Wird einmal je Lauf aus der vollständigen Large Table (alle Status, nicht nur COMPLETED)
+# und dem Self-Assessment aufgebaut: eine Zeile je (Learner, Modul), sortiert nach Learner
+# bzw. nach Modul, dazu Start/Ende jedes Schlüssels. Eine Abfrage ist danach nur ein Nachschlagen + Slice,
+# unabhängig von der Größe der Exporte.
+#
+#   index = LearnerIndex(df_large, df_self)
+#   index.search("mül")          # passende Learner
+#   index.learner("Max Müller")  # je Modul: Accuracy, Zeit, Kompetenzstufen, Selbsteinschätzung
+#   index.module("Modul 3")      # je Learner im Modul
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from LIKE import COMPETENCE_COLUMNS
+from loader import parse_duration_seconds, parse_percent
+
+# Spalten einer Indexzeile
+INDEX_COLUMNS = [
+    "Learner",
+    "Module",
+    "Completed",
+    "Accuracy",
+    "Accuracy-Classes",
+    "Sum Time Spent",
+    *COMPETENCE_COLUMNS,
+    "Self Assessment",
+]
+
+DEFAULT_LIMIT = 200
+
+
+# Eine Zeile je (Learner, Modul): Mittelwerte der Prozentwerte, Summe der Zeit, letzte
+# Genauigkeitsklasse bzw. Selbsteinschätzung. Erwartet die vollständige Large Table (nicht nur
+# COMPLETED): auch begonnene Module bekommen eine Zeile. Completed = Modul in der Large Table
+# abgeschlossen (sonst nur begonnen oder nur Selbsteinschätzung vorhanden)
+def _per_learner_module(df_large_table, df_self_assessment) -> pd.DataFrame:
+    df = df_large_table
+    if "Completion Status" in df.columns:
+        completed = (df["Completion Status"] == "COMPLETED").to_numpy()
+    else:
+        completed = np.ones(len(df), dtype=bool)
+    df = df.assign(
+        **{c: parse_percent(df[c]) for c in ["Accuracy", *COMPETENCE_COLUMNS]},
+        **{"Sum Time Spent": parse_duration_seconds(df["Sum Time Spent"])},
+        Completed=completed,
+    )
+    table = df.groupby(["Learner", "Module"], observed=True, sort=False).agg(**{
+        "Completed": ("Completed", "any"),
+        "Accuracy": ("Accuracy", "mean"),
+        "Accuracy-Classes": ("Accuracy-Classes", "last"),
+        "Sum Time Spent": ("Sum Time Spent", "sum"),
+        **{c: (c, "mean") for c in COMPETENCE_COLUMNS},
+    }).reset_index()
+    # Schlüssel als Text (Categoricals aus loader.py bzw. Zahlen als Namen)
+    table["Learner"] = table["Learner"].astype(str)
+    table["Module"] = table["Module"].astype(str)
+    table["Accuracy-Classes"] = table["Accuracy-Classes"].astype(object)
+
+    self_columns = {"Learner", "Module", "Self Assessment"}
+    if df_self_assessment is not None and self_columns <= set(df_self_assessment.columns):
+        sa = df_self_assessment.dropna(subset=["Learner", "Module"])
+        sa = (sa.groupby([sa["Learner"].astype(str), sa["Module"].astype(str)], sort=False)
+              ["Self Assessment"].last().reset_index())
+        table = table.merge(sa, on=["Learner", "Module"], how="outer")
+        # nur in der Selbsteinschätzung vorhanden -> nicht abgeschlossen
+        table["Completed"] = table["Completed"].eq(True)
+    else:
+        table["Self Assessment"] = None
+    return table[INDEX_COLUMNS]
+
+
+# Start und Ende jedes Schlüssels in einer danach sortierten Spalte
+def _offsets(keys: np.ndarray) -> dict[str, tuple[int, int]]:
+    if not len(keys):
+        return {}
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)]
+    names = keys[starts].tolist()
+    return dict(zip(names, zip(starts.tolist(), ends.tolist())))
+
+
+class LearnerIndex:
+    def __init__(self, df_large_table, df_self_assessment=None):
+        table = _per_learner_module(df_large_table, df_self_assessment)
+        self.by_learner = table.sort_values(["Learner", "Module"], kind="stable", ignore_index=True)
+        self.by_module = table.sort_values(["Module", "Learner"], kind="stable", ignore_index=True)
+        self._learner_rows = _offsets(self.by_learner["Learner"].to_numpy())
+        self._module_rows = _offsets(self.by_module["Module"].to_numpy())
+
+        self.learners = list(self._learner_rows)
+        self._learners_lower = [name.lower() for name in self.learners]
+        # Module mit abgeschlossenen Zeilen (Grundlage für "alle Module abgeschlossen")
+        self.modules = sorted(table.loc[table["Completed"], "Module"].unique().tolist())
+        completed = self.by_learner["Completed"].to_numpy()
+        self._completed_count = {
+            name: int(completed[start:end].sum()) for name, (start, end) in self._learner_rows.items()
+        }
+
+    def __len__(self):
+        return len(self.by_learner)
+
+    # Learner, deren Name den Suchtext enthält (ohne Groß-/Kleinschreibung), alphabetisch
+    def search(self, text: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        needle = text.strip().lower()
+        if not needle:
+            return self.learners[:limit]
+        hits = (name for name, lower in zip(self.learners, self._learners_lower) if needle in lower)
+        return list(islice(hits, limit))
+
+    # Module, deren Name den Suchtext enthält
+    def search_modules(self, text: str, limit: int = DEFAULT_LIMIT) -> list[str]:
+        needle = text.strip().lower()
+        return [name for name in self._module_rows if needle in name.lower()][:limit]
+
+    # Ergebnisse eines Learners je Modul (leer, wenn unbekannt)
+    def learner(self, name: str) -> pd.DataFrame:
+        start, end = self._learner_rows.get(name, (0, 0))
+        return self.by_learner.iloc[start:end]
+
+    # Ergebnisse aller Learner in einem Modul (leer, wenn unbekannt)
+    def module(self, name: str) -> pd.DataFrame:
+        start, end = self._module_rows.get(name, (0, 0))
+        return self.by_module.iloc[start:end]
+
+    # Kurzfassung eines Learners: abgeschlossene Module, Gesamtzeit, mittlere Accuracy
+    def learner_summary(self, name: str) -> dict:
+        rows = self.learner(name)
+        done = rows[rows["Completed"]]
+        return {
+            "learner": name,
+            "completed_modules": self._completed_count.get(name, 0),
+            "total_modules": len(self.modules),
+            "all_completed": self._completed_count.get(name, 0) == len(self.modules),
+            "time_seconds": int(done["Sum Time Spent"].sum()),
+            "accuracy": float(done["Accuracy"].mean()) if len(done) else float("nan"),
+        }
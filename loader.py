@@ -0,0 +1,124 @@
+# Einlesen der CSV-Exporte: nur benötigte Spalten, typisiert und blockweise
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Benötigte Spalten, Prozent- und Dauerspalten (gemeinsam mit der Vorab-Prüfung)
+from schema import DURATION_COLUMNS, LARGE_TABLE_COLUMNS, PERCENT_COLUMNS  # noqa: F401
+
+# Wiederkehrende Texte -> Categorical (spart Speicher, schnellere groupbys)
+CATEGORY_COLUMNS = [
+    "Learner",
+    "Module",
+    "Class Description",
+    "Completion Status",
+    "Accuracy-Classes",
+]
+
+DEFAULT_CHUNKSIZE = 200_000
+
+# Bei Änderungen an Spaltenauswahl oder Typisierung erhöhen (ungültig macht den Cache)
+LOADER_VERSION = 2
+
+
+# Wandelt Prozent-Strings in Zahlen um (leere/ungültige Werte -> NaN)
+def parse_percent(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.astype("float64")
+    cleaned = series.astype(str).str.replace("%", "", regex=False).str.strip()
+    return pd.to_numeric(cleaned, errors="coerce")
+
+
+# Wandelt Dauer-Strings ("01:23:45", "1 days 02:03:04") in ganze Sekunden um
+# (leere/ungültige Werte -> 0, entspricht NaT in der Summe je Learner).
+# Die Exporte wiederholen dieselben Zeiten sehr oft: jeder verschiedene Wert wird nur
+# einmal geparst und per Code zurückverteilt.
+def parse_duration_seconds(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.fillna(0).astype("int64")
+    codes, uniques = pd.factorize(series)
+    parsed = pd.to_timedelta(pd.Index(uniques, dtype=object), errors="coerce")
+    unique_seconds = np.append(
+        np.nan_to_num(parsed.total_seconds().to_numpy(), nan=0.0).astype(np.int64), 0)
+    # Code -1 (fehlender Wert) -> letzte Position = 0
+    return pd.Series(unique_seconds[codes], index=series.index, name=series.name)
+
+
+# Typisiert einen eingelesenen Block der Large Table
+def _convert_large_chunk(chunk: pd.DataFrame, completed_only: bool) -> pd.DataFrame:
+    chunk = chunk.rename(columns=lambda c: c.strip())
+    if completed_only:
+        chunk = chunk[chunk["Completion Status"] == "COMPLETED"].copy()
+    for col in PERCENT_COLUMNS:
+        chunk[col] = parse_percent(chunk[col])
+    for col in DURATION_COLUMNS:
+        chunk[col] = parse_duration_seconds(chunk[col])
+    for col in CATEGORY_COLUMNS:
+        chunk[col] = chunk[col].astype("category")
+    return chunk
+
+
+# Liefert die Large Table blockweise als typisierte DataFrames
+def iter_large_table(path, chunksize: int = DEFAULT_CHUNKSIZE, completed_only: bool = False):
+    wanted = set(LARGE_TABLE_COLUMNS)
+    reader = pd.read_csv(
+        path,
+        sep=";",
+        encoding="utf-8-sig",
+        usecols=lambda c: c.strip() in wanted,
+        dtype=str,
+        chunksize=chunksize,
+    )
+    with reader:
+        for chunk in reader:
+            yield _convert_large_chunk(chunk, completed_only)
+
+
+# Fügt typisierte Blöcke zusammen; Categoricals werden vereinigt statt zu object zu werden
+def concat_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    if not chunks:
+        return pd.DataFrame(columns=LARGE_TABLE_COLUMNS)
+    if len(chunks) == 1:
+        return chunks[0].reset_index(drop=True)
+    data = {}
+    for col in chunks[0].columns:
+        if isinstance(chunks[0][col].dtype, pd.CategoricalDtype):
+            # sortiert wie bei einem einzelnen Block, sonst folgt die Gruppenreihenfolge der Datei
+            data[col] = pd.Series(union_categoricals([c[col] for c in chunks], sort_categories=True))
+        else:
+            data[col] = pd.concat([c[col] for c in chunks], ignore_index=True)
+    return pd.DataFrame(data)
+
+
+# Liest die Large Table spaltenreduziert und typisiert ein.
+# max_memory_mb begrenzt die Größe der eingelesenen DataFrames (nicht den Speicher des
+# ganzen Prozesses: pandas-Puffer, der gerade gelesene Text-Block usw. kommen hinzu).
+# Gezählt werden die gehaltenen Blöcke plus die Kopie beim Zusammenfügen (concat_chunks
+# baut das Ergebnis neben den Blöcken auf, Spitze ≈ 2 × Blöcke); bei Überschreitung wird
+# abgebrochen, bevor diese Spitze erreicht wird.
+def load_large_table(
+    path,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_memory_mb: float | None = None,
+    completed_only: bool = False,
+) -> pd.DataFrame:
+    limit = None if max_memory_mb is None else max_memory_mb * 1024 * 1024
+    chunks = []
+    used = 0
+    for chunk in iter_large_table(path, chunksize=chunksize, completed_only=completed_only):
+        used += int(chunk.memory_usage(deep=True).sum())
+        chunks.append(chunk)
+        # ein einzelner Block wird ohne Kopie übernommen (siehe concat_chunks)
+        peak = used if len(chunks) == 1 else 2 * used
+        if limit is not None and peak > limit:
+            raise MemoryError(
+                f"Large Table überschreitet das Speicherlimit von {max_memory_mb} MB "
+                f"({used / 1024 / 1024:.0f} MB eingelesen nach {sum(len(c) for c in chunks)} Zeilen, "
+                f"mit Zusammenfügen ca. {peak / 1024 / 1024:.0f} MB)."
+            )
+    return concat_chunks(chunks)
+
+
+# Liest einen der übrigen (kleinen) Exporte unverändert ein
+def load_export(path) -> pd.DataFrame:
+    return pd.read_csv(path, sep=";", encoding="utf-8-sig")
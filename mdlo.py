@@ -0,0 +1,146 @@
+# Most Difficult Learning Objectives: die N Lernziele mit dem höchsten Wert
+# "Unconsciously Incompetent" – insgesamt und je Modul.
+#
+# top_mdlo / top_mdlo_by_module arbeiten auf einem geladenen DataFrame. load_mdlo liest den
+# Export blockweise und behält dabei nur begrenzte Heaps (N gesamt + N je Modul) -> Speicher
+# unabhängig von der Dateigröße. Das Ergebnis von load_mdlo enthält alle Zeilen, die für
+# die Top-N nötig sind (in Dateireihenfolge); compute_like liefert darauf dieselben Tabellen
+# wie auf der ganzen Datei.
+#
+# Rangfolge: höchster Wert zuerst, bei Gleichstand die frühere Zeile der Datei;
+# fehlende/ungültige Werte zuletzt.
+import heapq
+
+import pandas as pd
+
+from schema import DEFAULT_TOP_N, REQUIRED_COLUMNS
+
+VALUE_COLUMN = "Unconsciously Incompetent"
+MODULE_COLUMN = "Module"
+# Spalten, die nicht in die Auswertung übernommen werden
+DROP_COLUMNS = ["Open in Curator"]
+RESULT_COLUMNS = [c for c in REQUIRED_COLUMNS["mdlo"] if c not in DROP_COLUMNS]
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+# Zeilen in Rangfolge (stabil sortiert, ungültige Werte zuletzt)
+def _ranked(df_mdlo) -> pd.DataFrame:
+    df_mdlo = df_mdlo.reset_index(drop=True)
+    values = pd.to_numeric(df_mdlo[VALUE_COLUMN], errors="coerce")
+    return df_mdlo.loc[values.sort_values(ascending=False, kind="stable").index]
+
+
+# Top-N Most Difficult Learning Objectives (nach UI sortiert -> Grundlage zur Bewertung
+# der Learning Objectives). Ohne MDLO-Export (leerer DataFrame) eine leere Tabelle
+def top_mdlo(df_mdlo, n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+    if VALUE_COLUMN not in df_mdlo.columns:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return (_ranked(df_mdlo).head(n)
+            .drop(columns=DROP_COLUMNS, errors="ignore").reset_index(drop=True))
+
+
+# Top-N je Modul: Module alphabetisch, innerhalb eines Moduls nach Rang
+def top_mdlo_by_module(df_mdlo, n: int = DEFAULT_TOP_N) -> pd.DataFrame:
+    if VALUE_COLUMN not in df_mdlo.columns or MODULE_COLUMN not in df_mdlo.columns:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    top = _ranked(df_mdlo).groupby(MODULE_COLUMN, sort=False).head(n)
+    return (top.sort_values(MODULE_COLUMN, kind="stable")
+            .drop(columns=DROP_COLUMNS, errors="ignore").reset_index(drop=True))
+
+
+# Begrenzter Min-Heap der besten n Zeilen (Schlüssel: Wert, dann frühere Zeile).
+# Zeilen ohne gültigen Wert zählen nur, solange weniger als n gültige vorhanden sind
+class _TopN:
+    def __init__(self, n: int):
+        # bei n < 1 wäre der Heap leer und heapreplace schlüge beim ersten Wert fehl
+        if n < 1:
+            raise ValueError(
+                f"Anzahl der Most Difficult Learning Objectives muss mindestens 1 sein, nicht {n}")
+        self.n = n
+        self._heap: list[tuple[float, int]] = []
+        self._invalid: list[int] = []
+
+    def push(self, value: float, pos: int):
+        if value != value:  # NaN
+            if len(self._invalid) < self.n:
+                self._invalid.append(pos)
+            return
+        key = (value, -pos)
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, key)
+        elif key > self._heap[0]:
+            heapq.heapreplace(self._heap, key)
+
+    # Zeilennummern in Rangfolge
+    def positions(self) -> list[int]:
+        best = [-neg_pos for _, neg_pos in sorted(self._heap, reverse=True)]
+        return (best + self._invalid)[:self.n]
+
+
+# Sammelt blockweise die Kandidaten für die Top-N (gesamt und je Modul)
+class MdloTopK:
+    def __init__(self, n: int = DEFAULT_TOP_N):
+        self.n = n
+        self._overall = _TopN(n)
+        self._modules: dict = {}
+        # Zeilennummer in der Datei -> Zeile (nur Zeilen, die noch in einem Heap liegen)
+        self._rows: dict[int, tuple] = {}
+        self._columns: list | None = None
+        self._offset = 0
+
+    def add(self, chunk: pd.DataFrame):
+        if self._columns is None:
+            self._columns = list(chunk.columns)
+        chunk = chunk.reset_index(drop=True)
+        if VALUE_COLUMN not in chunk.columns:
+            self._offset += len(chunk)
+            return
+        values = pd.to_numeric(chunk[VALUE_COLUMN], errors="coerce")
+        modules = chunk[MODULE_COLUMN] if MODULE_COLUMN in chunk.columns else None
+
+        # Vorauswahl im Block (vektorisiert): nur die Top-N gesamt und je Modul kommen
+        # überhaupt in Frage, der Rest des Blocks wird verworfen
+        ranked = values.sort_values(ascending=False, kind="stable").index
+        keep = set(ranked[:self.n])
+        if modules is not None:
+            ranked_modules = modules.loc[ranked]
+            keep.update(ranked_modules.groupby(ranked_modules, sort=False).head(self.n).index)
+
+        index = sorted(keep)
+        for i, row in zip(index, chunk.iloc[index].itertuples(index=False, name=None)):
+            pos = self._offset + i
+            value = values.iat[i]
+            self._overall.push(value, pos)
+            if modules is not None and modules.iat[i] == modules.iat[i]:
+                self._modules.setdefault(modules.iat[i], _TopN(self.n)).push(value, pos)
+            self._rows[pos] = row
+        self._offset += len(chunk)
+
+        # Zeilen, die aus allen Heaps verdrängt wurden, freigeben
+        live = set(self._overall.positions())
+        for heap in self._modules.values():
+            live.update(heap.positions())
+        self._rows = {pos: row for pos, row in self._rows.items() if pos in live}
+
+    # Alle Kandidaten als DataFrame in Dateireihenfolge
+    def candidates(self) -> pd.DataFrame:
+        if self._columns is None:
+            return pd.DataFrame()
+        return pd.DataFrame([self._rows[pos] for pos in sorted(self._rows)], columns=self._columns)
+
+    def top(self) -> pd.DataFrame:
+        return top_mdlo(self.candidates(), self.n)
+
+    def by_module(self) -> pd.DataFrame:
+        return top_mdlo_by_module(self.candidates(), self.n)
+
+
+# Liest den MDLO-Export blockweise (wie loader.load_export: ";" und utf-8-sig) und gibt nur
+# die Kandidaten für die Top-N zurück – höchstens n × (Anzahl Module + 1) Zeilen
+def load_mdlo(path, n: int = DEFAULT_TOP_N, chunksize: int = DEFAULT_CHUNKSIZE) -> pd.DataFrame:
+    topk = MdloTopK(n)
+    with pd.read_csv(path, sep=";", encoding="utf-8-sig", chunksize=chunksize) as reader:
+        for chunk in reader:
+            topk.add(chunk)
+    return topk.candidates()
@@ -0,0 +1,198 @@
+# PowerPoint-Bericht aus einem LikeResult: die Vorlage (Vorlage.pptx) wird einmal geladen und
+# einmal nach Platzhaltern durchsucht (Platzhalter = Textfeld, dessen Text genau dem Namen
+# entspricht, z.B. "avg_acc"). Danach werden nur noch die indizierten Shapes befüllt –
+# beliebig viele Länder hintereinander aus derselben geladenen Vorlage.
+import sys
+from pathlib import Path
+
+from LIKE import LikeResult
+
+# Bekannte Platzhalter der Vorlage
+PLACEHOLDERS = [
+    "total_nr_participants",
+    "participants",
+    "time",
+    "total_time",
+    "avg_acc",
+    "knowledge",
+    "iui",
+    "consciousness",
+    "text1",
+    "text2",
+    "text3",
+]
+
+
+# Pfad zur mitgelieferten Vorlage (auch im PyInstaller-Build)
+def default_template_path() -> Path:
+    base = Path(getattr(sys, "_MEIPASS", Path(__file__).resolve().parent))
+    return base / "Vorlage.pptx"
+
+
+# Zahl als deutscher Prozent-Text wie in der Excel-Auswertung ("12,5%")
+def _pct(value) -> str:
+    return f"{value}".replace(".", ",") + "%"
+
+
+# Auf ganze Prozent gerundet ("13%")
+def _pct_int(value) -> str:
+    return f"{int(round(float(value), 0))}%"
+
+
+# Sekunden in "Xh Ym"
+def _hm(seconds) -> str:
+    total_minutes = int(seconds // 60)
+    return f"{total_minutes // 60}h {total_minutes % 60}m"
+
+
+# Zeit über alle Klassen (ein Bericht je Land): Gesamtzeit = Summe der Klassen,
+# Durchschnitt = Gesamtzeit je abgeschlossenem Learner, Min/Max über alle Klassen.
+# (Das Notebook nahm hier die Werte der zuletzt durchlaufenen Klasse aus der Schleife.)
+def overall_time(result: LikeResult) -> dict[str, float]:
+    t = result.time_seconds
+    total = float(t["Total Time Needed To Complete All Modules"].sum())
+    learners = result.amount_of_learners
+    return {
+        "mean": total / learners if learners else 0.0,
+        "min": float(t["Min. Time Needed To Complete All Modules"].min()),
+        "max": float(t["Max. Time Needed To Complete All Modules"].max()),
+        "total": total,
+    }
+
+
+# Inhalt je Platzhalter: Liste von Runs (Text, Schriftgröße, fett, schwarz erzwingen).
+# Zeit über alle Klassen (overall_time); Genauigkeit und Modulwerte wie im Notebook aus der
+# ersten Zeile (erste Klasse bzw. erstes Modul). Ohne enrolled bleiben die
+# Teilnehmer-Platzhalter leer.
+def placeholder_runs(result: LikeResult, enrolled: int | None = None) -> dict[str, list[tuple]]:
+    runs = {}
+    learners = result.amount_of_learners
+
+    if enrolled:
+        runs["total_nr_participants"] = [
+            ("Total number of participants: ", 18, False, True),
+            (f"{enrolled}", 16, True, True),
+        ]
+        not_completed = enrolled - learners
+        runs["participants"] = [
+            (f"Completed: {learners} ", 14, True, False),
+            (f"({int(round(learners / enrolled * 100, 0))}%)\n", 14, False, False),
+            (f"Not Completed: {not_completed} ", 14, True, False),
+            (f"({int(round(not_completed / enrolled * 100, 0))}%)", 14, False, False),
+        ]
+
+    if len(result.time_seconds):
+        t = overall_time(result)
+        runs["time"] = [
+            (f"{_hm(t['mean'])}\n", 12, True, False),
+            (f"Min: {_hm(t['min'])}\n", 12, False, False),
+            (f"Max: {_hm(t['max'])}", 12, False, False),
+        ]
+        runs["total_time"] = [(_hm(t["total"]), 14, False, False)]
+
+    if len(result.avg_acc):
+        runs["avg_acc"] = [
+            (_pct(result.avg_acc["Average Accuracy (all modules)"].iloc[0]), 14, True, False),
+        ]
+
+    mcp = dict(zip(result.mcp["Description"], result.mcp["Value"]))
+    runs["knowledge"] = [(_pct(mcp["Knowledge increase (Metacognition Progress)"]), 18, True, False)]
+    runs["iui"] = [(_pct(mcp["Reduction Unconscious Incompetence"]), 18, True, False)]
+    runs["consciousness"] = [(
+        " / ".join(_pct(mcp[k]) for k in (
+            "Initial Unconscious Incompetence (UI)",
+            "Initial Conscious Incompetence (CI)",
+            "Initial Unconscious Competence (UC)",
+            "Initial Conscious Competence (CC)",
+        )),
+        14, True, False,
+    )]
+
+    if len(result.acc_of_self_assessment):
+        a = result.acc_of_self_assessment.iloc[0]
+        runs["text1"] = [(
+            f"{_pct_int(a['>69%'])} I {_pct_int(a['<=69% - >50%'])} I {_pct_int(a['<= 50%'])}",
+            13, True, False,
+        )]
+    if len(result.self_assessment):
+        sa = result.self_assessment.iloc[0]
+        runs["text2"] = [(
+            f"{_pct_int(sa['Professional'])} I {_pct_int(sa['Competent 2'])} I {_pct_int(sa['Beginner'])}",
+            13, True, False,
+        )]
+    if len(result.competence_by_module):
+        c = result.competence_by_module.iloc[0]
+        runs["text3"] = [(
+            f"{_pct_int(c['Unconscious Incompetent'])} I {_pct_int(c['Conscious Incompetent'])} I "
+            f"{_pct_int(c['Unconscious Competent'])} I {_pct_int(c['Conscious Competent'])}",
+            13, True, False,
+        )]
+    return runs
+
+
+# Alle Shapes einer Folie, auch innerhalb von Gruppen
+def _iter_shapes(shapes):
+    for shape in shapes:
+        yield shape
+        if hasattr(shape, "shapes"):
+            yield from _iter_shapes(shape.shapes)
+
+
+class PptxTemplate:
+    def __init__(self, path=None):
+        from pptx import Presentation
+
+        self.path = Path(path) if path else default_template_path()
+        self.prs = Presentation(str(self.path))
+        # Platzhalter -> Shapes (einmaliger Durchlauf über alle Folien)
+        self.index = {}
+        for slide in self.prs.slides:
+            for shape in _iter_shapes(slide.shapes):
+                if shape.has_text_frame and shape.text in PLACEHOLDERS:
+                    self.index.setdefault(shape.text, []).append(shape)
+
+    # Ersetzt den Text eines Shapes durch die angegebenen Runs
+    @staticmethod
+    def _fill(shape, runs, anchor_top: bool = False):
+        from pptx.dml.color import RGBColor
+        from pptx.enum.text import MSO_VERTICAL_ANCHOR, PP_ALIGN
+        from pptx.util import Pt
+
+        text_frame = shape.text_frame
+        text_frame.clear()
+        if anchor_top:
+            text_frame.vertical_anchor = MSO_VERTICAL_ANCHOR.TOP
+
+        p = text_frame.paragraphs[0]
+        p.alignment = PP_ALIGN.CENTER
+        while p.runs:
+            p._element.remove(p.runs[0]._r)
+
+        for text, size, bold, black in runs:
+            run = p.add_run()
+            run.text = text
+            run.font.name = "Arial"
+            run.font.size = Pt(size)
+            run.font.bold = bold
+            if black:
+                run.font.color.rgb = RGBColor(0, 0, 0)
+
+    # Befüllt die Vorlage mit einem Ergebnis und speichert sie unter path.
+    # Die geladene Vorlage wird wiederverwendet; jeder Aufruf überschreibt alle Platzhalter.
+    def render(self, result: LikeResult, path, enrolled: int | None = None) -> Path:
+        runs = placeholder_runs(result, enrolled)
+        for name, shapes in self.index.items():
+            for shape in shapes:
+                # Platzhalter ohne Wert (z.B. ohne enrolled) werden geleert
+                self._fill(shape, runs.get(name, [("", 12, False, False)]),
+                           anchor_top=(name == "total_nr_participants"))
+        path = Path(path)
+        self.prs.save(str(path))
+        return path
+
+
+# Einzelner Bericht (lädt die Vorlage für diesen Aufruf)
+def export_pptx(result: LikeResult, path, template=None, enrolled: int | None = None) -> Path:
+    if not isinstance(template, PptxTemplate):
+        template = PptxTemplate(template)
+    return template.render(result, path, enrolled=enrolled)
@@ -0,0 +1,133 @@
+# Optionales Laufzeitprofil einer Auswertung: je Abschnitt Wandzeit, CPU-Zeit,
+# Spitzen-Speicher (tracemalloc) und verarbeitete Zeilen. Ohne RunProfile wird nichts gemessen.
+#
+#   profile = RunProfile()
+#   with profile.stage("Large Table laden"):
+#       df = load_large_table(path)
+#       profile.set_rows(len(df))
+#   result = compute_like(df, ..., profile=profile)
+#   export_xlsx(result, path, profile=profile, stats_sheet=True)
+#   profile.save_json(path.with_suffix(".profile.json"))
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+# Spalten des Tabellenblatts "Run Stats"
+STATS_COLUMNS = {
+    "stage": "Stage",
+    "wall_s": "Wall Time [s]",
+    "cpu_s": "CPU Time [s]",
+    "peak_mb": "Peak Memory [MB]",
+    "rows": "Rows",
+}
+
+
+@dataclass
+class StageStats:
+    stage: str
+    wall_s: float
+    cpu_s: float
+    # None, wenn ohne tracemalloc gemessen
+    peak_mb: float | None
+    rows: int | None
+
+
+class RunProfile:
+    # trace_memory=False misst nur Zeiten (tracemalloc verlangsamt pandas spürbar)
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self.stages: list[StageStats] = []
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self._current = None
+        self._owns_trace = False
+
+    # Beginnt einen Abschnitt; ein noch offener Abschnitt wird vorher beendet
+    def start(self, stage: str):
+        self.stop()
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_trace = True
+            tracemalloc.reset_peak()
+        self._current = {
+            "stage": stage,
+            "rows": None,
+            "wall": time.perf_counter(),
+            # CPU-Zeit des ganzen Prozesses (inkl. anderer Threads)
+            "cpu": time.process_time(),
+        }
+
+    # Beendet den offenen Abschnitt (falls vorhanden)
+    def stop(self):
+        current, self._current = self._current, None
+        if current is None:
+            return
+        peak_mb = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak_mb = round(tracemalloc.get_traced_memory()[1] / 1024 / 1024, 2)
+        self.stages.append(StageStats(
+            stage=current["stage"],
+            wall_s=round(time.perf_counter() - current["wall"], 4),
+            cpu_s=round(time.process_time() - current["cpu"], 4),
+            peak_mb=peak_mb,
+            rows=current["rows"],
+        ))
+
+    # Zeilenzahl des offenen Abschnitts
+    def set_rows(self, rows: int):
+        if self._current is not None:
+            self._current["rows"] = int(rows)
+
+    @contextmanager
+    def stage(self, stage: str):
+        self.start(stage)
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    # Fortschritts-Callback (wie in compute_like/export_xlsx): jeder Aufruf beendet den
+    # vorherigen Abschnitt und beginnt den gemeldeten; progress wird weiter aufgerufen
+    def track(self, progress=None):
+        forward = progress if progress is not None else (lambda stage: None)
+
+        def callback(stage: str):
+            self.stop()
+            forward(stage)
+            self.start(stage)
+
+        return callback
+
+    # Beendet die Messung und gibt tracemalloc wieder frei, falls hier gestartet
+    def close(self):
+        self.stop()
+        if self._owns_trace:
+            tracemalloc.stop()
+            self._owns_trace = False
+
+    @property
+    def total_wall_s(self) -> float:
+        return round(sum(s.wall_s for s in self.stages), 4)
+
+    def to_frame(self):
+        import pandas as pd
+
+        df = pd.DataFrame([asdict(s) for s in self.stages], columns=list(STATS_COLUMNS))
+        return df.rename(columns=STATS_COLUMNS)
+
+    def to_dict(self) -> dict:
+        return {
+            "started": self.started,
+            "total_wall_s": self.total_wall_s,
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def save_json(self, path) -> Path:
+        path = Path(path)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
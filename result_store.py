@@ -0,0 +1,228 @@
+# Inhaltsadressierter Speicher für fertige Auswertungen: Schlüssel = Hashes der vier
+# Eingabedateien + Analyse-Version + Exportoptionen. Wird dieselbe Kombination erneut
+# ausgewertet, liefert deliver() die bereits erzeugte Excel-/PowerPoint-Datei sofort,
+# statt neu zu rechnen. Aufbewahrung: höchstens max_entries Einträge, max_age_days Tage und
+# max_bytes Gesamtgröße (am längsten nicht genutzte Einträge werden zuerst entfernt).
+#
+#   python result_store.py list
+#   python result_store.py prune --max-entries 20 --max-age-days 30
+#   python result_store.py clear
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+# Bei Änderungen an Berechnung (LIKE.py) oder Export (exporters.py, pptx_report.py) erhöhen –
+# ältere Einträge werden dann nicht mehr gefunden und mit der Zeit entfernt
+ANALYSIS_VERSION = 4
+
+DEFAULT_MAX_ENTRIES = 50
+DEFAULT_MAX_AGE_DAYS = 90
+DEFAULT_MAX_BYTES = 1024 ** 3  # 1 GB
+
+META_FILE = "meta.json"
+
+
+# Standard-Speicherort neben dem Parquet-Cache
+def _default_store_dir() -> Path:
+    base = os.environ.get("LOCALAPPDATA")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "LIKE_Tool" / "results"
+
+
+class ResultStore:
+    def __init__(self, store_dir=None, max_entries: int | None = DEFAULT_MAX_ENTRIES,
+                 max_age_days: float | None = DEFAULT_MAX_AGE_DAYS,
+                 max_bytes: int | None = DEFAULT_MAX_BYTES):
+        self.store_dir = Path(store_dir) if store_dir else _default_store_dir()
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.max_bytes = max_bytes
+
+    # Schlüssel aus Eingabedateien (key -> Pfad oder None) und Optionen
+    def key_for(self, paths: dict, options: dict) -> str:
+        from cache import file_hash
+
+        h = hashlib.blake2b(digest_size=20)
+        h.update(f"v{ANALYSIS_VERSION}".encode())
+        for kind in sorted(paths):
+            h.update(f"|{kind}=".encode())
+            if paths[kind]:
+                h.update(file_hash(paths[kind]).encode())
+        h.update(json.dumps(options, sort_keys=True).encode())
+        return h.hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.store_dir / key
+
+    @staticmethod
+    def _read_meta(entry: Path) -> dict | None:
+        try:
+            with open(entry / META_FILE, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry: Path, meta: dict):
+        tmp = entry / f"{META_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, entry / META_FILE)
+
+    # Gespeicherte Dateien zu einem Schlüssel (Endung -> Pfad, z.B. ".xlsx") oder None
+    def lookup(self, key: str) -> dict[str, Path] | None:
+        entry = self._entry_dir(key)
+        meta = self._read_meta(entry)
+        if meta is None:
+            return None
+        files = {Path(name).suffix: entry / name for name in meta["files"]}
+        if not all(p.exists() for p in files.values()):
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        meta["last_used"] = time.time()
+        self._write_meta(entry, meta)
+        return files
+
+    # Zusatzangaben eines gespeicherten Laufs (info von store(), z.B. "inputs") oder None
+    def info(self, key: str) -> dict | None:
+        return self._read_meta(self._entry_dir(key))
+
+    # Legt die Ausgabedateien eines Laufs ab (je Endung eine Datei, z.B. .xlsx und .pptx).
+    # Atomar: erst temporärer Ordner, dann umbenannt. delivered = bereits ausgelieferte Excel-Datei
+    def store(self, key: str, files: list, delivered=None, info: dict | None = None):
+        from cache import file_hash
+
+        entry = self._entry_dir(key)
+        tmp = self.store_dir / f"{key}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+        names = []
+        for file in files:
+            name = f"result{Path(file).suffix}"
+            shutil.copy2(file, tmp / name)
+            names.append(name)
+        now = time.time()
+        self._write_meta(tmp, {
+            "version": ANALYSIS_VERSION,
+            "created": now,
+            "last_used": now,
+            "files": names,
+            # Inhalts-Hash je Datei: frühere Auslieferungen werden nur unverändert wiederverwendet
+            "hashes": {name: file_hash(tmp / name) for name in names},
+            "delivered": [str(delivered)] if delivered else [],
+            **(info or {}),
+        })
+        shutil.rmtree(entry, ignore_errors=True)
+        os.replace(tmp, entry)
+        self.prune()
+
+    # Liefert ein gespeichertes Ergebnis aus: liegt eine frühere Auslieferung im Ordner von
+    # target und ist inhaltlich unverändert (gleicher Hash, auch die .pptx daneben), wird deren
+    # Pfad zurückgegeben; sonst werden die Dateien nach target bzw. dem nächsten freien Namen
+    # daneben kopiert (exporters.versioned_path). None, wenn nichts gespeichert ist.
+    def deliver(self, key: str, target) -> Path | None:
+        from cache import file_hash
+        from exporters import versioned_path
+
+        files = self.lookup(key)
+        if files is None:
+            return None
+        entry = self._entry_dir(key)
+        meta = self._read_meta(entry)
+        # ältere Einträge ohne gespeicherte Hashes: aus den abgelegten Dateien berechnen
+        hashes = meta.get("hashes") or {path.name: file_hash(path) for path in files.values()}
+
+        def unchanged(previous: Path) -> bool:
+            for suffix, path in files.items():
+                copy = previous.with_suffix(suffix)
+                if not copy.is_file() or file_hash(copy) != hashes.get(path.name):
+                    return False
+            return True
+
+        target = Path(target)
+        folder = target.parent.resolve()
+        for previous in map(Path, meta.get("delivered", [])):
+            if previous.parent.resolve() == folder and unchanged(previous):
+                return previous
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target = versioned_path(target)
+        for suffix, path in files.items():
+            shutil.copy2(path, target.with_suffix(suffix))
+        meta["delivered"] = meta.get("delivered", []) + [str(target)]
+        self._write_meta(entry, meta)
+        return target
+
+    # Alle Einträge als (Ordner, Metadaten, Größe in Bytes), zuletzt genutzte zuerst
+    def entries(self) -> list[tuple[Path, dict, int]]:
+        if not self.store_dir.exists():
+            return []
+        result = []
+        for entry in self.store_dir.iterdir():
+            # unvollständige Einträge (.tmp) eines abgebrochenen Laufs überspringen
+            meta = self._read_meta(entry) if entry.is_dir() and entry.suffix != ".tmp" else None
+            if meta is None:
+                continue
+            size = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+            result.append((entry, meta, size))
+        return sorted(result, key=lambda e: e[1].get("last_used", 0), reverse=True)
+
+    # Setzt die Aufbewahrungsregeln durch; gibt die Anzahl entfernter Einträge zurück
+    def prune(self) -> int:
+        now = time.time()
+        kept, total, removed = 0, 0, 0
+        for entry, meta, size in self.entries():
+            too_old = (self.max_age_days is not None
+                       and now - meta.get("last_used", 0) > self.max_age_days * 86400)
+            too_many = self.max_entries is not None and kept >= self.max_entries
+            too_big = self.max_bytes is not None and total + size > self.max_bytes
+            if too_old or too_many or too_big:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+            else:
+                kept += 1
+                total += size
+        return removed
+
+    # Gesamtgröße in Bytes
+    def size(self) -> int:
+        return sum(size for _, _, size in self.entries())
+
+    # Löscht alle Einträge; gibt die Anzahl zurück
+    def clear(self) -> int:
+        entries = self.entries()
+        for entry, _, _ in entries:
+            shutil.rmtree(entry, ignore_errors=True)
+        return len(entries)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Ergebnisspeicher der LIKE-Auswertungen")
+    parser.add_argument("command", choices=["list", "prune", "clear"])
+    parser.add_argument("--dir", help="Speicherort (Standard: neben dem Cache)")
+    parser.add_argument("--max-entries", type=int, default=DEFAULT_MAX_ENTRIES)
+    parser.add_argument("--max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS)
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024)
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.dir, max_entries=args.max_entries, max_age_days=args.max_age_days,
+                        max_bytes=int(args.max_mb * 1024 * 1024))
+    if args.command == "list":
+        for entry, meta, size in store.entries():
+            used = time.strftime("%Y-%m-%d %H:%M", time.localtime(meta.get("last_used", 0)))
+            inputs = ", ".join(meta.get("inputs", {}).values())
+            print(f"{entry.name[:12]}  {used}  {size / 1024:8.0f} KB  {', '.join(meta['files'])}  [{inputs}]")
+    elif args.command == "prune":
+        print(f"{store.prune()} Einträge entfernt.")
+    else:
+        print(f"{store.clear()} Einträge gelöscht.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
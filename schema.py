@@ -0,0 +1,278 @@
+# Erwarteter Aufbau der vier Exporte und schnelle Vorab-Prüfung (ohne pandas):
+# Pflichtspalten und eine Stichprobe der ersten Zeilen (Prozent-/Dauerwerte, bekannte
+# Kategorien) werden geprüft, bevor das teure Einlesen beginnt. Die Datei wird zeilenweise
+# gelesen und nach der Stichprobe verlassen -> Millisekunden auch bei GB-großen Exporten.
+#
+#   python schema.py export.csv [--kind large] [--rows 1000]
+import argparse
+import csv
+import re
+import sys
+import time
+from dataclasses import dataclass
+
+# Spalten der Large Table, die like() tatsächlich verwendet
+LARGE_TABLE_COLUMNS = [
+    "Learner",
+    "Module",
+    "Class Description",
+    "Completion Status",
+    "Sum Time Spent",
+    "Accuracy",
+    "Accuracy-Classes",
+    "Unconscious Incompetent",
+    "Conscious Incompetent",
+    "Unconscious Competent",
+    "Conscious Competent",
+]
+
+# Prozentwerte ("87.5%") -> float
+PERCENT_COLUMNS = [
+    "Accuracy",
+    "Unconscious Incompetent",
+    "Conscious Incompetent",
+    "Unconscious Competent",
+    "Conscious Competent",
+]
+
+# Dauer ("01:23:45") -> ganze Sekunden (int)
+DURATION_COLUMNS = ["Sum Time Spent"]
+
+# Genauigkeitsklassen der Large Table (Reihenfolge der Auswertung)
+ORDER_ACC = [
+    "firm knowledge",
+    "competent; training voluntary - no immediate need",
+    "profits from re-training / webinar",
+    "hands-on classroom training needed",
+]
+
+# Stufen der Selbsteinschätzung
+ORDER_SA = ["Novice", "Advanced beginner", "Competent", "Proficient", "Expert"]
+
+# Anzahl der Most Difficult Learning Objectives (gesamt und je Modul); steht hier statt in
+# mdlo.py, damit Stapelauswertung und Dienst den Standard ohne pandas kennen
+DEFAULT_TOP_N = 5
+
+# Spalten des MCP-Exports, aus denen die erste Zeile gelesen wird (Anteile, z.B. 0.25)
+MCP_COLUMNS = [
+    "Initial Conscious Competence",
+    "Initial Unconscious Competence",
+    "Initial Conscious Incompetence",
+    "Initial Unconscious Incompetence",
+    "Improvement Conscious Competence",
+    "Improvement Unconscious Incompetence",
+]
+
+# Pflichtspalten je Exporttyp
+REQUIRED_COLUMNS = {
+    "large": LARGE_TABLE_COLUMNS,
+    "mcp": MCP_COLUMNS,
+    "self": ["Learner", "Module", "Self Assessment"],
+    "mdlo": ["Module", "Learning Objective", "Unconsciously Incompetent", "Open in Curator"],
+}
+
+EXPORT_TITLES = {
+    "large": "Large Table",
+    "mcp": "Metacognition Progress",
+    "self": "Self-Assessment",
+    "mdlo": "Most Difficult Learning Objectives",
+}
+
+DEFAULT_SAMPLE_ROWS = 1000
+
+# Was loader.parse_percent bzw. pd.to_timedelta sicher verstehen
+_PERCENT_RE = re.compile(r"^-?\d+(\.\d+)?(e-?\d+)?\s*%?$", re.IGNORECASE)
+_DURATION_RE = re.compile(r"^-?(\d+\s*days?,?\s*)?\d+:\d{1,2}(:\d{1,2}(\.\d+)?)?$")
+
+
+# Ein gefundenes Problem. level "error": die Auswertung würde abbrechen;
+# "warning": die Auswertung läuft, betroffene Werte werden aber ignoriert
+@dataclass
+class ValidationIssue:
+    kind: str
+    level: str
+    message: str
+
+    def __str__(self):
+        prefix = "Fehler" if self.level == "error" else "Hinweis"
+        return f"{prefix} ({EXPORT_TITLES.get(self.kind, self.kind)}): {self.message}"
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+# Sammelt ungültige Werte einer Spalte (höchstens 3 Beispiele)
+class _Sample:
+    def __init__(self):
+        self.count = 0
+        self.examples = []
+
+    def add(self, value: str):
+        self.count += 1
+        if len(self.examples) < 3 and value not in self.examples:
+            self.examples.append(value)
+
+    def describe(self) -> str:
+        return f"{self.count} Werte, z.B. {', '.join(repr(v) for v in self.examples)}"
+
+
+# Prüft einen Export: Kodierung/BOM, Trennzeichen, Pflichtspalten und die ersten sample_rows
+# Zeilen. Gelesen wird wie beim Laden (utf-8-sig, ";"), eine BOM stört daher nicht; eine
+# doppelte BOM oder eine andere Kodierung wird gemeldet.
+def validate_export(path, kind: str, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> list[ValidationIssue]:
+    issues = []
+
+    def error(message):
+        issues.append(ValidationIssue(kind, "error", message))
+
+    def warning(message):
+        issues.append(ValidationIssue(kind, "warning", message))
+
+    try:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f, delimiter=";")
+            header = next(reader, None)
+            if not header:
+                error("Datei ist leer.")
+                return issues
+            if header[0].startswith("\ufeff"):
+                warning("Doppelte BOM am Dateianfang – erste Spalte wird bereinigt erwartet.")
+                header[0] = header[0].lstrip("\ufeff")
+            if len(header) == 1 and ("," in header[0] or "\t" in header[0]):
+                error("Trennzeichen ist nicht ';' (Export bitte als CSV mit Semikolon speichern).")
+                return issues
+
+            columns = [c.strip() for c in header]
+            missing = [c for c in REQUIRED_COLUMNS[kind] if c not in columns]
+            if missing:
+                error(f"Pflichtspalten fehlen: {', '.join(missing)}")
+                return issues
+            index = {c: columns.index(c) for c in REQUIRED_COLUMNS[kind]}
+
+            rows = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) >= sample_rows:
+                    break
+    except UnicodeDecodeError:
+        error("Datei ist nicht UTF-8-kodiert (in Excel als 'CSV UTF-8' speichern).")
+        return issues
+
+    if not rows:
+        (error if kind == "mcp" else warning)("Keine Datenzeilen vorhanden.")
+        return issues
+
+    def values(column):
+        i = index[column]
+        return [row[i].strip() for row in rows if len(row) > i and row[i].strip()]
+
+    short_rows = sum(1 for row in rows if len(row) < len(header))
+    if short_rows:
+        warning(f"{short_rows} von {len(rows)} Zeilen haben weniger Felder als der Header.")
+
+    if kind == "large":
+        for column in PERCENT_COLUMNS:
+            bad = _Sample()
+            for v in values(column):
+                if not _PERCENT_RE.match(v):
+                    bad.add(v)
+            if bad.count:
+                warning(f"'{column}': kein Prozentwert ({bad.describe()}) – wird ignoriert.")
+        for column in DURATION_COLUMNS:
+            bad = _Sample()
+            for v in values(column):
+                if not _DURATION_RE.match(v):
+                    bad.add(v)
+            if bad.count:
+                warning(f"'{column}': keine Dauer hh:mm:ss ({bad.describe()}) – zählt als 0.")
+        if "COMPLETED" not in set(values("Completion Status")):
+            warning(f"'Completion Status': kein 'COMPLETED' in den ersten {len(rows)} Zeilen.")
+        bad = _Sample()
+        for v in values("Accuracy-Classes"):
+            if v not in ORDER_ACC:
+                bad.add(v)
+        if bad.count:
+            warning(f"'Accuracy-Classes': unbekannte Klasse ({bad.describe()}).")
+
+    elif kind == "mcp":
+        first = rows[0]
+        bad = [c for c in MCP_COLUMNS
+               if len(first) <= index[c] or not _is_number(first[index[c]].strip())]
+        if bad:
+            error(f"Erste Zeile enthält keine Zahl in: {', '.join(bad)}")
+
+    elif kind == "self":
+        bad = _Sample()
+        for v in values("Self Assessment"):
+            if v not in ORDER_SA:
+                bad.add(v)
+        if bad.count:
+            warning(f"'Self Assessment': unbekannte Stufe ({bad.describe()}).")
+
+    elif kind == "mdlo":
+        bad = _Sample()
+        for v in values("Unconsciously Incompetent"):
+            if not _is_number(v):
+                bad.add(v)
+        if bad.count:
+            error(f"'Unconsciously Incompetent': keine Zahl ({bad.describe()}).")
+
+    return issues
+
+
+# Prüft alle gesetzten Exporte (paths: key -> Pfad oder None)
+def validate_inputs(paths: dict, sample_rows: int = DEFAULT_SAMPLE_ROWS) -> list[ValidationIssue]:
+    issues = []
+    for kind, path in paths.items():
+        if path:
+            issues.extend(validate_export(path, kind, sample_rows))
+    return issues
+
+
+def format_issues(issues: list[ValidationIssue]) -> str:
+    return "\n".join(f"• {issue}" for issue in issues)
+
+
+# argparse-Typ für Anzahlen (z.B. --mdlo-top): ganze Zahl >= 1
+def positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"keine ganze Zahl: {text}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"muss mindestens 1 sein: {text}")
+    return value
+
+
+def main(argv=None) -> int:
+    from csv_types import detect_csv_type_by_header
+
+    parser = argparse.ArgumentParser(description="Schnelle Prüfung eines LIKE-Exports")
+    parser.add_argument("path")
+    parser.add_argument("--kind", choices=list(REQUIRED_COLUMNS),
+                        help="Exporttyp (Standard: anhand des Headers erkennen)")
+    parser.add_argument("--rows", type=int, default=DEFAULT_SAMPLE_ROWS, help="Stichprobe (Zeilen)")
+    args = parser.parse_args(argv)
+
+    kind = args.kind
+    if kind is None:
+        kind, reason = detect_csv_type_by_header(args.path)
+        if kind is None:
+            print(reason)
+            return 1
+
+    t0 = time.perf_counter()
+    issues = validate_export(args.path, kind, args.rows)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    print(format_issues(issues) if issues else f"{EXPORT_TITLES[kind]}: keine Probleme gefunden.")
+    print(f"({elapsed_ms:.1f} ms)")
+    return 1 if any(i.level == "error" for i in issues) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
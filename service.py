@@ -0,0 +1,537 @@
+# Lokaler HTTP-Dienst für andere Tools (ohne GUI, nur Standardbibliothek):
+# Exporte per multipart/form-data hochladen, Auswertung läuft in einem Prozess-Pool,
+# Status je Auftrag abfragen, Ergebnis als Excel oder JSON abholen.
+#
+#   python service.py --port 8765 -w 2 --max-queued 8
+#
+#   POST   /jobs                 Felder large, mcp, self, mdlo (optional) als Dateien;
+#                                unbenannte Dateien werden anhand des Headers zugeordnet.
+#                                Optional: numeric=1, engine=arrow, mdlo_top=10,
+#                                cohort=completed                                -> 202 {"id": ...}
+#                                Warteschlange voll -> 503 mit Retry-After (vor dem Upload)
+#   GET    /jobs/<id>            Status: queued | running | done | failed
+#   GET    /jobs/<id>/result     Excel-Datei (?format=json für die numerischen Ergebnisse)
+#   DELETE /jobs/<id>            Auftrag und Dateien entfernen
+#   GET    /health               Auslastung
+#
+# Jeder Auftrag hat einen eigenen Ordner (Eingaben + Ausgaben); nichts wird ins
+# Arbeitsverzeichnis geschrieben. Uploads werden blockweise direkt in diesen Ordner
+# geschrieben, nicht im Speicher gehalten. Fertige Aufträge werden nach --job-ttl Sekunden
+# gelöscht. Bricht ein Worker-Prozess ab, schlagen seine Aufträge fehl und der Pool wird
+# neu aufgebaut.
+import argparse
+import csv
+import json
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from email.message import Message
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from batch import MANDATORY_KEYS
+from csv_types import detect_csv_type_by_header
+from schema import DEFAULT_TOP_N, validate_inputs
+
+DEFAULT_PORT = 8765
+DEFAULT_MAX_UPLOAD_MB = 1024
+DEFAULT_JOB_TTL_S = 3600
+
+# Blockgröße beim Lesen des Uploads; Obergrenzen für Kopfzeilen und Formularfelder je Teil
+CHUNK_SIZE = 1024 * 1024
+MAX_PART_HEADER_BYTES = 16 * 1024
+MAX_FIELD_BYTES = 64 * 1024
+
+XLSX_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+# Läuft im Worker-Prozess: Auswertung in den Auftragsordner (Excel + JSON)
+def run_job(job_dir: str, paths: dict, numeric: bool = False, engine: str = "pandas",
+            mdlo_top: int = DEFAULT_TOP_N, cohort: str = "all") -> dict:
+    import pandas as pd
+
+    from LIKE import compute_like
+    from exporters import default_filename, export_json, export_xlsx
+    from loader import load_export, load_large_table
+    from mdlo import load_mdlo
+
+    t0 = time.perf_counter()
+    if engine == "arrow":
+        from arrow_engine import load_large_table_arrow
+        df_large = load_large_table_arrow(paths["large"], completed_only=True)
+    else:
+        df_large = load_large_table(paths["large"], completed_only=True)
+    df_mcp = load_export(paths["mcp"])
+    df_self = load_export(paths["self"])
+    df_mdlo = load_mdlo(paths["mdlo"], mdlo_top) if paths.get("mdlo") else pd.DataFrame()
+
+    result = compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine, mdlo_top=mdlo_top,
+                          cohort=cohort)
+    out = Path(job_dir)
+    xlsx = export_xlsx(result, out / default_filename(), numeric=numeric)
+    json_path = export_json(result, out / "result.json")
+    return {"xlsx": str(xlsx), "json": str(json_path), "rows_large": int(df_large.shape[0]),
+            "seconds": time.perf_counter() - t0}
+
+
+# Liest einen multipart/form-data-Body (length Bytes) blockweise aus stream: Formularfelder
+# kommen in ein Dict, Dateien werden direkt nach target_dir geschrieben ("<i>_<Name>").
+# Gibt (Felder, [(Feldname, Dateiname, Pfad)]) zurück; ValueError bei ungültigem Body.
+def parse_multipart(content_type: str, stream, length: int, target_dir: Path,
+                    chunk_size: int = CHUNK_SIZE) -> tuple[dict[str, str], list[tuple[str, str, Path]]]:
+    header = Message()
+    header["content-type"] = content_type
+    boundary = header.get_param("boundary")
+    if header.get_content_type() != "multipart/form-data" or not boundary:
+        raise ValueError("multipart/form-data erwartet")
+    delimiter = b"--" + boundary.encode("latin-1")
+    separator = b"\r\n" + delimiter
+
+    buf = b""
+    remaining = length
+
+    def fill():
+        nonlocal buf, remaining
+        if remaining <= 0:
+            raise ValueError("multipart-Body unvollständig")
+        data = stream.read(min(chunk_size, remaining))
+        if not data:
+            raise ValueError("Upload abgebrochen")
+        remaining -= len(data)
+        buf += data
+
+    # Präambel bis zur ersten Grenze überspringen
+    while delimiter not in buf:
+        buf = buf[-len(delimiter):]
+        fill()
+    buf = buf[buf.index(delimiter) + len(delimiter):]
+
+    fields, files = {}, []
+    while True:
+        while len(buf) < 2:
+            fill()
+        if buf.startswith(b"--"):
+            break
+        if not buf.startswith(b"\r\n"):
+            raise ValueError("multipart-Grenze ungültig")
+
+        # Kopfzeilen des Teils
+        while b"\r\n\r\n" not in buf:
+            if len(buf) > MAX_PART_HEADER_BYTES:
+                raise ValueError("multipart-Kopfzeilen zu lang")
+            fill()
+        end = buf.index(b"\r\n\r\n")
+        part = Message()
+        for line in buf[2:end].decode("utf-8", errors="replace").split("\r\n"):
+            key, _, value = line.partition(":")
+            if key.strip():
+                part[key.strip()] = value.strip()
+        buf = buf[end + 4:]
+        name = part.get_param("name", header="content-disposition") or ""
+        filename = part.get_filename()
+
+        # Inhalt bis zur nächsten Grenze; das Ende des Puffers könnte deren Anfang sein
+        if filename:
+            path = target_dir / f"{len(files)}_{Path(filename).name}"
+            out = open(path, "wb")
+            files.append((name, filename, path))
+        else:
+            value = b""
+        try:
+            while separator not in buf:
+                keep = len(separator) - 1
+                if len(buf) > keep:
+                    if filename:
+                        out.write(buf[:-keep])
+                    else:
+                        value += buf[:-keep]
+                        if len(value) > MAX_FIELD_BYTES:
+                            raise ValueError(f"Formularfeld {name} zu lang")
+                    buf = buf[-keep:]
+                fill()
+            end = buf.index(separator)
+            if filename:
+                out.write(buf[:end])
+            else:
+                fields[name] = (value + buf[:end]).decode("utf-8", errors="replace")
+        finally:
+            if filename:
+                out.close()
+        buf = buf[end + len(separator):]
+    return fields, files
+
+
+@dataclass
+class Job:
+    id: str
+    dir: Path
+    paths: dict
+    numeric: bool = False
+    engine: str = "pandas"
+    mdlo_top: int = DEFAULT_TOP_N
+    cohort: str = "all"
+    status: str = "queued"
+    created: float = field(default_factory=time.time)
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+    output: dict | None = None
+
+    def to_dict(self) -> dict:
+        data = {"id": self.id, "status": self.status, "created": self.created,
+                "started": self.started, "finished": self.finished}
+        if self.error:
+            data["error"] = self.error
+        if self.status == "done":
+            data["result_url"] = f"/jobs/{self.id}/result"
+            data["rows_large"] = self.output["rows_large"]
+            data["seconds"] = round(self.output["seconds"], 3)
+        return data
+
+
+# Auftragsverwaltung: eigene FIFO-Warteschlange (begrenzt) vor dem Prozess-Pool, damit der
+# Status "running" genau dann gilt, wenn ein Prozess den Auftrag bearbeitet
+class JobManager:
+    def __init__(self, work_dir, workers: int = 2, max_queued: int = 8,
+                 job_ttl_s: float = DEFAULT_JOB_TTL_S):
+        self.work_dir = Path(work_dir)
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.max_queued = max_queued
+        self.job_ttl_s = job_ttl_s
+        self.jobs: dict[str, Job] = {}
+        self._waiting: deque[Job] = deque()
+        self._running = 0
+        # reservierte Plätze für Uploads, die gerade eingelesen werden
+        self._reserved = 0
+        self._lock = threading.Lock()
+        self._pool = ProcessPoolExecutor(max_workers=workers)
+
+    # Neuer Auftragsordner (Eingaben werden vom Aufrufer hineingeschrieben)
+    def new_job_dir(self) -> tuple[str, Path]:
+        job_id = uuid.uuid4().hex
+        job_dir = self.work_dir / job_id
+        job_dir.mkdir()
+        return job_id, job_dir
+
+    # Reserviert vor dem Upload einen Platz in der Warteschlange (gleichzeitige Uploads zählen
+    # mit); False, wenn voll. Belegt wird er mit submit(job, reserved=True), sonst release()
+    def reserve(self) -> bool:
+        with self._lock:
+            if len(self._waiting) + self._reserved >= self.max_queued:
+                return False
+            self._reserved += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._reserved -= 1
+
+    # Reiht einen Auftrag ein; False, wenn die Warteschlange voll ist (nie mit reserved=True)
+    def submit(self, job: Job, reserved: bool = False) -> bool:
+        with self._lock:
+            if reserved:
+                self._reserved -= 1
+            elif len(self._waiting) + self._reserved >= self.max_queued:
+                return False
+            self.jobs[job.id] = job
+            self._waiting.append(job)
+            started = self._dispatch()
+        self._watch(started)
+        return True
+
+    # Startet wartende Aufträge, solange Prozesse frei sind (Aufruf unter self._lock);
+    # gibt (Auftrag, Future, Pool) der gestarteten zurück, siehe _watch
+    def _dispatch(self) -> list:
+        started = []
+        while self._waiting and self._running < self.workers:
+            job = self._waiting.popleft()
+            job.status, job.started = "running", time.time()
+            self._running += 1
+            args = (run_job, str(job.dir), job.paths, job.numeric, job.engine, job.mdlo_top, job.cohort)
+            try:
+                future = self._pool.submit(*args)
+            except BrokenProcessPool:
+                # Pool defekt, Rückmeldungen der abgebrochenen Aufträge stehen noch aus
+                self._reset_pool()
+                future = self._pool.submit(*args)
+            started.append((job, future, self._pool))
+        return started
+
+    # Meldet das Ende gestarteter Aufträge an _finished. Erst nach Freigabe von self._lock
+    # aufrufen: ist ein Future schon fertig, läuft der Callback sofort in diesem Thread
+    def _watch(self, started: list):
+        for job, future, pool in started:
+            future.add_done_callback(lambda f, job=job, pool=pool: self._finished(job, f, pool))
+
+    def _finished(self, job: Job, future, pool):
+        with self._lock:
+            self._running -= 1
+            job.finished = time.time()
+            try:
+                job.output = future.result()
+                job.status = "done"
+            except BrokenProcessPool as e:
+                job.status, job.error = "failed", f"Worker-Prozess abgebrochen: {e}"
+                # nur einmal je defektem Pool neu aufbauen (alle seine Aufträge melden sich)
+                if pool is self._pool:
+                    self._reset_pool()
+            except Exception as e:
+                job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+            started = self._dispatch()
+        self._watch(started)
+
+    # Ersetzt einen defekten Prozess-Pool (Aufruf unter self._lock)
+    def _reset_pool(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def delete(self, job_id: str) -> bool:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.status in ("queued", "running"):
+                return False
+            del self.jobs[job_id]
+        shutil.rmtree(job.dir, ignore_errors=True)
+        return True
+
+    # Entfernt abgeschlossene Aufträge älter als job_ttl_s
+    def cleanup(self):
+        now = time.time()
+        with self._lock:
+            expired = [j for j in self.jobs.values()
+                       if j.finished is not None and now - j.finished > self.job_ttl_s]
+            for job in expired:
+                del self.jobs[job.id]
+        for job in expired:
+            shutil.rmtree(job.dir, ignore_errors=True)
+
+    def health(self) -> dict:
+        with self._lock:
+            return {"workers": self.workers, "running": self._running,
+                    "queued": len(self._waiting), "uploading": self._reserved,
+                    "max_queued": self.max_queued,
+                    "jobs": len(self.jobs)}
+
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    manager: JobManager = None
+    max_upload_bytes: int = DEFAULT_MAX_UPLOAD_MB * 1024 * 1024
+
+    # ----- Antworten -----
+    def _json(self, status: int, data: dict, headers: dict | None = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str, headers: dict | None = None):
+        self._json(status, {"error": message}, headers)
+
+    def _file(self, path: Path, content_type: str):
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.send_header("Content-Disposition", f'attachment; filename="{path.name}"')
+        self.end_headers()
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, self.wfile)
+
+    def log_message(self, format, *args):
+        sys.stderr.write(f"{time.strftime('%H:%M:%S')}  {self.address_string()}  {format % args}\n")
+
+    # ----- Routen -----
+    def _parts(self) -> list[str]:
+        return [p for p in urlparse(self.path).path.split("/") if p]
+
+    def do_GET(self):
+        self.manager.cleanup()
+        parts = self._parts()
+        if parts == ["health"]:
+            return self._json(HTTPStatus.OK, self.manager.health())
+        if len(parts) in (2, 3) and parts[0] == "jobs":
+            job = self.manager.get(parts[1])
+            if job is None:
+                return self._error(HTTPStatus.NOT_FOUND, "Auftrag unbekannt")
+            if len(parts) == 2:
+                return self._json(HTTPStatus.OK, job.to_dict())
+            if parts[2] == "result":
+                if job.status != "done":
+                    return self._error(HTTPStatus.CONFLICT, f"Auftrag ist {job.status}")
+                fmt = parse_qs(urlparse(self.path).query).get("format", ["xlsx"])[0]
+                if fmt == "json":
+                    return self._file(Path(job.output["json"]), "application/json; charset=utf-8")
+                return self._file(Path(job.output["xlsx"]), XLSX_TYPE)
+        self._error(HTTPStatus.NOT_FOUND, "Unbekannter Pfad")
+
+    def do_DELETE(self):
+        parts = self._parts()
+        if len(parts) == 2 and parts[0] == "jobs":
+            if self.manager.delete(parts[1]):
+                return self._json(HTTPStatus.OK, {"deleted": parts[1]})
+            return self._error(HTTPStatus.CONFLICT, "Auftrag unbekannt oder noch aktiv")
+        self._error(HTTPStatus.NOT_FOUND, "Unbekannter Pfad")
+
+    def do_POST(self):
+        self.manager.cleanup()
+        if self._parts() != ["jobs"]:
+            return self._error(HTTPStatus.NOT_FOUND, "Unbekannter Pfad")
+        # Ablehnungen vor dem Lesen des Bodys: Verbindung schließen, der Rest wird nicht gelesen
+        try:
+            length = int(self.headers.get("Content-Length") or -1)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.close_connection = True
+            return self._error(HTTPStatus.LENGTH_REQUIRED, "Content-Length fehlt")
+        if length > self.max_upload_bytes:
+            self.close_connection = True
+            return self._error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Upload zu groß")
+        if not self.manager.reserve():
+            self.close_connection = True
+            return self._error(HTTPStatus.SERVICE_UNAVAILABLE, "Warteschlange voll",
+                               {"Retry-After": "5"})
+
+        job = job_dir = None
+        try:
+            job_id, job_dir = self.manager.new_job_dir()
+            inputs = job_dir / "inputs"
+            inputs.mkdir()
+            try:
+                fields, files = parse_multipart(self.headers.get("Content-Type", ""), self.rfile,
+                                                length, inputs)
+                job = self._make_job(job_id, job_dir, fields, files)
+            except ValueError as e:
+                # Body evtl. nur teilweise gelesen
+                self.close_connection = True
+                rejected = (HTTPStatus.BAD_REQUEST, str(e), None)
+            else:
+                self.manager.submit(job, reserved=True)
+        finally:
+            # abgelehnte oder abgebrochene Uploads geben ihren Platz frei und hinterlassen
+            # keinen Auftragsordner
+            if job is None:
+                self.manager.release()
+                if job_dir is not None:
+                    shutil.rmtree(job_dir, ignore_errors=True)
+        if job is None:
+            return self._error(*rejected)
+        self._json(HTTPStatus.ACCEPTED, {"id": job_id, "status": job.status,
+                                         "status_url": f"/jobs/{job_id}"},
+                   {"Location": f"/jobs/{job_id}"})
+
+    # Prüft Dateien und Optionen eines Uploads; ValueError mit Meldung für den Aufrufer
+    @classmethod
+    def _make_job(cls, job_id: str, job_dir: Path, fields: dict, files) -> Job:
+        paths, problems = cls._assign_inputs(files)
+        missing = [k for k in MANDATORY_KEYS if paths.get(k) is None]
+        if missing:
+            problems.insert(0, f"Pflichtdateien fehlen: {', '.join(missing)}")
+        if problems:
+            raise ValueError("; ".join(problems))
+        errors = [str(i) for i in validate_inputs(paths) if i.level == "error"]
+        if errors:
+            raise ValueError("; ".join(errors))
+
+        engine = fields.get("engine", "pandas")
+        if engine not in ("pandas", "arrow"):
+            raise ValueError(f"Unbekannte Engine: {engine}")
+        try:
+            mdlo_top = int(fields.get("mdlo_top", DEFAULT_TOP_N))
+        except ValueError:
+            mdlo_top = 0
+        if mdlo_top < 1:
+            raise ValueError("mdlo_top muss eine positive Zahl sein")
+        cohort = fields.get("cohort", "all")
+        if cohort not in ("all", "completed"):
+            raise ValueError(f"Unbekannte Kohorte: {cohort}")
+        return Job(id=job_id, dir=job_dir, paths=paths,
+                   numeric=fields.get("numeric", "") in ("1", "true", "on"), engine=engine,
+                   mdlo_top=mdlo_top, cohort=cohort)
+
+    # Ordnet die hochgeladenen Dateien zu: Feldname large/mcp/self/mdlo oder – sonst –
+    # anhand des Headers. Leere, unlesbare, unbekannte und doppelte Dateien sind Probleme
+    @staticmethod
+    def _assign_inputs(files) -> tuple[dict, list[str]]:
+        paths = {"large": None, "mcp": None, "self": None, "mdlo": None}
+        problems = []
+        for name, filename, path in files:
+            if path.stat().st_size == 0:
+                problems.append(f"{filename}: Datei ist leer")
+                continue
+            key = name
+            if key not in paths:
+                try:
+                    key = detect_csv_type_by_header(str(path))[0]
+                except (StopIteration, UnicodeDecodeError, csv.Error):
+                    problems.append(f"{filename}: keine lesbare CSV-Datei")
+                    continue
+            if key is None:
+                problems.append(f"{filename}: Exporttyp nicht erkannt")
+            elif paths[key] is not None:
+                problems.append(f"{filename}: {key.upper()} doppelt")
+            else:
+                paths[key] = str(path)
+        return paths, problems
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LIKE als lokaler HTTP-Dienst")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-w", "--workers", type=int, default=2, help="Parallele Auswertungen")
+    parser.add_argument("--max-queued", type=int, default=8,
+                        help="Höchstens so viele wartende Aufträge, darüber 503")
+    parser.add_argument("--max-upload-mb", type=int, default=DEFAULT_MAX_UPLOAD_MB)
+    parser.add_argument("--job-ttl", type=float, default=DEFAULT_JOB_TTL_S,
+                        help="Sekunden, die fertige Aufträge abrufbar bleiben")
+    parser.add_argument("--work-dir", help="Ordner für Aufträge (Standard: temporär)")
+    args = parser.parse_args(argv)
+
+    work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix="like_service_"))
+    manager = JobManager(work_dir, workers=args.workers, max_queued=args.max_queued,
+                         job_ttl_s=args.job_ttl)
+    ServiceHandler.manager = manager
+    ServiceHandler.max_upload_bytes = args.max_upload_mb * 1024 * 1024
+
+    server = ThreadingHTTPServer((args.host, args.port), ServiceHandler)
+    print(f"LIKE-Dienst auf http://{args.host}:{server.server_port} "
+          f"(Prozesse: {args.workers}, Warteschlange: {args.max_queued}, Aufträge: {work_dir})",
+          flush=True)
+    # SIGTERM (z.B. vom Lasttest) wie Strg+C behandeln, damit der Pool beendet wird
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        manager.close()
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+# Abschnitte der Auswertung und Abbruch-Signal – bewusst ohne pandas-Import, damit die
+# GUI (app.py) beim Start nur das hier laden muss und den Analyse-Stack erst später.
+
+# Abschnitte von like() in Ausführungsreihenfolge (für Fortschrittsanzeigen)
+LIKE_STAGES = [
+    "Abgeschlossene Learner",
+    "Time To Complete",
+    "Average Accuracy",
+    "Metacognition Progress",
+    "Accuracy Of Self-Assessment",
+    "Self-evaluation",
+    "Competence Level",
+    "Most Difficult Learning Objectives",
+    "Formatierung",
+    "Excel-Export",
+]
+
+
+# Wird vom Fortschritts-Callback geworfen, um eine laufende Auswertung abzubrechen
+class AnalysisCancelled(Exception):
+    pass
@@ -0,0 +1,202 @@
+# Synthetische Testdaten für die vier Exporte (Large Table, Metacognition Progress,
+# Self-Assessment, MDLO). Spalten erfüllen die Header-Signaturen aus csv_types.py, Werte
+# haben dasselbe Format wie die echten Exporte ("87.5%", "01:23:45", "COMPLETED").
+# Keine echten Learner-Daten – für Benchmarks, Paritäts- und Lasttests.
+#
+#   python synthetic.py out_dir --learners 10000 --modules 8 --classes 3
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from LIKE import ORDER_ACC, ORDER_SA
+
+# Dateinamen wie in den echten Exporten
+FILE_NAMES = {
+    "large": "LINDE MH _ KION - LARGE TABLE (ADAPTIVE) (V2).csv",
+    "mcp": "Metacognition Progress.csv",
+    "self": "COMPLETED LEARNERS WITH SELF-ASSESSMENT BY MODULE.csv",
+    "mdlo": "THE MOST DIFFICULT LEARNING OBJECTIVES.csv",
+}
+
+
+@dataclass
+class SyntheticConfig:
+    learners: int = 1_000
+    modules: int = 8
+    classes: int = 3
+    # Anteil Learner × Modul mit "COMPLETED"
+    completion_rate: float = 0.9
+    # Anteil Learner × Modul, die überhaupt eine Zeile haben
+    enrollment_rate: float = 0.98
+    learning_objectives: int = 40
+    seed: int = 0
+
+
+# Genauigkeitsklasse passend zur Genauigkeit (>69 / >50 / <=50)
+def _accuracy_classes(accuracy: np.ndarray, rng) -> np.ndarray:
+    high = np.where(rng.random(len(accuracy)) < 0.5, ORDER_ACC[0], ORDER_ACC[1])
+    return np.where(accuracy > 69, high, np.where(accuracy > 50, ORDER_ACC[2], ORDER_ACC[3]))
+
+
+# Prozentwerte als Text wie im Export ("87.5%")
+def _percent_text(values: np.ndarray) -> np.ndarray:
+    return np.char.add(np.round(values, 1).astype(str), "%")
+
+
+# Sekunden als "HH:MM:SS"
+def _duration_text(seconds: np.ndarray) -> pd.Series:
+    h, rest = np.divmod(seconds, 3600)
+    m, s = np.divmod(rest, 60)
+    return pd.Series(h).astype(str).str.zfill(2) + ":" + pd.Series(m).astype(str).str.zfill(2) \
+        + ":" + pd.Series(s).astype(str).str.zfill(2)
+
+
+# Modul- und Learner-Namen
+def _names(cfg: SyntheticConfig):
+    modules = np.array([f"Module {i + 1:02d} - Topic {i + 1}" for i in range(cfg.modules)], dtype=object)
+    classes = np.array([f"Class {chr(65 + i % 26)}{i // 26 or ''}" for i in range(cfg.classes)], dtype=object)
+    learners = np.array([f"learner{i:07d}@example.com" for i in range(cfg.learners)], dtype=object)
+    return learners, modules, classes
+
+
+def large_table(cfg: SyntheticConfig) -> pd.DataFrame:
+    rng = np.random.default_rng(cfg.seed)
+    learners, modules, classes = _names(cfg)
+
+    learner_idx = np.repeat(np.arange(cfg.learners), cfg.modules)
+    module_idx = np.tile(np.arange(cfg.modules), cfg.learners)
+    keep = rng.random(len(learner_idx)) < cfg.enrollment_rate
+    learner_idx, module_idx = learner_idx[keep], module_idx[keep]
+    n = len(learner_idx)
+
+    # jeder Learner gehört genau zu einer Klasse
+    class_of_learner = rng.integers(0, cfg.classes, cfg.learners)
+    completed = rng.random(n) < cfg.completion_rate
+
+    accuracy = rng.uniform(20, 100, n)
+    # Kompetenzanteile summieren sich zu 100 %
+    shares = rng.dirichlet([1.0, 1.5, 1.0, 3.0], n) * 100
+    seconds = rng.gamma(2.0, 900.0, n).astype(np.int64) + 60
+
+    return pd.DataFrame({
+        "Learner": learners[learner_idx],
+        "Module": modules[module_idx],
+        "Class Description": classes[class_of_learner[learner_idx]],
+        "Completion Status": np.where(completed, "COMPLETED", "IN_PROGRESS"),
+        "Sum Time Spent": _duration_text(seconds).to_numpy(),
+        "Accuracy": _percent_text(accuracy),
+        "Accuracy-Classes": _accuracy_classes(accuracy, rng),
+        "Unconscious Incompetent": _percent_text(shares[:, 0]),
+        "Conscious Incompetent": _percent_text(shares[:, 1]),
+        "Unconscious Competent": _percent_text(shares[:, 2]),
+        "Conscious Competent": _percent_text(shares[:, 3]),
+        "Last Activity": "2025-01-01",
+    })
+
+
+def metacognition_progress(cfg: SyntheticConfig) -> pd.DataFrame:
+    rng = np.random.default_rng(cfg.seed + 1)
+    _, _, classes = _names(cfg)
+    n = len(classes)
+    initial = rng.dirichlet([1.0, 1.5, 1.0, 3.0], n)
+    current = rng.dirichlet([0.5, 1.0, 1.0, 5.0], n)
+    return pd.DataFrame({
+        "Class Name": classes,
+        "Progress": rng.uniform(0.5, 1.0, n).round(4),
+        "Initial Unconscious Incompetence": initial[:, 0].round(4),
+        "Initial Conscious Incompetence": initial[:, 1].round(4),
+        "Initial Unconscious Competence": initial[:, 2].round(4),
+        "Initial Conscious Competence": initial[:, 3].round(4),
+        "Current Unconscious Competence": current[:, 2].round(4),
+        "Current Conscious Competence": current[:, 3].round(4),
+        "Improvement Conscious Competence": (current[:, 3] - initial[:, 3]).round(4),
+        "Improvement Unconscious Incompetence": (current[:, 0] - initial[:, 0]).round(4),
+    })
+
+
+def self_assessment(cfg: SyntheticConfig) -> pd.DataFrame:
+    rng = np.random.default_rng(cfg.seed + 2)
+    learners, modules, _ = _names(cfg)
+    learner_idx = np.repeat(np.arange(cfg.learners), cfg.modules)
+    module_idx = np.tile(np.arange(cfg.modules), cfg.learners)
+    keep = rng.random(len(learner_idx)) < cfg.completion_rate
+    learner_idx, module_idx = learner_idx[keep], module_idx[keep]
+    n = len(learner_idx)
+    correct = rng.integers(5, 40, n)
+    wrong = rng.integers(0, 20, n)
+    return pd.DataFrame({
+        "Learner": learners[learner_idx],
+        "Module": modules[module_idx],
+        "Self Assessment": np.array(ORDER_SA, dtype=object)[
+            rng.choice(len(ORDER_SA), n, p=[0.1, 0.2, 0.35, 0.25, 0.1])],
+        "Average Progress": _percent_text(rng.uniform(50, 100, n)),
+        "Time": _duration_text(rng.integers(300, 7200, n)).to_numpy(),
+        "Correct": correct,
+        "Wrong": wrong,
+        "Accuracy": _percent_text(correct / (correct + wrong) * 100),
+    })
+
+
+def mdlo(cfg: SyntheticConfig) -> pd.DataFrame:
+    rng = np.random.default_rng(cfg.seed + 3)
+    _, modules, _ = _names(cfg)
+    n = cfg.learning_objectives
+    return pd.DataFrame({
+        "Module": modules[rng.integers(0, len(modules), n)],
+        "Learning Objective": [f"Learning objective {i + 1}" for i in range(n)],
+        "Unconsciously Incompetent": rng.uniform(0, 60, n).round(2),
+        "Wrong Answers": rng.integers(0, 500, n),
+        "Open in Curator": [f"https://curator.example.com/lo/{i + 1}" for i in range(n)],
+    })
+
+
+# Alle vier Exporte als DataFrames
+def dataset(cfg: SyntheticConfig) -> dict[str, pd.DataFrame]:
+    return {
+        "large": large_table(cfg),
+        "mcp": metacognition_progress(cfg),
+        "self": self_assessment(cfg),
+        "mdlo": mdlo(cfg),
+    }
+
+
+# Schreibt die vier Exporte als CSV (Semikolon, UTF-8) nach out_dir; gibt die Pfade zurück
+def write_dataset(out_dir, cfg: SyntheticConfig) -> dict[str, Path]:
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for key, df in dataset(cfg).items():
+        paths[key] = out_dir / FILE_NAMES[key]
+        df.to_csv(paths[key], sep=";", index=False, encoding="utf-8")
+    return paths
+
+
+# Anzahl Learner für eine gewünschte Zeilenzahl der Large Table
+def learners_for_rows(rows: int, cfg: SyntheticConfig) -> int:
+    return max(1, int(round(rows / (cfg.modules * cfg.enrollment_rate))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetische LIKE-Exporte erzeugen")
+    parser.add_argument("out_dir")
+    parser.add_argument("--learners", type=int, default=1_000)
+    parser.add_argument("--rows", type=int, help="Zielzeilen der Large Table (statt --learners)")
+    parser.add_argument("--modules", type=int, default=8)
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--completion-rate", type=float, default=0.9)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    cfg = SyntheticConfig(learners=args.learners, modules=args.modules, classes=args.classes,
+                          completion_rate=args.completion_rate, seed=args.seed)
+    if args.rows:
+        cfg.learners = learners_for_rows(args.rows, cfg)
+    for key, path in write_dataset(args.out_dir, cfg).items():
+        print(f"{key:<6} {path}")
+
+
+if __name__ == "__main__":
+    main()
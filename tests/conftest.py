@@ -0,0 +1,7 @@
+# Module liegen flach im Projektordner -> für die Tests importierbar machen
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
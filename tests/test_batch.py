@@ -0,0 +1,29 @@
+# Stapelauswertung: ein nicht beschreibbarer Verlauf kostet nicht das Ergebnis des Landes
+from batch import run_batch, run_country
+from history import RunHistory
+from synthetic import SyntheticConfig, write_dataset
+
+
+def test_history_failure_keeps_result(tmp_path):
+    paths = write_dataset(tmp_path / "CZ", SyntheticConfig(learners=50))
+    # ein Ordner statt einer Datenbankdatei -> sqlite3.OperationalError
+    blocked = tmp_path / "history.sqlite"
+    blocked.mkdir()
+    row = run_country("CZ", paths, str(tmp_path / "out"),
+                      history=str(blocked))
+    assert (tmp_path / "out" / "CZ").exists()
+    assert row["output_file"].endswith(".xlsx")
+    assert len(row["warnings"]) == 1
+    assert row["warnings"][0].startswith("Verlauf nicht gespeichert")
+
+
+def test_batch_records_history_with_options(tmp_path):
+    write_dataset(tmp_path / "in" / "CZ", SyntheticConfig(learners=50))
+    db = tmp_path / "history.sqlite"
+    for cohort in ("all", "completed"):
+        results = run_batch(tmp_path / "in", tmp_path / "out", workers=1, history=str(db),
+                            cohort=cohort)
+        assert [r["status"] for r in results] == ["ok"]
+        assert "warnings" not in results[0]
+    with RunHistory(db) as history:
+        assert sorted(r[3] for r in history.runs("CZ")) == ["all", "completed"]
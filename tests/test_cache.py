@@ -0,0 +1,37 @@
+# Parquet-Cache: gleichzeitige Schreiber desselben Eintrags nutzen getrennte temporäre Dateien
+import os
+import threading
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from cache import ParquetCache  # noqa: E402
+
+
+def test_concurrent_writers_use_own_temp_files(tmp_path, monkeypatch):
+    source = tmp_path / "export.csv"
+    source.write_text("a;b\n1;2\n", encoding="utf-8")
+    cache = ParquetCache(tmp_path / "cache")
+    replaced = []
+    barrier = threading.Barrier(2)
+    real_replace = os.replace
+
+    # beide Schreiber haben ihre Datei geschrieben, bevor einer sie veröffentlicht
+    def replace(src, dst):
+        replaced.append(src)
+        barrier.wait(timeout=10)
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", replace)
+    frames = [pd.DataFrame({"x": range(n)}) for n in (1000, 2000)]
+    threads = [threading.Thread(target=cache.put, args=(source, "large", df)) for df in frames]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(replaced)) == 2
+    assert len(cache.get(source, "large")) in (1000, 2000)
+    assert list((tmp_path / "cache").glob("*.tmp")) == []
@@ -0,0 +1,103 @@
+# Kohorte der Selbsteinschätzung: "all" wie bisher, "completed" wie Filter + value_counts je
+# Modul auf die abgeschlossenen Learner, alle übrigen Abschnitte unabhängig von der Kohorte
+import pandas as pd
+import pytest
+
+from LIKE import (
+    ORDER_SA, LearnerSet, add_self_assessment_summary, completed_learners_of, compute_like,
+    restrict_to_cohort,
+)
+from arrow_engine import arrow_available
+from loader import load_export, load_large_table
+from synthetic import SyntheticConfig, write_dataset
+
+ENGINES = ["pandas"] + (["arrow"] if arrow_available() else [])
+
+# Abschnitte, die nicht von der Kohorte abhängen (MCP-Export ist aggregiert, ohne Learner)
+UNCHANGED_FIELDS = ["time_seconds", "avg_acc", "mcp", "acc_of_self_assessment",
+                    "competence_by_module", "mdlo", "mdlo_by_module"]
+
+
+# Referenz wie früher: je Modul filtern und value_counts (Prozent, 2 Nachkommastellen)
+def reference_self_assessment(df_self, modules, learners=None) -> pd.DataFrame:
+    if learners is not None:
+        df_self = df_self[df_self["Learner"].isin(set(learners))]
+    result = pd.DataFrame({"Module": list(modules)})
+    for value in ORDER_SA:
+        result[value] = 0.0
+    for i, module in enumerate(modules):
+        counts = df_self.loc[df_self["Module"] == module, "Self Assessment"].value_counts()
+        total = counts.sum()
+        for value in ORDER_SA:
+            if total and value in counts.index:
+                result.loc[i, value] = round(counts[value] / total * 100, 2)
+    return add_self_assessment_summary(result)
+
+
+def assert_same(a: pd.DataFrame, b: pd.DataFrame):
+    pd.testing.assert_frame_equal(a.reset_index(drop=True), b.reset_index(drop=True),
+                                  check_dtype=False, atol=1e-9)
+
+
+@pytest.fixture(scope="module", params=[
+    SyntheticConfig(learners=300),
+    SyntheticConfig(learners=150, modules=3, classes=5, completion_rate=0.6, seed=2),
+])
+def data(request, tmp_path_factory):
+    paths = write_dataset(tmp_path_factory.mktemp("data"), request.param)
+    df_large = load_large_table(paths["large"], completed_only=True)
+    return (df_large, load_export(paths["mcp"]), load_export(paths["self"]),
+            load_export(paths["mdlo"]))
+
+
+@pytest.fixture(scope="module")
+def completed(data):
+    df_large = data[0]
+    return completed_learners_of(df_large[df_large["Completion Status"] == "COMPLETED"])
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_cohorts_match_reference(data, completed, engine):
+    df_large, df_mcp, df_self, df_mdlo = data
+    modules = sorted(df_large["Module"].unique())
+    results = {cohort: compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine,
+                                    cohort=cohort)
+               for cohort in ("all", "completed")}
+
+    assert_same(results["all"].self_assessment, reference_self_assessment(df_self, modules))
+    assert_same(results["completed"].self_assessment,
+                reference_self_assessment(df_self, modules, completed))
+    assert results["all"].amount_of_learners == results["completed"].amount_of_learners
+    for field in UNCHANGED_FIELDS:
+        assert_same(getattr(results["all"], field), getattr(results["completed"], field))
+
+
+def test_cohort_is_a_real_subset(data, completed):
+    df_self = data[2]
+    subset = restrict_to_cohort(df_self, LearnerSet(completed))
+    assert 0 < len(subset) < len(df_self)
+    assert set(subset["Learner"]) <= set(completed)
+
+
+def test_learner_set_matches_isin(data, completed):
+    df_self = data[2]
+    learner_set = LearnerSet(completed)
+    mask = learner_set.contains(df_self["Learner"])
+    assert (mask == df_self["Learner"].isin(completed).to_numpy()).all()
+    assert (learner_set.contains(df_self["Learner"].astype("category")) == mask).all()
+
+
+# MCP-Export mit Learner-Spalte, in dem kein Learner der Kohorte vorkommt: leere Werte statt Fehler
+@pytest.mark.parametrize("engine", ENGINES)
+def test_empty_mcp_subset(data, completed, engine, tmp_path):
+    from exporters import export_xlsx
+    from history import result_rows
+
+    df_large, df_mcp, df_self, df_mdlo = data
+    df_mcp = df_mcp.assign(Learner="nicht-in-der-kohorte@example.com")
+    result = compute_like(df_large, df_mcp, df_self, df_mdlo, engine=engine, cohort="completed")
+    assert len(result.mcp) == 6
+    assert result.mcp["Value"].isna().all()
+    assert not any(metric.startswith("mcp/") for metric, *_ in result_rows(result))
+    export_xlsx(result, tmp_path / "out.xlsx")
+    export_xlsx(result, tmp_path / "numeric.xlsx", numeric=True)
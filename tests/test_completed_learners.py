@@ -0,0 +1,46 @@
+# Eigenschaftstest: vektorisierter Filter "Learner mit allen Modulen" gegen den früheren Weg
+# mit einem set je Learner, auf zufälligen Tabellen (Strings und Categoricals)
+import numpy as np
+import pandas as pd
+import pytest
+
+from LIKE import completed_learners_of
+
+
+# Früherer Weg aus like(): set der Module je Learner mit der Menge aller Module vergleichen
+def completed_learners_sets(df) -> list:
+    modules_names = set(df["Module"].unique())
+    modules_per_learner = df.groupby("Learner", observed=True)["Module"].apply(set)
+    return sorted(modules_per_learner[modules_per_learner == modules_names].index)
+
+
+def random_rows(seed: int, categorical: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    n_learners = int(rng.integers(1, 40))
+    n_modules = int(rng.integers(1, 6))
+    n = int(rng.integers(0, 200))
+    df = pd.DataFrame({
+        "Learner": [f"learner{i}" for i in rng.integers(0, n_learners, n)],
+        "Module": [f"Modul {i}" for i in rng.integers(0, n_modules, n)],
+    })
+    # Zeilen ohne Learner-Namen zählen nicht
+    df.loc[rng.random(n) < 0.05, "Learner"] = None
+    return df.astype("category") if categorical else df
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+@pytest.mark.parametrize("seed", range(50))
+def test_matches_set_per_learner(seed, categorical):
+    df = random_rows(seed, categorical)
+    result = completed_learners_of(df)
+    assert list(map(str, result)) == list(map(str, completed_learners_sets(df)))
+    assert result.is_monotonic_increasing
+
+
+def test_every_learner_complete():
+    df = pd.DataFrame({"Learner": ["b", "a", "b", "a"], "Module": ["M1", "M1", "M2", "M2"]})
+    assert list(completed_learners_of(df)) == ["a", "b"]
+
+
+def test_empty():
+    assert len(completed_learners_of(pd.DataFrame({"Learner": [], "Module": []}))) == 0
@@ -0,0 +1,81 @@
+# Regressionstest: gruppierte Verteilung je Modul (distribution_by_module) gegen die frühere
+# Schleife über alle Module (Filter + value_counts je Modul) aus dem Notebook
+import numpy as np
+import pandas as pd
+import pytest
+
+from LIKE import (
+    ORDER_ACC, ORDER_SA, add_accuracy_summary, add_self_assessment_summary,
+    distribution_by_module, self_assessment_by_module,
+)
+
+
+# Frühere Berechnung aus like(): je Modul filtern, value_counts(normalize=True), fehlende
+# Stufen mit 0 auffüllen
+def per_module_loop(df, column, modules, order):
+    rows = []
+    for module in modules:
+        subset = df[df["Module"] == module]
+        percentages = (subset[column].value_counts(normalize=True) * 100).round(2)
+        row = {"Module": module}
+        for value in order:
+            row[value] = percentages.get(value, 0)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def large_table():
+    # Modul C ohne "firm knowledge", Modul B nur eine Stufe, "hands-on ..." kommt nie vor;
+    # ein unbekannter Wert zählt im Nenner mit, fehlende Werte nicht
+    return pd.DataFrame({
+        "Module": ["A", "A", "A", "A", "B", "B", "C", "C", "C", "A"],
+        "Accuracy-Classes": [
+            ORDER_ACC[0], ORDER_ACC[1], ORDER_ACC[1], ORDER_ACC[2],
+            ORDER_ACC[2], ORDER_ACC[2],
+            ORDER_ACC[1], "unbekannt", np.nan,
+            ORDER_ACC[0],
+        ],
+    })
+
+
+@pytest.fixture
+def self_assessment():
+    # Modul C fehlt ganz, "Expert" kommt nie vor, Modul X gibt es in der Large Table nicht
+    return pd.DataFrame({
+        "Module": ["A", "A", "A", "B", "B", "B", "X"],
+        "Self Assessment": ["Novice", "Competent", "Competent", "Proficient",
+                            "Advanced beginner", np.nan, "Novice"],
+    })
+
+
+def test_accuracy_matches_per_module_loop(large_table):
+    modules = sorted(large_table["Module"].unique())
+    expected = add_accuracy_summary(
+        per_module_loop(large_table, "Accuracy-Classes", modules, ORDER_ACC))
+    result = add_accuracy_summary(
+        distribution_by_module(large_table, "Accuracy-Classes", modules, ORDER_ACC))
+    pd.testing.assert_frame_equal(result, expected)
+    # Stufe ohne Vorkommen bleibt wie bisher ganzzahlig 0
+    assert (result[ORDER_ACC[3]] == 0).all()
+    assert list(result.columns[-3:]) == [">69%", "<=69% - >50%", "<= 50%"]
+
+
+def test_self_evaluation_matches_per_module_loop(large_table, self_assessment):
+    modules = sorted(large_table["Module"].unique())
+    expected = add_self_assessment_summary(
+        per_module_loop(self_assessment, "Self Assessment", modules, ORDER_SA))
+    result = self_assessment_by_module(self_assessment, modules)
+    pd.testing.assert_frame_equal(result, expected)
+    # Modul ohne Selbsteinschätzung: überall 0
+    assert (result.loc[result["Module"] == "C", ORDER_SA] == 0).all(axis=None)
+    assert list(result.columns[-3:]) == ["Professional", "Competent 2", "Beginner"]
+
+
+# Kategoriale Spalten (loader.py) liefern dieselben Werte
+def test_categorical_columns(large_table):
+    modules = sorted(large_table["Module"].unique())
+    expected = distribution_by_module(large_table, "Accuracy-Classes", modules, ORDER_ACC)
+    result = distribution_by_module(large_table.astype("category"), "Accuracy-Classes",
+                                    modules, ORDER_ACC)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
@@ -0,0 +1,44 @@
+# Parität pandas- gegen Arrow-Engine von compute_like auf kleinen synthetischen Exporten
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from LIKE import compute_like  # noqa: E402
+from arrow_engine import load_large_table_arrow  # noqa: E402
+from incremental import compare_results  # noqa: E402
+from loader import load_export, load_large_table  # noqa: E402
+from synthetic import SyntheticConfig, write_dataset  # noqa: E402
+
+
+@pytest.fixture(scope="module", params=[
+    SyntheticConfig(learners=300),
+    SyntheticConfig(learners=150, modules=3, classes=5, completion_rate=0.7, seed=1),
+])
+def exports(request, tmp_path_factory):
+    paths = write_dataset(tmp_path_factory.mktemp("data"), request.param)
+    return paths, load_export(paths["mcp"]), load_export(paths["self"]), load_export(paths["mdlo"])
+
+
+@pytest.mark.parametrize("options", [{}, {"mdlo_top": 3}, {"cohort": "completed"}])
+def test_arrow_matches_pandas(exports, options):
+    paths, df_mcp, df_self, df_mdlo = exports
+    expected = compute_like(load_large_table(paths["large"], completed_only=True),
+                            df_mcp, df_self, df_mdlo, **options)
+    result = compute_like(load_large_table_arrow(paths["large"], completed_only=True),
+                          df_mcp, df_self, df_mdlo, engine="arrow", **options)
+    assert compare_results(expected, result) == []
+    assert expected.amount_of_learners > 0
+
+
+# Arrow-Engine nimmt auch einen pandas-DataFrame (z.B. aus dem Cache)
+def test_arrow_accepts_pandas_frame(exports):
+    paths, df_mcp, df_self, df_mdlo = exports
+    df_large = load_large_table(paths["large"])
+    assert compare_results(compute_like(df_large, df_mcp, df_self, df_mdlo),
+                           compute_like(df_large, df_mcp, df_self, df_mdlo, engine="arrow")) == []
+
+
+def test_unknown_engine(exports):
+    paths, df_mcp, df_self, df_mdlo = exports
+    with pytest.raises(ValueError):
+        compute_like(load_large_table(paths["large"]), df_mcp, df_self, df_mdlo, engine="polars")
@@ -0,0 +1,123 @@
+# Excel-Export: Zellwerte, Spaltenbreiten und Zahlenformate (Text- und numerischer Modus)
+import dataclasses
+import datetime as dt
+import json
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("openpyxl")
+
+from openpyxl import load_workbook  # noqa: E402
+
+from LIKE import LikeResult  # noqa: E402
+from exporters import (  # noqa: E402
+    DURATION_FORMAT, PERCENT_FORMAT, PERCENT_INT_FORMAT, column_widths, export_json,
+    export_xlsx, format_hm, format_sheets, numeric_sheets,
+)
+
+
+@pytest.fixture
+def result():
+    modules = ["Modul A", "Modul B"]
+    return LikeResult(
+        amount_of_learners=42,
+        time_seconds=pd.DataFrame({
+            "Class Description": ["Klasse 1", "Klasse 2"],
+            "Average Time Needed To Complete All Modules": [3725.5, 59.0],
+            "Min. Time Needed To Complete All Modules": [60, 0],
+            "Max. Time Needed To Complete All Modules": [90000, 120],
+            "Total Time Needed To Complete All Modules": [180000, 3600],
+        }),
+        avg_acc=pd.DataFrame({"Class Description": ["Klasse 1", "Klasse 2"],
+                              "Average Accuracy (all modules)": [87.5, 50.0]}),
+        mcp=pd.DataFrame({"Description": ["UI", "CI"], "Value": [25, 3]}),
+        acc_of_self_assessment=pd.DataFrame({"Module": modules, "firm knowledge": [12.5, 0.0],
+                                             ">69%": [12.5, 0]}),
+        self_assessment=pd.DataFrame({"Module": modules, "Novice": [33.33, 100.0]}),
+        competence_by_module=pd.DataFrame({"Module": modules, "Competent": [66.67, 1.5]}),
+        mdlo=pd.DataFrame({"Module": ["Modul A"], "Learning Objective": ["Lernziel 1"],
+                           "Unconsciously Incompetent": [12.0]}),
+        mdlo_by_module=pd.DataFrame({"Module": modules, "Learning Objective": ["L1", "L2"],
+                                     "Unconsciously Incompetent": [12.0, 7.0]}),
+    )
+
+
+def read_sheets(path) -> dict[str, list[tuple]]:
+    wb = load_workbook(path)
+    return {ws.title: [tuple(c.value for c in row) for row in ws.iter_rows()] for ws in wb}
+
+
+# openpyxl liest Zellen mit Zeitformat als time/timedelta zurück -> Bruchteil eines Tages
+def as_number(value):
+    if isinstance(value, dt.time):
+        return (value.hour * 3600 + value.minute * 60 + value.second
+                + value.microsecond / 1e6) / 86400
+    if isinstance(value, dt.timedelta):
+        return value.total_seconds() / 86400
+    return value
+
+
+def expected_rows(df: pd.DataFrame) -> list[tuple]:
+    body = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    return [tuple(str(c) for c in df.columns), *[tuple(row) for row in body]]
+
+
+def test_text_export_cells_and_widths(result, tmp_path):
+    path = export_xlsx(result, tmp_path / "out.xlsx")
+    sheets = format_sheets(result)
+    written = read_sheets(path)
+    assert list(written) == list(sheets)
+    for name, df in sheets.items():
+        assert written[name] == expected_rows(df), name
+
+    # deutsche Texte wie bisher
+    assert written["Avg Accuracy"][1][1] == "87,5%"
+    assert written["Time Needed"][1][1] == format_hm(3725.5) == "1h 2m"
+
+    ws = load_workbook(path)["Time Needed"]
+    assert ws["A1"].font.bold
+    widths = column_widths(sheets["Time Needed"])
+    assert [ws.column_dimensions[c].width for c in "ABCDE"] == widths
+
+
+def test_numeric_export_values_and_formats(result, tmp_path):
+    path = export_xlsx(result, tmp_path / "out.xlsx", numeric=True)
+    sheets, formats = numeric_sheets(result)
+    wb = load_workbook(path)
+    assert wb.sheetnames == list(sheets)
+
+    for name, df in sheets.items():
+        ws = wb[name]
+        fmts = formats.get(name, {})
+        for j, col in enumerate(df.columns, start=1):
+            for i, value in enumerate(df[col], start=2):
+                cell = ws.cell(row=i, column=j)
+                assert as_number(cell.value) == pytest.approx(value), (name, col)
+                assert cell.number_format == fmts.get(col, "General"), (name, col)
+
+    assert wb["Avg Accuracy"]["B2"].value == pytest.approx(0.875)
+    assert wb["Avg Accuracy"]["B2"].number_format == PERCENT_FORMAT
+    assert wb["Metacognition Progress"]["B2"].number_format == PERCENT_INT_FORMAT
+    assert as_number(wb["Time Needed"]["C3"].value) == 0
+    assert as_number(wb["Time Needed"]["D2"].value) == pytest.approx(90000 / 86400)
+    assert wb["Time Needed"]["D2"].number_format == DURATION_FORMAT
+
+
+# beim Standard-N derselbe Name wie bisher (inkl. Schreibweise)
+@pytest.mark.parametrize("mdlo_top, name", [(5, "5 Most Dfficult Objectives"),
+                                             (10, "10 Most Dfficult Objectives"),
+                                             (None, "5 Most Dfficult Objectives")])
+def test_mdlo_sheet_name_follows_n(result, tmp_path, mdlo_top, name):
+    result = dataclasses.replace(result, mdlo_top=mdlo_top)
+    assert list(format_sheets(result))[-2:] == [name, "Difficult Objectives By Module"]
+    assert name in numeric_sheets(result)[0]
+    assert load_workbook(export_xlsx(result, tmp_path / "out.xlsx")).sheetnames[7] == name
+
+
+def test_json_export(result, tmp_path):
+    data = json.loads(export_json(result, tmp_path / "out.json").read_text(encoding="utf-8"))
+    assert data["amount_of_learners"] == 42
+    assert data["avg_acc"][0] == {"Class Description": "Klasse 1",
+                                  "Average Accuracy (all modules)": 87.5}
+    assert len(data["mdlo_by_module"]) == 2
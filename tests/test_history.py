@@ -0,0 +1,40 @@
+# Verlauf: Kohorte gehört zum Lauf, Anzahl MDLO ist nur Angabe, Trendabfragen über den Index
+from history import RunHistory
+
+
+def rows(value):
+    return [("avg_acc/Accuracy", "Klasse A", "", value),
+            ("self_assessment/Yes", "", "Modul 1", value * 2)]
+
+
+def test_cohorts_do_not_replace_each_other(tmp_path):
+    with RunHistory(tmp_path / "h.sqlite") as history:
+        history.record_rows("CZ", rows(1.0), "2024-03-01", cohort="all")
+        history.record_rows("CZ", rows(2.0), "2024-03-01", cohort="completed")
+        assert len(history.runs("CZ")) == 2
+        # gleiche Kohorte am selben Tag ersetzt den Lauf
+        history.record_rows("CZ", rows(4.0), "2024-03-01", cohort="completed")
+        assert len(history.runs("CZ")) == 2
+
+        assert [r[-1] for r in history.trend("avg_acc/Accuracy", cohort="completed")] == [4.0]
+        assert [r[-1] for r in history.trend("avg_acc/Accuracy")] == [1.0]
+        assert history._conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0] == 4
+
+
+# eine andere Anzahl MDLO ändert keine Kennzahl: kein zweiter Lauf, keine doppelten Punkte
+def test_mdlo_top_does_not_duplicate_runs(tmp_path):
+    with RunHistory(tmp_path / "h.sqlite") as history:
+        history.record_rows("CZ", rows(1.0), "2024-03-01")
+        history.record_rows("CZ", rows(1.0), "2024-03-01", mdlo_top=10)
+        assert [r[3:5] for r in history.runs()] == [("all", 10)]
+        assert [r[-1] for r in history.trend("avg_acc/Accuracy")] == [1.0]
+
+
+def test_trend_reads_only_the_index(tmp_path):
+    with RunHistory(tmp_path / "h.sqlite") as history:
+        history.record_rows("CZ", rows(1.0), "2024-03-01")
+        plan = " ".join(r[-1] for r in history._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT run_date, country, class, module, value FROM metrics"
+            " WHERE metric = ? AND cohort = ? AND country = ? ORDER BY run_date",
+            ("avg_acc/Accuracy", "all", "CZ")))
+        assert "COVERING INDEX ix_metrics_trend" in plan
@@ -0,0 +1,104 @@
+# Inkrementelle Auswertung: mehrere eingefaltete Exporte (mit ersetzten und neu berührten
+# Gruppen) müssen denselben Bericht liefern wie compute_like über den zusammengeführten Stand
+import dataclasses
+
+import pandas as pd
+import pytest
+
+from LIKE import compute_like
+from incremental import GROUP_KEYS, AggregateState, compare_results
+from synthetic import SyntheticConfig, large_table, mdlo, metacognition_progress, self_assessment
+
+CFG = SyntheticConfig(learners=200, modules=5, classes=3, completion_rate=0.85, seed=3)
+
+
+# Späterer Export ersetzt alle Gruppen (Klasse, Modul, Learner), die er enthält
+def merge(merged: pd.DataFrame | None, batch: pd.DataFrame) -> pd.DataFrame:
+    if merged is None:
+        return batch
+    touched = pd.MultiIndex.from_frame(batch[GROUP_KEYS])
+    kept = merged[~pd.MultiIndex.from_frame(merged[GROUP_KEYS]).isin(touched)]
+    return pd.concat([kept, batch], ignore_index=True)
+
+
+@pytest.fixture(scope="module")
+def batches() -> list[pd.DataFrame]:
+    full = large_table(CFG)
+    n = len(full)
+    first = full.iloc[: int(n * 0.6)].copy()
+
+    # überlappt mit dem ersten Export: ein Teil der Gruppen kommt mit neuem Stand wieder
+    second = full.iloc[int(n * 0.4):].copy()
+    overlap = second.index[second.index < int(n * 0.6)]
+    second.loc[overlap[::2], "Accuracy"] = "99.5%"
+    second.loc[overlap[::2], "Sum Time Spent"] = "03:00:00"
+    second.loc[overlap[1::3], "Completion Status"] = "IN_PROGRESS"
+    second.loc[overlap[2::3], "Completion Status"] = "COMPLETED"
+
+    # reiner Delta-Export: wenige Gruppen aus dem ersten Export, einige davon mehrfach
+    delta = full.iloc[: int(n * 0.2): 7].copy()
+    delta["Accuracy-Classes"] = "firm knowledge"
+    delta["Unconscious Incompetent"] = "0%"
+    delta = pd.concat([delta, delta.iloc[:3].assign(**{"Sum Time Spent": "00:10:00"})],
+                      ignore_index=True)
+    return [first, second, delta]
+
+
+@pytest.fixture(scope="module")
+def small_exports():
+    return metacognition_progress(CFG), self_assessment(CFG), mdlo(CFG)
+
+
+@pytest.mark.parametrize("options", [{}, {"mdlo_top": 2}, {"cohort": "completed"}])
+def test_folded_batches_match_full_recompute(batches, small_exports, options):
+    df_mcp, df_self, df_mdlo = small_exports
+    state, merged = AggregateState(), None
+    for i, batch in enumerate(batches):
+        state.fold(batch, source=f"batch{i}")
+        merged = merge(merged, batch)
+
+    full = compute_like(merged, df_mcp, df_self, df_mdlo, **options)
+    assert compare_results(state.to_result(df_mcp, df_self, df_mdlo, **options), full) == []
+    assert [s["source"] for s in state.sources] == ["batch0", "batch1", "batch2"]
+
+
+# Gespeicherter Zustand und blockweises Einfalten einer CSV ergeben dasselbe
+def test_state_roundtrip_and_csv(batches, small_exports, tmp_path):
+    df_mcp, df_self, df_mdlo = small_exports
+    state = AggregateState()
+    state.fold(batches[0])
+    state.save(tmp_path / "state.pkl")
+
+    csv = tmp_path / "second.csv"
+    batches[1].to_csv(csv, sep=";", index=False, encoding="utf-8")
+    loaded = AggregateState.load(tmp_path / "state.pkl")
+    loaded.fold_csv(csv, chunksize=97)
+
+    full = compute_like(merge(batches[0], batches[1]), df_mcp, df_self, df_mdlo)
+    assert compare_results(loaded.to_result(df_mcp, df_self, df_mdlo), full) == []
+
+
+def test_replaced_groups_change_result(batches, small_exports):
+    df_mcp, df_self, df_mdlo = small_exports
+    before, after = AggregateState(), AggregateState()
+    before.fold(batches[0])
+    after.fold(batches[0])
+    after.fold(batches[1])
+    assert compare_results(before.to_result(df_mcp, df_self, df_mdlo),
+                           after.to_result(df_mcp, df_self, df_mdlo)) != []
+
+
+# gerundete Werte an einer Rundungsgrenze gelten als gleich, größere Abweichungen nicht
+def test_compare_results_allows_rounding_boundary(small_exports):
+    df_mcp, df_self, df_mdlo = small_exports
+    result = compute_like(large_table(CFG), df_mcp, df_self, df_mdlo)
+    column = "Average Accuracy (all modules)"
+
+    def shifted(delta):
+        return dataclasses.replace(result, avg_acc=result.avg_acc.assign(
+            **{column: result.avg_acc[column].round(2) + delta}))
+
+    base = shifted(0.0)
+    assert compare_results(base, shifted(0.01)) == []
+    assert compare_results(base, shifted(-0.01)) == []
+    assert compare_results(base, shifted(0.02)) != []
@@ -0,0 +1,36 @@
+# Learner-Index aus der ungefilterten Large Table: begonnene Module zählen nicht als abgeschlossen
+import pandas as pd
+
+from learner_index import LearnerIndex
+from loader import load_large_table
+
+
+def test_incomplete_module_is_listed_but_not_completed(tmp_path):
+    path = tmp_path / "large.csv"
+    pd.DataFrame({
+        "Learner": ["anna", "anna", "ben", "ben"],
+        "Module": ["Modul 1", "Modul 2", "Modul 1", "Modul 2"],
+        "Class Description": "Klasse A",
+        "Completion Status": ["COMPLETED", "IN_PROGRESS", "COMPLETED", "COMPLETED"],
+        "Sum Time Spent": ["00:10:00", "00:05:00", "00:20:00", "00:30:00"],
+        "Accuracy": ["80%", "40%", "60%", "70%"],
+        "Accuracy-Classes": "B",
+        "Unconscious Incompetent": "10%",
+        "Conscious Incompetent": "20%",
+        "Unconscious Competent": "30%",
+        "Conscious Competent": "40%",
+        "Last Activity": "2025-01-01",
+    }).to_csv(path, sep=";", index=False)
+    df_self = pd.DataFrame({"Learner": ["anna"], "Module": ["Modul 3"], "Self Assessment": ["Yes"]})
+
+    index = LearnerIndex(load_large_table(path), df_self)
+    anna = index.learner("anna").set_index("Module")
+    assert anna["Completed"].to_dict() == {"Modul 1": True, "Modul 2": False, "Modul 3": False}
+    assert anna.loc["Modul 2", "Accuracy"] == 40
+    assert index.modules == ["Modul 1", "Modul 2"]
+
+    summary = index.learner_summary("anna")
+    assert (summary["completed_modules"], summary["total_modules"]) == (1, 2)
+    assert not summary["all_completed"]
+    assert (summary["time_seconds"], summary["accuracy"]) == (600, 80)
+    assert index.learner_summary("ben")["all_completed"]
@@ -0,0 +1,49 @@
+# Speicherlimit der Large Table: zählt die Kopie beim Zusammenfügen mit
+import pytest
+
+from loader import load_large_table
+from synthetic import SyntheticConfig, write_dataset
+
+
+@pytest.fixture(scope="module")
+def large_path(tmp_path_factory):
+    return write_dataset(tmp_path_factory.mktemp("data"), SyntheticConfig(learners=500))["large"]
+
+
+def test_limit_includes_concat_copy(large_path):
+    df = load_large_table(large_path, chunksize=500)
+    size_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    # Blöcke passen, Blöcke + Kopie beim Zusammenfügen nicht
+    with pytest.raises(MemoryError):
+        load_large_table(large_path, chunksize=500, max_memory_mb=size_mb * 1.5)
+    assert len(load_large_table(large_path, chunksize=500, max_memory_mb=size_mb * 4)) == len(df)
+
+
+def test_single_chunk_has_no_copy(large_path):
+    df = load_large_table(large_path)
+    size_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    assert len(load_large_table(large_path, max_memory_mb=size_mb * 1.1)) == len(df)
+
+
+# Mehrere Blöcke: Kategorien sortiert wie bei einem Block, Bericht unverändert
+def test_multi_chunk_keeps_sorted_order(tmp_path):
+    from LIKE import compute_like
+    from incremental import compare_results
+    from loader import load_export
+    from synthetic import dataset
+
+    cfg = SyntheticConfig(learners=60, modules=4, classes=3)
+    paths = write_dataset(tmp_path, cfg)
+    # absteigend sortiert: die ersten Blöcke enthalten nur die letzten Module/Klassen
+    large = dataset(cfg)["large"].sort_values(["Module", "Class Description"], ascending=False)
+    large.to_csv(paths["large"], sep=";", index=False, encoding="utf-8")
+    df_mcp, df_self, df_mdlo = (load_export(paths[k]) for k in ("mcp", "self", "mdlo"))
+
+    single = load_large_table(paths["large"])
+    chunked = load_large_table(paths["large"], chunksize=4)
+    for col in ("Module", "Class Description"):
+        categories = list(chunked[col].cat.categories)
+        assert categories == sorted(categories)
+        assert categories == list(single[col].cat.categories)
+    assert compare_results(compute_like(single, df_mcp, df_self, df_mdlo),
+                           compute_like(chunked, df_mcp, df_self, df_mdlo)) == []
@@ -0,0 +1,70 @@
+# Most Difficult Learning Objectives: blockweises Einlesen mit begrenzten Heaps ergibt dieselben
+# Top-N wie Sortieren der ganzen Datei (inkl. Gleichständen und fehlender Werte); N mindestens 1
+import csv
+import random
+
+import pandas as pd
+import pytest
+
+from batch import main as batch_main
+from loader import load_export
+from mdlo import MdloTopK, _TopN, load_mdlo, top_mdlo, top_mdlo_by_module
+from schema import positive_int
+from synthetic import SyntheticConfig, write_dataset
+
+
+# MDLO-Export mit vielen Gleichständen (Werte 0..20) und etwa 5 % fehlenden Werten
+@pytest.fixture(scope="module")
+def mdlo_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("mdlo") / "mdlo.csv"
+    rng = random.Random(0)
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(["Module", "Learning Objective", "Unconsciously Incompetent", "Open in Curator"])
+        for i in range(2000):
+            value = "" if rng.random() < 0.05 else rng.randint(0, 20)
+            writer.writerow([f"Modul {rng.randint(1, 6)}", f"Lernziel {i}", value,
+                             f"https://curator.example/lo/{i}"])
+    return path
+
+
+@pytest.mark.parametrize("n", [1, 3, 5, 50])
+@pytest.mark.parametrize("chunksize", [97, 100_000])
+def test_streaming_matches_full_sort(mdlo_path, n, chunksize):
+    df_full = load_export(mdlo_path)
+    df_stream = load_mdlo(mdlo_path, n, chunksize=chunksize)
+    assert len(df_stream) < len(df_full)
+    pd.testing.assert_frame_equal(top_mdlo(df_full, n), top_mdlo(df_stream, n), check_dtype=False)
+    pd.testing.assert_frame_equal(top_mdlo_by_module(df_full, n), top_mdlo_by_module(df_stream, n),
+                                  check_dtype=False)
+
+
+@pytest.mark.parametrize("n", [0, -1])
+def test_top_n_rejects_non_positive(n):
+    with pytest.raises(ValueError):
+        _TopN(n)
+    with pytest.raises(ValueError):
+        MdloTopK(n)
+
+
+def test_load_mdlo_rejects_zero(tmp_path):
+    path = write_dataset(tmp_path, SyntheticConfig(learners=20))["mdlo"]
+    with pytest.raises(ValueError):
+        load_mdlo(path, 0)
+    assert len(load_mdlo(path, 1)) >= 1
+
+
+def test_top_n_of_one():
+    top = _TopN(1)
+    for pos, value in enumerate([3.0, float("nan"), 7.0, 7.0]):
+        top.push(value, pos)
+    assert top.positions() == [2]
+
+
+def test_batch_argument(tmp_path, capsys):
+    assert positive_int("3") == 3
+    for text in ("0", "-2", "x"):
+        with pytest.raises(SystemExit) as exc:
+            batch_main([str(tmp_path), "--mdlo-top", text])
+        assert exc.value.code == 2
+    assert "--mdlo-top" in capsys.readouterr().err
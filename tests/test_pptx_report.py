@@ -0,0 +1,46 @@
+# Platzhalter des PowerPoint-Berichts (ohne Vorlage, nur die berechneten Texte)
+import pandas as pd
+
+from LIKE import LikeResult
+from pptx_report import overall_time, placeholder_runs
+
+
+def make_result(amount_of_learners=5) -> LikeResult:
+    empty = pd.DataFrame()
+    return LikeResult(
+        amount_of_learners=amount_of_learners,
+        time_seconds=pd.DataFrame({
+            "Class Description": ["Klasse A", "Klasse B"],
+            # Klasse A: 2 Learner mit 1h und 3h, Klasse B: 3 Learner mit 2h, 2h, 5h
+            "Average Time Needed To Complete All Modules": [7200, 10800],
+            "Min. Time Needed To Complete All Modules": [3600, 7200],
+            "Max. Time Needed To Complete All Modules": [10800, 18000],
+            "Total Time Needed To Complete All Modules": [14400, 32400],
+        }),
+        avg_acc=pd.DataFrame({"Class Description": ["Klasse A"],
+                              "Average Accuracy (all modules)": [80.5]}),
+        mcp=pd.DataFrame({"Description": [
+            "Initial Unconscious Incompetence (UI)", "Initial Conscious Incompetence (CI)",
+            "Initial Unconscious Competence (UC)", "Initial Conscious Competence (CC)",
+            "Knowledge increase (Metacognition Progress)", "Reduction Unconscious Incompetence",
+        ], "Value": [10, 20, 30, 40, 5, 6]}),
+        acc_of_self_assessment=empty, self_assessment=empty, competence_by_module=empty,
+        mdlo=empty,
+    )
+
+
+# Zeit gilt für alle Klassen, nicht nur für eine
+def test_time_over_all_classes():
+    t = overall_time(make_result())
+    assert t == {"mean": 46800 / 5, "min": 3600.0, "max": 18000.0, "total": 46800.0}
+
+    runs = placeholder_runs(make_result())
+    assert "".join(r[0] for r in runs["time"]) == "2h 36m\nMin: 1h 0m\nMax: 5h 0m"
+    assert runs["total_time"][0][0] == "13h 0m"
+
+
+def test_participants_only_with_enrolled():
+    assert "participants" not in placeholder_runs(make_result())
+    runs = placeholder_runs(make_result(), enrolled=10)
+    assert "".join(r[0] for r in runs["participants"]) == \
+        "Completed: 5 (50%)\nNot Completed: 5 (50%)"
@@ -0,0 +1,74 @@
+# Auslieferung aus dem Ergebnisspeicher: Wiederverwendung nur unverändert und im Zielordner
+from result_store import ResultStore
+
+
+def stored(tmp_path):
+    out = tmp_path / "out"
+    out.mkdir()
+    (out / "run.xlsx").write_bytes(b"workbook")
+    (out / "run.pptx").write_bytes(b"slides")
+    store = ResultStore(tmp_path / "store")
+    store.store("k", [out / "run.xlsx", out / "run.pptx"], delivered=out / "run.xlsx")
+    return store, out
+
+
+def test_missing_key(tmp_path):
+    assert ResultStore(tmp_path / "store").deliver("k", tmp_path / "x.xlsx") is None
+
+
+def test_reuses_unchanged_delivery_in_target_folder(tmp_path):
+    store, out = stored(tmp_path)
+    assert store.deliver("k", out / "new.xlsx") == out / "run.xlsx"
+    assert not (out / "new.xlsx").exists()
+
+
+def test_changed_delivery_with_same_size_is_not_reused(tmp_path):
+    store, out = stored(tmp_path)
+    (out / "run.xlsx").write_bytes(b"WORKBOOK")
+    delivered = store.deliver("k", out / "run.xlsx")
+    assert delivered == out / "run_2.xlsx"
+    assert delivered.read_bytes() == b"workbook"
+    assert delivered.with_suffix(".pptx").read_bytes() == b"slides"
+    # die neue Kopie ist selbst wiederverwendbar
+    assert store.deliver("k", out / "other.xlsx") == delivered
+
+
+def test_changed_presentation_is_not_reused(tmp_path):
+    store, out = stored(tmp_path)
+    (out / "run.pptx").unlink()
+    assert store.deliver("k", out / "new.xlsx") == out / "new.xlsx"
+    assert (out / "new.pptx").read_bytes() == b"slides"
+
+
+def test_delivery_elsewhere_is_copied_into_target_folder(tmp_path):
+    store, out = stored(tmp_path)
+    other = tmp_path / "other"
+    delivered = store.deliver("k", other / "run.xlsx")
+    assert delivered == other / "run.xlsx"
+    assert delivered.read_bytes() == b"workbook"
+    assert (out / "run.xlsx").exists()
+
+
+def test_entry_without_hashes(tmp_path):
+    store, out = stored(tmp_path)
+    entry = store._entry_dir("k")
+    meta = store._read_meta(entry)
+    del meta["hashes"]
+    store._write_meta(entry, meta)
+    assert store.deliver("k", out / "new.xlsx") == out / "run.xlsx"
+
+
+# Verlaufszeilen eines gespeicherten Laufs stehen bei einem Treffer wieder zur Verfügung
+def test_info_keeps_history_rows(tmp_path):
+    from history import RunHistory
+
+    out = tmp_path / "run.xlsx"
+    out.write_bytes(b"workbook")
+    store = ResultStore(tmp_path / "store")
+    rows = [("learners", "", "", 3.0), ("avg_acc/Accuracy", "Klasse A", "", 0.5)]
+    store.store("k", [out], info={"history": {"learners": 3, "rows": rows}})
+    stored = store.info("k")["history"]
+    with RunHistory(tmp_path / "h.sqlite") as history:
+        history.record_rows("CZ", stored["rows"], "2024-03-01", learners=stored["learners"])
+        assert [r[-1] for r in history.trend("avg_acc/Accuracy")] == [0.5]
+    assert store.info("missing") is None
@@ -0,0 +1,195 @@
+# HTTP-Dienst: blockweises multipart-Parsen, Ablehnungen ohne Auftragsordner, defekter Pool
+import io
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from concurrent.futures import Future
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from service import Job, JobManager, ServiceHandler, parse_multipart
+from synthetic import SyntheticConfig, write_dataset
+
+
+def encode_multipart(files: dict, fields: dict | None = None) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in (fields or {}).items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                     f"{value}\r\n".encode("utf-8"))
+    for name, (filename, payload) in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                     f'filename="{filename}"\r\nContent-Type: text/csv\r\n\r\n'.encode("utf-8"))
+        parts.append(payload + b"\r\n")
+    parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+def test_parse_multipart_streams_parts(tmp_path, chunk_size):
+    # Inhalt mit Zeilenumbrüchen und einem Teil der Grenze
+    payload = b"a;b\r\n1;2\r\n--not-the-boundary\r\n" * 50
+    body, content_type = encode_multipart(
+        {"large": ("x.csv", payload), "": ("leer.csv", b"")}, {"engine": "arrow", "numeric": "1"})
+    fields, files = parse_multipart(content_type, io.BytesIO(body), len(body), tmp_path, chunk_size)
+    assert fields == {"engine": "arrow", "numeric": "1"}
+    assert [(name, filename) for name, filename, _ in files] == [("large", "x.csv"), ("", "leer.csv")]
+    assert files[0][2].read_bytes() == payload
+    assert files[1][2].read_bytes() == b""
+
+
+def test_parse_multipart_rejects_truncated_body(tmp_path):
+    body, content_type = encode_multipart({"large": ("x.csv", b"a;b\r\n" * 100)})
+    with pytest.raises(ValueError):
+        parse_multipart(content_type, io.BytesIO(body[:-20]), len(body) - 20, tmp_path, 64)
+    with pytest.raises(ValueError):
+        parse_multipart("text/plain", io.BytesIO(body), len(body), tmp_path)
+
+
+@pytest.fixture(scope="module")
+def dataset(tmp_path_factory):
+    paths = write_dataset(tmp_path_factory.mktemp("data"), SyntheticConfig(learners=100))
+    return {key: (path.name, path.read_bytes()) for key, path in paths.items()}
+
+
+@pytest.fixture
+def service(tmp_path):
+    manager = JobManager(tmp_path / "jobs", workers=1, max_queued=4)
+    handler = type("Handler", (ServiceHandler,), {"manager": manager})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", manager
+    server.shutdown()
+    server.server_close()
+    manager.close()
+
+
+def post(base: str, files: dict, fields: dict | None = None) -> tuple[int, dict]:
+    body, content_type = encode_multipart(files, fields)
+    req = urllib.request.Request(f"{base}/jobs", body, {"Content-Type": content_type}, method="POST")
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def wait(base: str, job_id: str) -> dict:
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        with urllib.request.urlopen(f"{base}/jobs/{job_id}", timeout=30) as resp:
+            status = json.loads(resp.read())
+        if status["status"] in ("done", "failed"):
+            return status
+        time.sleep(0.1)
+    raise AssertionError("Auftrag nicht rechtzeitig fertig")
+
+
+def job_dirs(manager) -> list[Path]:
+    return list(manager.work_dir.iterdir())
+
+
+def test_job_runs(service, dataset):
+    base, manager = service
+    status, data = post(base, {"": dataset["large"], "mcp": dataset["mcp"], "x": dataset["self"]})
+    assert status == 202, data
+    assert wait(base, data["id"])["status"] == "done"
+    with urllib.request.urlopen(f"{base}/jobs/{data['id']}/result?format=json", timeout=30) as resp:
+        assert "amount_of_learners" in json.loads(resp.read())
+
+
+@pytest.mark.parametrize("extra, message", [
+    ({"mdlo": ("leer.csv", b"")}, "leer"),
+    ({"": ("fremd.csv", b"a;b;c\r\n1;2;3\r\n")}, "nicht erkannt"),
+    ({"": ("leer.csv", b"")}, "leer"),
+    ({"": ("binär.csv", b"\xff\xfe\x00\x01")}, "keine lesbare CSV"),
+])
+def test_bad_files_are_rejected(service, dataset, extra, message):
+    base, manager = service
+    files = {key: dataset[key] for key in ("large", "mcp", "self")}
+    status, data = post(base, {**files, **extra})
+    assert status == 400
+    assert message in data["error"]
+    assert job_dirs(manager) == []
+
+
+def test_bad_options_are_rejected(service, dataset):
+    base, manager = service
+    files = {key: dataset[key] for key in ("large", "mcp", "self")}
+    for fields in ({"mdlo_top": "0"}, {"mdlo_top": "x"}, {"engine": "spark"}, {"cohort": "some"}):
+        assert post(base, files, fields)[0] == 400
+    assert job_dirs(manager) == []
+
+
+def test_full_queue_rejects_before_reading_body(service):
+    base, manager = service
+    manager.max_queued = 0
+    host, port = base.removeprefix("http://").split(":")
+    with socket.create_connection((host, int(port)), timeout=10) as sock:
+        # nur die Kopfzeilen, der angekündigte Body wird nie gesendet
+        sock.sendall(b"POST /jobs HTTP/1.1\r\nHost: x\r\n"
+                     b"Content-Type: multipart/form-data; boundary=b\r\n"
+                     b"Content-Length: 100000000\r\n\r\n")
+        response = sock.makefile("rb").readline()
+    assert b" 503 " in response
+    assert job_dirs(manager) == []
+
+
+# gleichzeitige Uploads belegen ihren Platz schon vor dem Einlesen
+def test_uploads_reserve_queue_slots(tmp_path):
+    manager = JobManager(tmp_path / "jobs", workers=1, max_queued=2)
+    try:
+        assert manager.reserve() and manager.reserve()
+        assert not manager.reserve()
+        manager.release()
+        assert manager.reserve()
+        assert manager.health()["uploading"] == 2
+    finally:
+        manager.close()
+
+
+class DonePool:
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(Path("out.xlsx"))
+        return future
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+# schon fertige Futures rufen _finished sofort im selben Thread auf
+def test_finished_future_does_not_deadlock(tmp_path):
+    manager = JobManager(tmp_path / "jobs", workers=1)
+    manager._pool.shutdown()
+    manager._pool = DonePool()
+    jobs = [Job(id=str(i), dir=tmp_path, paths={}) for i in range(3)]
+    thread = threading.Thread(target=lambda: [manager.submit(job) for job in jobs], daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert [job.status for job in jobs] == ["done"] * 3
+    assert manager.health()["running"] == 0
+
+
+def test_broken_pool_is_replaced(service, dataset):
+    base, manager = service
+    files = {key: dataset[key] for key in ("large", "mcp", "self")}
+    status, data = post(base, files)
+    assert status == 202
+    for process in list(manager._pool._processes.values()):
+        process.kill()
+    failed = wait(base, data["id"])
+    assert failed["status"] == "failed"
+    assert "abgebrochen" in failed["error"]
+
+    status, data = post(base, files)
+    assert status == 202
+    assert wait(base, data["id"])["status"] == "done"
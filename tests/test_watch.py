@@ -0,0 +1,136 @@
+# Überwachungsmodus: Entprellung, Statusdatei, begrenzte Warteschlange, abgebrochene Prozesse
+import json
+import os
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import watch
+from synthetic import FILE_NAMES, SyntheticConfig, write_dataset
+from watch import MARKER_FILE, MAX_ATTEMPTS, FolderWatcher
+
+
+# Ersatz für ProcessPoolExecutor: Aufträge laufen nicht, der Test setzt die Ergebnisse
+class FakePool:
+    instances = []
+
+    def __init__(self, max_workers=None):
+        self.futures = []
+        self.closed = False
+        FakePool.instances.append(self)
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append((future, args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_pool(monkeypatch):
+    FakePool.instances = []
+    monkeypatch.setattr(watch, "ProcessPoolExecutor", FakePool)
+    return FakePool
+
+
+# Setzt die Änderungszeit aller CSV-Dateien eines Ordners in die Vergangenheit
+def age(folder, seconds=60):
+    past = time.time() - seconds
+    for path in folder.glob("*.csv"):
+        os.utime(path, (past, past))
+
+
+def dataset(folder, learners=30):
+    write_dataset(folder, SyntheticConfig(learners=learners))
+    return folder
+
+
+def finish(future, folder):
+    future.set_result({"total_s": 0.1, "output_file": str(folder / "out.xlsx"), "warnings": []})
+
+
+def test_settle_and_debounce(tmp_path, fake_pool):
+    folder = dataset(tmp_path / "CZ")
+    watcher = FolderWatcher(tmp_path, workers=1, settle_s=30)
+    # frisch geschrieben: noch nicht alt genug
+    assert watcher.poll() == []
+    # alt genug, aber seit dem letzten Durchlauf verändert
+    age(folder)
+    assert watcher.poll() == []
+    # eine Datei wird noch geschrieben: der ganze Ordner wartet
+    with open(folder / FILE_NAMES["mdlo"], "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert watcher.poll() == []
+    age(folder)
+    assert watcher.poll() == []
+    assert watcher.poll() == [folder]
+
+
+def test_incomplete_set_is_not_submitted(tmp_path, fake_pool):
+    folder = dataset(tmp_path / "DE")
+    (folder / FILE_NAMES["mcp"]).unlink()
+    watcher = FolderWatcher(tmp_path, workers=1, settle_s=0, once=True)
+    assert watcher.poll() == []
+    assert not (folder / MARKER_FILE).exists()
+
+
+def test_marker_persists_across_restart(tmp_path, fake_pool):
+    folder = dataset(tmp_path / "CZ")
+    watcher = FolderWatcher(tmp_path, workers=1, settle_s=0, once=True)
+    assert watcher.poll() == [folder]
+    finish(fake_pool.instances[-1].futures[0][0], folder)
+    assert watcher.poll() == []
+    marker = json.loads((folder / MARKER_FILE).read_text(encoding="utf-8"))
+    assert marker["status"] == "ok"
+
+    restarted = FolderWatcher(tmp_path, workers=1, settle_s=0, once=True)
+    assert restarted.poll() == []
+    # geänderte Dateien werden neu ausgewertet
+    dataset(folder, learners=40)
+    assert restarted.poll() == [folder]
+
+
+def test_max_pending_bound(tmp_path, fake_pool):
+    folders = [dataset(tmp_path / name) for name in ("AT", "CZ", "DE")]
+    watcher = FolderWatcher(tmp_path, workers=1, max_pending=2, settle_s=0, once=True)
+    assert watcher.poll() == folders[:2]
+    assert watcher.poll() == []
+    assert len(watcher._running) == 2
+    finish(fake_pool.instances[-1].futures[0][0], folders[0])
+    assert watcher.poll() == folders[2:]
+    assert len(watcher._running) == 2
+
+
+def test_broken_pool_is_rebuilt_and_folder_retried(tmp_path, fake_pool):
+    folder = dataset(tmp_path / "CZ")
+    watcher = FolderWatcher(tmp_path, workers=1, settle_s=0, once=True)
+    assert watcher.poll() == [folder]
+    for attempt in range(1, MAX_ATTEMPTS):
+        pool = fake_pool.instances[-1]
+        pool.futures[-1][0].set_exception(BrokenProcessPool("worker died"))
+        # neuer Pool, Ordner bleibt offen und wird erneut eingereiht
+        assert watcher.poll() == [folder]
+        assert pool.closed
+        assert len(fake_pool.instances) == attempt + 1
+        assert not (folder / MARKER_FILE).exists()
+
+    fake_pool.instances[-1].futures[-1][0].set_exception(BrokenProcessPool("worker died"))
+    assert watcher.poll() == []
+    marker = json.loads((folder / MARKER_FILE).read_text(encoding="utf-8"))
+    assert marker["status"] == "fehlgeschlagen"
+
+
+def test_end_to_end(tmp_path):
+    folder = dataset(tmp_path / "CZ", learners=100)
+    watcher = FolderWatcher(tmp_path, workers=1, settle_s=0, once=True, history=None)
+    try:
+        watcher.run()
+    finally:
+        watcher.close()
+    marker = json.loads((folder / MARKER_FILE).read_text(encoding="utf-8"))
+    assert marker["status"] == "ok", marker.get("error")
+    assert list(folder.glob("*.xlsx"))
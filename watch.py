@@ -0,0 +1,272 @@
+# Überwachungsmodus ohne GUI: beobachtet einen Ordnerbaum, erkennt vollständige Sätze von
+# Exporten je Ordner (Header-Erkennung wie in der GUI) und wertet sie automatisch aus.
+# Das Ergebnis landet neben den Eingabedateien im selben Ordner.
+#
+#   python watch.py "\\server\LMS-Exporte" -w 2 --settle 30
+#   python watch.py Countries --once        # einmal alles Fertige auswerten, dann beenden
+#
+# - Entprellung: eine CSV gilt erst als fertig, wenn sie seit --settle Sekunden unverändert ist
+#   (Größe und Änderungszeit); solange eine Datei eines Ordners noch geschrieben wird,
+#   wartet der ganze Ordner.
+# - Begrenzt: höchstens --workers Prozesse und --max-pending eingereihte Aufträge. Weitere
+#   fertige Ordner werden nicht gepuffert, sondern beim nächsten Durchlauf erneut erkannt.
+# - Bereits ausgewertete Sätze stehen in .like_watch.json im Ordner und werden nach einem
+#   Neustart nicht erneut verarbeitet; ändern sich die Dateien, wird neu ausgewertet.
+# - Bricht ein Worker-Prozess ab (BrokenProcessPool), wird der Pool neu aufgebaut und der
+#   Ordner im nächsten Durchlauf erneut versucht (höchstens MAX_ATTEMPTS Mal).
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+
+from batch import MANDATORY_KEYS, classify_folder, read_enrolled, run_country
+from history import default_history_path
+from schema import validate_inputs
+
+MARKER_FILE = ".like_watch.json"
+
+DEFAULT_SETTLE_S = 10.0
+DEFAULT_INTERVAL_S = 5.0
+# Versuche je Satz, wenn der Worker-Prozess abbricht (z.B. Speichermangel)
+MAX_ATTEMPTS = 3
+
+
+def log(message: str):
+    print(f"{datetime.now():%Y-%m-%d %H:%M:%S}  {message}", flush=True)
+
+
+class FolderWatcher:
+    def __init__(self, root, workers: int = 2, max_pending: int | None = None,
+                 settle_s: float = DEFAULT_SETTLE_S, interval_s: float = DEFAULT_INTERVAL_S,
+                 numeric: bool = False, engine: str = "pandas", once: bool = False,
+                 history: str | None = None):
+        self.root = Path(root)
+        self.workers = workers
+        self.max_pending = max_pending or 2 * workers
+        self.settle_s = settle_s
+        self.interval_s = interval_s
+        self.numeric = numeric
+        self.engine = engine
+        # Verlaufsdatenbank (history.py); None = Kennzahlen nicht speichern
+        self.history = history
+        # once: Dateien zählen als fertig, sobald sie alt genug sind (kein zweiter Durchlauf)
+        self.once = once
+
+        # Pfad -> (Größe, mtime_ns) beim letzten Durchlauf
+        self._files: dict[str, tuple[int, int]] = {}
+        # Ordner -> Signatur des zuletzt ausgewerteten (oder gescheiterten) Satzes
+        self._done: dict[Path, list] = {}
+        # unvollständige Sätze nur einmal melden
+        self._incomplete: dict[Path, list] = {}
+        # laufende Aufträge: Future -> (Ordner, Signatur)
+        self._running = {}
+        # Ordner -> (Signatur, Anzahl abgebrochener Versuche)
+        self._attempts: dict[Path, tuple[list, int]] = {}
+        self._pool = None
+
+    # ----- Erkennung -----
+    # Aktueller Stand aller CSV-Dateien im Baum
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        current = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.lower().endswith(".csv"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                current[path] = (st.st_size, st.st_mtime_ns)
+        return current
+
+    # Ordner, deren CSV-Dateien alle fertig geschrieben sind: Ordner -> Signatur
+    def _stable_folders(self) -> dict[Path, list]:
+        now = time.time()
+        current = self._snapshot()
+        previous, self._files = self._files, current
+
+        folders: dict[Path, list] = {}
+        unstable = set()
+        for path, (size, mtime_ns) in current.items():
+            folder = Path(path).parent
+            old_enough = now - mtime_ns / 1e9 >= self.settle_s
+            unchanged = self.once or previous.get(path) == (size, mtime_ns)
+            if old_enough and unchanged:
+                folders.setdefault(folder, []).append([Path(path).name, size, mtime_ns])
+            else:
+                unstable.add(folder)
+        return {f: sorted(sig) for f, sig in folders.items() if f not in unstable}
+
+    # Zuletzt verarbeitete Signatur eines Ordners (auch aus einem früheren Lauf)
+    def _last_signature(self, folder: Path) -> list | None:
+        if folder not in self._done:
+            try:
+                with open(folder / MARKER_FILE, encoding="utf-8") as f:
+                    self._done[folder] = json.load(f).get("signature")
+            except (OSError, ValueError):
+                self._done[folder] = None
+        return self._done[folder]
+
+    def _write_marker(self, folder: Path, signature: list, info: dict):
+        self._done[folder] = signature
+        self._attempts.pop(folder, None)
+        data = {"signature": signature, "finished": datetime.now().isoformat(timespec="seconds"),
+                **info}
+        try:
+            with open(folder / MARKER_FILE, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            log(f"{folder}: Statusdatei nicht schreibbar ({e})")
+
+    # ----- Ablauf -----
+    # Übernimmt fertige Aufträge
+    def _collect(self):
+        broken = False
+        for future in [f for f in self._running if f.done()]:
+            folder, signature = self._running.pop(future)
+            try:
+                row = future.result()
+                log(f"{folder}: fertig in {row['total_s']:.1f}s -> {Path(row['output_file']).name}")
+                for warning in row["warnings"]:
+                    log(f"{folder}: Warnung – {warning}")
+                self._write_marker(folder, signature, {"status": "ok", "output_file": row["output_file"]})
+            except BrokenProcessPool as e:
+                # Prozess abgebrochen: ohne Statusdatei bleibt der Ordner offen und wird erneut versucht
+                broken = True
+                self._broken(folder, signature, e)
+            except Exception as e:
+                log(f"{folder}: FEHLER {type(e).__name__}: {e}")
+                self._write_marker(folder, signature, {"status": "fehlgeschlagen", "error": str(e)})
+        if broken:
+            self._reset_pool()
+
+    # Abgebrochener Worker-Prozess: Versuch zählen, nach MAX_ATTEMPTS endgültig fehlgeschlagen
+    def _broken(self, folder: Path, signature: list, error: Exception):
+        previous, count = self._attempts.get(folder, (None, 0))
+        count = count + 1 if previous == signature else 1
+        if count >= MAX_ATTEMPTS:
+            log(f"{folder}: FEHLER Prozess abgebrochen ({error}), {count} Versuche – aufgegeben")
+            self._write_marker(folder, signature, {"status": "fehlgeschlagen", "error": str(error)})
+        else:
+            self._attempts[folder] = (signature, count)
+            log(f"{folder}: FEHLER Prozess abgebrochen ({error}), neuer Versuch im nächsten Durchlauf")
+
+    # Verwirft einen defekten Pool; poll() baut beim nächsten Durchlauf einen neuen auf
+    def _reset_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # Ein Durchlauf: fertige Aufträge übernehmen, neue vollständige Sätze einreihen.
+    # Gibt die neu eingereihten Ordner zurück
+    def poll(self) -> list[Path]:
+        self._collect()
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        submitted = []
+        in_flight = {folder for folder, _ in self._running.values()}
+        for folder, signature in sorted(self._stable_folders().items()):
+            if len(self._running) >= self.max_pending:
+                # Warteschlange voll: Rest wird beim nächsten Durchlauf erneut erkannt
+                break
+            if folder in in_flight or self._last_signature(folder) == signature:
+                continue
+
+            paths, problems = classify_folder(folder)
+            if any(paths[k] is None for k in MANDATORY_KEYS):
+                if self._incomplete.get(folder) != signature:
+                    self._incomplete[folder] = signature
+                    log(f"{folder}: unvollständig, warte ({'; '.join(problems)})")
+                continue
+
+            errors = [str(i) for i in validate_inputs(paths) if i.level == "error"]
+            if errors:
+                log(f"{folder}: ungültig – {'; '.join(errors)}")
+                self._write_marker(folder, signature, {"status": "ungültig", "error": "; ".join(errors)})
+                continue
+
+            # Ausgabe in den Ordner selbst (run_country schreibt nach output_dir/<Name>)
+            try:
+                future = self._pool.submit(run_country, folder.name, paths, str(folder.parent),
+                                           self.numeric, False, read_enrolled(folder), self.engine,
+                                           self.history)
+            except BrokenProcessPool as e:
+                log(f"{folder}: Prozess-Pool defekt ({e}), neuer Versuch im nächsten Durchlauf")
+                self._reset_pool()
+                break
+            self._running[future] = (folder, signature)
+            submitted.append(folder)
+            log(f"{folder}: eingereiht ({len(self._running)}/{self.max_pending})")
+        return submitted
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._running)
+
+    # Wartet auf alle laufenden Aufträge
+    def drain(self):
+        while self._running:
+            time.sleep(0.1)
+            self._collect()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    # Dauerbetrieb bis Strg+C (bzw. ein Durchlauf mit once=True)
+    def run(self):
+        log(f"Überwache {self.root} (Prozesse: {self.workers}, Warteschlange: {self.max_pending}, "
+            f"Entprellung: {self.settle_s:.0f}s)")
+        try:
+            if self.once:
+                while self.poll() or self.busy:
+                    self.drain()
+                return
+            while True:
+                self.poll()
+                time.sleep(self.interval_s)
+        except KeyboardInterrupt:
+            log("Beendet – warte auf laufende Auswertungen…")
+            self.drain()
+        finally:
+            self.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="LIKE Überwachungsmodus (ohne GUI)")
+    parser.add_argument("root", help="Zu überwachender Ordner")
+    parser.add_argument("-w", "--workers", type=int, default=2, help="Parallele Prozesse")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Höchstens so viele Aufträge gleichzeitig (Standard: 2 × Prozesse)")
+    parser.add_argument("--settle", type=float, default=DEFAULT_SETTLE_S,
+                        help="Sekunden ohne Änderung, bis eine Datei als fertig gilt")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_S,
+                        help="Sekunden zwischen zwei Durchläufen")
+    parser.add_argument("--numeric", action="store_true",
+                        help="Excel mit Zahlenformaten statt Texten schreiben")
+    parser.add_argument("--engine", choices=["pandas", "arrow"], default="pandas")
+    parser.add_argument("--history", default=None,
+                        help="Verlaufsdatenbank (Standard: neben dem Cache, siehe history.py)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="Kennzahlen nicht im Verlauf speichern")
+    parser.add_argument("--once", action="store_true",
+                        help="Einmal alle fertigen Sätze auswerten und beenden")
+    args = parser.parse_args(argv)
+
+    FolderWatcher(args.root, workers=args.workers, max_pending=args.max_pending,
+                  settle_s=args.settle, interval_s=args.interval, numeric=args.numeric,
+                  engine=args.engine, once=args.once,
+                  history=None if args.no_history else str(args.history or default_history_path())).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())